@@ -6,6 +6,7 @@ from app.models.alert_rule import AlertRule
 from app.models.audit_log import AuditLog
 from app.schemas.alert_rule import AlertRuleCreate, AlertRuleOut, AlertRuleUpdate
 from app.services.alerts import send_test_alert
+from app.services.metrics import ALERT_RULES, record_change
 
 router = APIRouter(prefix="/alert-rules", tags=["alert-rules"])
 
@@ -26,6 +27,7 @@ def create_alert_rule(
         schedule=payload.schedule or "0 */6 * * *",
     )
     db.add(rule)
+    record_change(db, org_id, ALERT_RULES, 1)
     db.add(AuditLog(action="create_alert_rule", actor_id=user.id, org_id=org_id, payload={"rule": payload.name}))
     db.commit()
     db.refresh(rule)
@@ -71,6 +73,7 @@ def delete_alert_rule(
     if not rule:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Rule not found")
     db.delete(rule)
+    record_change(db, org_id, ALERT_RULES, -1)
     db.add(AuditLog(action="delete_alert_rule", actor_id=user.id, org_id=org_id, payload={"rule": rule_id}))
     db.commit()
     return {"status": "deleted"}
@@ -1,15 +1,38 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
+from app.db.redis import get_redis
 from app.db.session import get_db
 from app.api.deps import require_role, require_org
 from app.models.connector import Connector
 from app.models.target import Target
 from app.models.audit_log import AuditLog
 from app.schemas.connector import ConnectorCreate, ConnectorOut, ConnectorUpdate
-from app.services.connectors import get_connector
+from app.services.circuit_breaker import connector_circuits
+from app.services.connectors import connector_targets, get_connector
+from app.services.metrics import CONNECTORS, record_change
+from app.services.scheduler import unschedule
 from app.utils.secrets import encrypt_secrets
 
 router = APIRouter(prefix="/connectors", tags=["connectors"])
+logger = logging.getLogger(__name__)
+
+
+def _reschedule(connector_id: str) -> None:
+    # The scheduler re-adds active connectors with a fresh slot on its next tick.
+    try:
+        unschedule(get_redis(), connector_id)
+    except RedisError:
+        logger.warning("Scheduler unavailable, connector %s keeps its current slot", connector_id)
+
+
+def _with_circuits(connector: Connector) -> Connector:
+    try:
+        connector.circuits = connector_circuits(connector.id)
+    except RedisError:
+        logger.warning("Circuit breaker state unavailable for connector %s", connector.id)
+    return connector
 
 
 @router.post("", response_model=ConnectorOut)
@@ -25,8 +48,10 @@ def create_connector(
         connector_type=payload.connector_type,
         config=payload.config or {},
         secrets=encrypt_secrets(payload.secrets),
+        interval_seconds=payload.interval_seconds,
     )
     db.add(connector)
+    record_change(db, org_id, CONNECTORS, 1)
     db.add(AuditLog(action="create_connector", actor_id=user.id, org_id=org_id, payload={"connector": payload.name}))
     db.commit()
     db.refresh(connector)
@@ -39,7 +64,7 @@ def list_connectors(
     user=Depends(require_role("SUPER_ADMIN", "ORG_ADMIN", "ANALYST", "VIEWER")),
     org_id: str = Depends(require_org),
 ):
-    return db.query(Connector).filter(Connector.org_id == org_id).all()
+    return [_with_circuits(connector) for connector in db.query(Connector).filter(Connector.org_id == org_id).all()]
 
 
 @router.put("/{connector_id}", response_model=ConnectorOut)
@@ -60,6 +85,8 @@ def update_connector(
         setattr(connector, field, value)
     db.add(AuditLog(action="update_connector", actor_id=user.id, org_id=org_id, payload={"connector": connector_id}))
     db.commit()
+    if "interval_seconds" in data or "is_active" in data:
+        _reschedule(connector_id)
     db.refresh(connector)
     return connector
 
@@ -75,8 +102,10 @@ def delete_connector(
     if not connector:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Connector not found")
     db.delete(connector)
+    record_change(db, org_id, CONNECTORS, -1)
     db.add(AuditLog(action="delete_connector", actor_id=user.id, org_id=org_id, payload={"connector": connector_id}))
     db.commit()
+    _reschedule(connector_id)
     return {"status": "deleted"}
 
 
@@ -90,7 +119,10 @@ def test_connector(
     connector = db.query(Connector).filter(Connector.id == connector_id, Connector.org_id == org_id).first()
     if not connector:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Connector not found")
-    targets = db.query(Target).filter(Target.org_id == org_id).all()
     handler = get_connector(connector.connector_type)
-    handler.fetch(targets, {**connector.config, "org_id": org_id}, connector.secrets)
+    targets = connector_targets(handler, db.query(Target).filter(Target.org_id == org_id).all())
+    try:
+        handler.test(targets, {**connector.config, "org_id": org_id}, connector.secrets)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     return {"status": "ok"}
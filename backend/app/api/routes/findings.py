@@ -1,30 +1,110 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import base64
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, exists, func, or_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.db.session import get_db
 from app.api.deps import require_role, require_org
 from app.models.finding import Finding
-from app.schemas.finding import FindingOut
+from app.models.source_record import SourceRecord
+from app.schemas.finding import FindingOut, SourceRecordOut
+from app.services.archive import query_archive
 
 router = APIRouter(prefix="/findings", tags=["findings"])
 
 
+def _encode_cursor(created_at: datetime, finding_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{finding_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, finding_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), finding_id
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _exposure_filter(db: Session, exposure_type: str):
+    exposure_types = Finding.__table__.c.exposure_types
+    if db.get_bind().dialect.name == "postgresql":
+        # JSONB containment is served by the GIN index on exposure_types.
+        return type_coerce(exposure_types, JSONB).contains([exposure_type])
+    elements = func.json_each(exposure_types).table_valued("value")
+    return exists().select_from(elements).where(elements.c.value == exposure_type)
+
+
 @router.get("", response_model=list[FindingOut])
 def list_findings(
+    response: Response,
     severity: str | None = Query(default=None),
     source: str | None = Query(default=None),
     exposure_type: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=settings.findings_page_size, ge=1),
+    fields: str | None = Query(default=None),
     db: Session = Depends(get_db),
     user=Depends(require_role("SUPER_ADMIN", "ORG_ADMIN", "ANALYST", "VIEWER")),
     org_id: str = Depends(require_org),
 ):
-    query = db.query(Finding).filter(Finding.org_id == org_id)
+    limit = min(limit, settings.findings_page_max)
+    columns = Finding.__table__.c
+    selected = None
+    if fields:
+        selected = list(dict.fromkeys(["id", *(field.strip() for field in fields.split(",") if field.strip())]))
+        unknown = [field for field in selected if field not in FindingOut.__fields__]
+        if unknown:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown fields: {', '.join(unknown)}")
+        query = db.query(*(columns[field] for field in selected), columns.created_at)
+    else:
+        query = db.query(Finding)
+    query = query.filter(columns.org_id == org_id)
     if severity:
-        query = query.filter(Finding.severity == severity)
+        query = query.filter(columns.severity == severity)
     if source:
-        query = query.filter(Finding.source == source)
+        query = query.filter(columns.source == source)
     if exposure_type:
-        query = query.filter(Finding.exposure_types.contains([exposure_type]))
-    return query.order_by(Finding.created_at.desc()).all()
+        query = query.filter(_exposure_filter(db, exposure_type))
+    if cursor:
+        created_at, finding_id = _decode_cursor(cursor)
+        query = query.filter(
+            or_(columns.created_at < created_at, and_(columns.created_at == created_at, columns.id > finding_id))
+        )
+    rows = query.order_by(columns.created_at.desc(), columns.id).limit(limit + 1).all()
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = _encode_cursor(rows[-1].created_at, rows[-1].id)
+    if selected is None:
+        response.headers.update(headers)
+        return rows
+    content = jsonable_encoder([{field: row._mapping[columns[field]] for field in selected} for row in rows])
+    return JSONResponse(content=content, headers=headers)
+
+
+@router.get("/archive", response_model=list[FindingOut])
+def list_archived_findings(
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    severity: list[str] | None = Query(default=None),
+    source: str | None = Query(default=None),
+    limit: int = Query(default=settings.findings_page_size, ge=1),
+    user=Depends(require_role("SUPER_ADMIN", "ORG_ADMIN", "ANALYST", "VIEWER")),
+    org_id: str = Depends(require_org),
+):
+    return query_archive(
+        settings.archive_path,
+        org_id,
+        since=since,
+        until=until,
+        severities=severity,
+        source=source,
+        limit=min(limit, settings.findings_page_max),
+    )
 
 
 @router.get("/{finding_id}", response_model=FindingOut)
@@ -38,3 +118,21 @@ def get_finding(
     if not finding:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Finding not found")
     return finding
+
+
+@router.get("/{finding_id}/source-record", response_model=SourceRecordOut)
+def get_finding_source_record(
+    finding_id: str,
+    db: Session = Depends(get_db),
+    user=Depends(require_role("SUPER_ADMIN", "ORG_ADMIN", "ANALYST", "VIEWER")),
+    org_id: str = Depends(require_org),
+):
+    record = (
+        db.query(SourceRecord)
+        .join(Finding, Finding.source_record_id == SourceRecord.id)
+        .filter(Finding.id == finding_id, Finding.org_id == org_id)
+        .first()
+    )
+    if not record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Source record not found")
+    return record
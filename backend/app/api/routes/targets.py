@@ -5,6 +5,7 @@ from app.api.deps import require_role, require_org
 from app.models.target import Target
 from app.models.audit_log import AuditLog
 from app.schemas.target import TargetCreate, TargetOut, TargetUpdate
+from app.services.target_hashes import remove_target_hashes, sync_target_hashes
 
 router = APIRouter(prefix="/targets", tags=["targets"])
 
@@ -18,6 +19,8 @@ def create_target(
 ):
     target = Target(org_id=org_id, target_type=payload.target_type, value=payload.value, metadata=payload.metadata or {})
     db.add(target)
+    db.flush()
+    sync_target_hashes(db, target)
     db.add(AuditLog(action="create_target", actor_id=user.id, org_id=org_id, payload={"target": payload.value}))
     db.commit()
     db.refresh(target)
@@ -44,8 +47,11 @@ def update_target(
     target = db.query(Target).filter(Target.id == target_id, Target.org_id == org_id).first()
     if not target:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Target not found")
-    for field, value in payload.dict(exclude_unset=True).items():
+    changes = payload.dict(exclude_unset=True)
+    for field, value in changes.items():
         setattr(target, field, value)
+    if changes.keys() & {"value", "target_type"}:
+        sync_target_hashes(db, target)
     db.add(AuditLog(action="update_target", actor_id=user.id, org_id=org_id, payload={"target": target_id}))
     db.commit()
     db.refresh(target)
@@ -62,6 +68,7 @@ def delete_target(
     target = db.query(Target).filter(Target.id == target_id, Target.org_id == org_id).first()
     if not target:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Target not found")
+    remove_target_hashes(db, target.id)
     db.delete(target)
     db.add(AuditLog(action="delete_target", actor_id=user.id, org_id=org_id, payload={"target": target_id}))
     db.commit()
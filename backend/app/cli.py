@@ -0,0 +1,152 @@
+import argparse
+import json
+from datetime import datetime
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.finding_key import FindingKey
+from app.models.organization import Organization
+from app.services.archive import archive_aged_findings, query_archive
+from app.services.dedupe_filter import replace_filter
+from app.services.metrics import rebuild_rollups
+from app.services.partitions import ensure_partitions
+from app.services.password_index import DIGEST_SIZES, build_index
+from app.services.retention import enforce_retention
+from app.services.target_hashes import rebuild_target_hashes
+
+
+def rebuild_dedupe_filter(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        org_ids = [args.org_id] if args.org_id else [row.id for row in db.query(Organization.id).all()]
+        for org_id in org_ids:
+            hashes = (
+                row.dedupe_hash
+                for row in db.query(FindingKey.dedupe_hash).filter(FindingKey.org_id == org_id).yield_per(10000)
+            )
+            count = replace_filter(org_id, hashes)
+            print(f"{org_id}: {count} hashes")
+    finally:
+        db.close()
+
+
+def rebuild_hashes(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        org_ids = [args.org_id] if args.org_id else [row.id for row in db.query(Organization.id).all()]
+        for org_id in org_ids:
+            count = rebuild_target_hashes(db, org_id)
+            print(f"{org_id}: {count} digests")
+    finally:
+        db.close()
+
+
+def rebuild_metrics(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        org_ids = [args.org_id] if args.org_id else [row.id for row in db.query(Organization.id).all()]
+        for org_id in org_ids:
+            count = rebuild_rollups(db, org_id)
+            print(f"{org_id}: {count} rollup rows")
+    finally:
+        db.close()
+
+
+def maintain_partitions(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        for name in ensure_partitions(db, args.months_ahead):
+            print(f"created {name}")
+        if args.skip_retention:
+            return
+        for org_id, count in archive_aged_findings(db)["archived"].items():
+            print(f"{org_id}: {count} findings archived")
+        result = enforce_retention(db)
+        for name in result["dropped_partitions"]:
+            print(f"dropped {name}")
+        for org_id, count in result["purged"].items():
+            print(f"{org_id}: {count} findings purged")
+        for org_id, count in result["pruned_keys"].items():
+            print(f"{org_id}: {count} finding keys pruned")
+    finally:
+        db.close()
+
+
+def archive_findings(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        result = archive_aged_findings(db, [args.org_id] if args.org_id else None)
+        for org_id, count in result["archived"].items():
+            print(f"{org_id}: {count} findings archived")
+        for name in result["dropped_partitions"]:
+            print(f"dropped {name}")
+    finally:
+        db.close()
+
+
+def query_findings_archive(args: argparse.Namespace) -> None:
+    rows = query_archive(
+        args.path or settings.archive_path,
+        args.org_id,
+        since=args.since,
+        until=args.until,
+        severities=args.severity,
+        source=args.source,
+        limit=args.limit,
+    )
+    for row in rows:
+        print(json.dumps(row, default=str))
+
+
+def build_password_index(args: argparse.Namespace) -> None:
+    with open(args.source, encoding="ascii", errors="ignore") as source:
+        count = build_index(source, args.output or settings.pwned_passwords_index_path, args.hash_type)
+    print(f"{count} hashes indexed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-dedupe-filter", help="Rebuild per-org dedupe filters from finding keys")
+    rebuild.add_argument("--org-id", help="Only rebuild this org")
+    rebuild.set_defaults(handler=rebuild_dedupe_filter)
+
+    hashes = commands.add_parser("rebuild-target-hashes", help="Rebuild per-org hashed-identifier lookup tables")
+    hashes.add_argument("--org-id", help="Only rebuild this org")
+    hashes.set_defaults(handler=rebuild_hashes)
+
+    metrics = commands.add_parser("rebuild-metrics", help="Recompute metric rollups from findings, connectors and alert rules")
+    metrics.add_argument("--org-id", help="Only rebuild this org")
+    metrics.set_defaults(handler=rebuild_metrics)
+
+    partitions = commands.add_parser("maintain-partitions", help="Create upcoming findings partitions, archive aged findings and enforce retention")
+    partitions.add_argument("--months-ahead", type=int, default=settings.findings_partition_months_ahead)
+    partitions.add_argument("--skip-retention", action="store_true", help="Only create partitions, skip archiving and retention")
+    partitions.set_defaults(handler=maintain_partitions)
+
+    archive = commands.add_parser("archive-findings", help="Export findings older than ARCHIVE_AFTER_DAYS to Parquet and delete them")
+    archive.add_argument("--org-id", help="Only archive this org")
+    archive.set_defaults(handler=archive_findings)
+
+    query = commands.add_parser("query-archive", help="Query archived findings as JSON lines")
+    query.add_argument("--org-id", required=True)
+    query.add_argument("--since", type=datetime.fromisoformat, help="Inclusive ISO timestamp")
+    query.add_argument("--until", type=datetime.fromisoformat, help="Exclusive ISO timestamp")
+    query.add_argument("--severity", action="append", help="Repeat to match several severities")
+    query.add_argument("--source")
+    query.add_argument("--limit", type=int, default=1000)
+    query.add_argument("--path", help="Archive root (defaults to ARCHIVE_PATH)")
+    query.set_defaults(handler=query_findings_archive)
+
+    index = commands.add_parser("build-password-index", help="Build the offline Pwned Passwords index from a HASH:COUNT dump")
+    index.add_argument("source", help="Path to the downloaded hash list")
+    index.add_argument("--output", help="Index path (defaults to PWNED_PASSWORDS_INDEX_PATH)")
+    index.add_argument("--hash-type", choices=sorted(DIGEST_SIZES), default="sha1")
+    index.set_defaults(handler=build_password_index)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
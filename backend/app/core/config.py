@@ -20,6 +20,38 @@ class Settings(BaseSettings):
     twilio_from_number: str | None = Field(default=None, env="TWILIO_FROM_NUMBER")
     allowed_origins: List[str] = Field(default=["http://localhost:5173"], env="ALLOWED_ORIGINS")
     rate_limit_per_minute: int = 120
+    findings_page_size: int = Field(default=100, env="FINDINGS_PAGE_SIZE")
+    findings_page_max: int = Field(default=1000, env="FINDINGS_PAGE_MAX")
+    http_pool_size: int = Field(default=32, env="HTTP_POOL_SIZE")
+    http_spool_max_bytes: int = Field(default=8 * 1024 * 1024, env="HTTP_SPOOL_MAX_BYTES")
+    matcher_cache_max_chars: int = Field(default=1_000_000, env="MATCHER_CACHE_MAX_CHARS")
+    ingest_batch_size: int = Field(default=500, env="INGEST_BATCH_SIZE")
+    upstream_cache_ttl_seconds: int = Field(default=60 * 60 * 5, env="UPSTREAM_CACHE_TTL_SECONDS")
+    upstream_cache_scope: str = Field(default="credential", env="UPSTREAM_CACHE_SCOPE")
+    dedupe_filter_enabled: bool = Field(default=True, env="DEDUPE_FILTER_ENABLED")
+    dedupe_filter_capacity: int = Field(default=1_000_000, env="DEDUPE_FILTER_CAPACITY")
+    dedupe_filter_error_rate: float = Field(default=0.001, env="DEDUPE_FILTER_ERROR_RATE")
+    hibp_catalog_url: str = Field(default="https://haveibeenpwned.com/api/v3/breaches", env="HIBP_CATALOG_URL")
+    pwned_passwords_index_path: str = Field(default="data/pwned-passwords.idx", env="PWNED_PASSWORDS_INDEX_PATH")
+    file_dump_root: str = Field(default="data/dumps", env="FILE_DUMP_ROOT")
+    connector_default_interval_seconds: int = Field(default=60 * 60 * 6, env="CONNECTOR_DEFAULT_INTERVAL_SECONDS")
+    scheduler_tick_seconds: int = Field(default=60, env="SCHEDULER_TICK_SECONDS")
+    scheduler_jitter_ratio: float = Field(default=0.1, env="SCHEDULER_JITTER_RATIO")
+    circuit_breaker_enabled: bool = Field(default=True, env="CIRCUIT_BREAKER_ENABLED")
+    circuit_window_seconds: int = Field(default=60, env="CIRCUIT_WINDOW_SECONDS")
+    circuit_min_requests: int = Field(default=10, env="CIRCUIT_MIN_REQUESTS")
+    circuit_failure_ratio: float = Field(default=0.5, env="CIRCUIT_FAILURE_RATIO")
+    circuit_cooldown_seconds: int = Field(default=60, env="CIRCUIT_COOLDOWN_SECONDS")
+    circuit_max_cooldown_seconds: int = Field(default=60 * 60 * 6, env="CIRCUIT_MAX_COOLDOWN_SECONDS")
+    circuit_probe_timeout_seconds: int = Field(default=30, env="CIRCUIT_PROBE_TIMEOUT_SECONDS")
+    connector_lock_timeout_seconds: int = Field(default=60 * 60 * 6, env="CONNECTOR_LOCK_TIMEOUT_SECONDS")
+    findings_retention_days: int = Field(default=0, env="FINDINGS_RETENTION_DAYS")
+    findings_partition_months_ahead: int = Field(default=3, env="FINDINGS_PARTITION_MONTHS_AHEAD")
+    retention_batch_size: int = Field(default=5000, env="RETENTION_BATCH_SIZE")
+    finding_key_retention_days: int = Field(default=0, env="FINDING_KEY_RETENTION_DAYS")
+    archive_path: str = Field(default="reports/archive", env="ARCHIVE_PATH")
+    archive_after_days: int = Field(default=0, env="ARCHIVE_AFTER_DAYS")
+    archive_batch_size: int = Field(default=50000, env="ARCHIVE_BATCH_SIZE")
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,11 @@
+import redis
+from app.core.config import settings
+
+_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.redis_url)
+    return _client
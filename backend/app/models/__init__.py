@@ -1,19 +1,29 @@
 from app.models.organization import Organization
 from app.models.user import User
 from app.models.target import Target
+from app.models.target_hash import TargetHash
 from app.models.finding import Finding
+from app.models.finding_key import FindingKey
+from app.models.source_record import SourceRecord
+from app.models.breach_catalog import BreachCatalogEntry
 from app.models.alert_rule import AlertRule
 from app.models.connector import Connector
 from app.models.integration import Integration
 from app.models.audit_log import AuditLog
+from app.models.metric_rollup import MetricRollup
 
 __all__ = [
     "Organization",
     "User",
     "Target",
+    "TargetHash",
     "Finding",
+    "FindingKey",
+    "SourceRecord",
+    "BreachCatalogEntry",
     "AlertRule",
     "Connector",
     "Integration",
     "AuditLog",
+    "MetricRollup",
 ]
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, ForeignKey, Index
+from app.models.common import BaseModel
+
+
+class BreachCatalogEntry(BaseModel):
+    __tablename__ = "breach_catalog"
+    __table_args__ = (Index("uq_breach_catalog_source_name", "source", "name", unique=True),)
+    source = Column(String, nullable=False)
+    name = Column(String, nullable=False)
+    source_record_id = Column(String, ForeignKey("source_records.id"), nullable=False)
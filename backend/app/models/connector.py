@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, String, ForeignKey, JSON, Boolean, Integer
 from app.models.common import BaseModel
 
 
@@ -11,3 +11,5 @@ class Connector(BaseModel):
     secrets = Column(JSON, default=dict)
     is_active = Column(Boolean, default=True)
     last_run_status = Column(String, default="never")
+    state = Column(JSON, default=dict)
+    interval_seconds = Column(Integer, nullable=True)
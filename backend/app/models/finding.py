@@ -1,15 +1,28 @@
-from sqlalchemy import Column, String, ForeignKey, JSON, Integer
+from sqlalchemy import Column, String, ForeignKey, JSON, Integer, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from app.models.common import BaseModel
 
 
 class Finding(BaseModel):
     __tablename__ = "findings"
+    __table_args__ = (
+        Index("ix_findings_org_id_created_at_id", "org_id", text("created_at DESC"), "id"),
+        Index("ix_findings_org_id_severity_created_at", "org_id", "severity", text("created_at DESC")),
+        Index("ix_findings_org_id_source_created_at", "org_id", "source", text("created_at DESC")),
+        Index(
+            "ix_findings_exposure_types",
+            "exposure_types",
+            postgresql_using="gin",
+            postgresql_ops={"exposure_types": "jsonb_path_ops"},
+        ),
+    )
     org_id = Column(String, ForeignKey("organizations.id"), index=True, nullable=False)
     source = Column(String, nullable=False)
     confidence = Column(Integer, default=50)
     matched_entity = Column(String, nullable=False)
-    exposure_types = Column(JSON, default=list)
+    exposure_types = Column(JSON().with_variant(JSONB(), "postgresql"), default=list)
     raw_snippet = Column(String, nullable=False)
     severity = Column(String, default="low")
     dedupe_hash = Column(String, index=True, nullable=False)
     metadata = Column(JSON, default=dict)
+    source_record_id = Column(String, ForeignKey("source_records.id"), index=True, nullable=True)
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, ForeignKey, Index
+from app.models.common import BaseModel
+
+
+class FindingKey(BaseModel):
+    __tablename__ = "finding_keys"
+    __table_args__ = (Index("uq_finding_keys_org_id_dedupe_hash", "org_id", "dedupe_hash", unique=True),)
+    org_id = Column(String, ForeignKey("organizations.id"), nullable=False)
+    dedupe_hash = Column(String, nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Date, String, ForeignKey, Integer, Index
+from app.models.common import BaseModel
+
+
+class MetricRollup(BaseModel):
+    __tablename__ = "metric_rollups"
+    __table_args__ = (
+        Index("uq_metric_rollups_key", "org_id", "metric", "day", "severity", "source", unique=True),
+    )
+    org_id = Column(String, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    metric = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+    severity = Column(String, nullable=False, default="")
+    source = Column(String, nullable=False, default="")
+    count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, Integer
 from app.models.common import BaseModel
 
 
@@ -6,3 +6,4 @@ class Organization(BaseModel):
     __tablename__ = "organizations"
     name = Column(String, unique=True, nullable=False)
     is_active = Column(Boolean, default=True)
+    retention_days = Column(Integer, nullable=True)
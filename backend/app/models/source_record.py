@@ -0,0 +1,8 @@
+from sqlalchemy import Column, String, JSON
+from app.models.common import BaseModel
+
+
+class SourceRecord(BaseModel):
+    __tablename__ = "source_records"
+    source = Column(String, nullable=False)
+    payload = Column(JSON, default=dict)
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, ForeignKey, Index
+from app.models.common import BaseModel
+
+
+class TargetHash(BaseModel):
+    __tablename__ = "target_hashes"
+    __table_args__ = (Index("ix_target_hashes_org_id_digest", "org_id", "digest"),)
+    org_id = Column(String, ForeignKey("organizations.id"), nullable=False)
+    target_id = Column(String, ForeignKey("targets.id", ondelete="CASCADE"), index=True, nullable=False)
+    digest = Column(String, nullable=False)
+    algorithm = Column(String, nullable=False)
+    normalization = Column(String, nullable=False)
@@ -1,7 +1,14 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, conint, validator
 from app.schemas.common import BaseSchema
+from app.services.dump_scanner import resolve_dump_path
 
-VALID_CONNECTOR_TYPES = {"demo", "hibp", "dehashed", "generic_rest", "rss", "public_paste"}
+VALID_CONNECTOR_TYPES = {"demo", "hibp", "dehashed", "generic_rest", "rss", "public_paste", "pwned_passwords", "file_dump"}
+
+
+def _validate_dump_path(config: dict | None) -> dict | None:
+    if config and config.get("path") is not None:
+        resolve_dump_path(str(config["path"]))
+    return config
 
 
 class ConnectorCreate(BaseModel):
@@ -9,6 +16,7 @@ class ConnectorCreate(BaseModel):
     connector_type: str
     config: dict | None = None
     secrets: dict | None = None
+    interval_seconds: conint(ge=60) | None = None
 
     @validator("connector_type")
     def validate_connector_type(cls, v):
@@ -16,12 +24,29 @@ class ConnectorCreate(BaseModel):
             raise ValueError(f"Invalid connector type. Must be one of: {', '.join(sorted(VALID_CONNECTOR_TYPES))}")
         return v
 
+    @validator("config")
+    def validate_config(cls, v, values):
+        return _validate_dump_path(v) if values.get("connector_type") == "file_dump" else v
+
 
 class ConnectorUpdate(BaseModel):
     name: str | None = None
     config: dict | None = None
     secrets: dict | None = None
     is_active: bool | None = None
+    interval_seconds: conint(ge=60) | None = None
+
+    @validator("config")
+    def validate_config(cls, v):
+        # Only file_dump reads config.path, so any path sent here has to stay inside the dump root.
+        return _validate_dump_path(v)
+
+
+class CircuitOut(BaseModel):
+    name: str
+    state: str
+    open_until: float | None = None
+    cooldown: float | None = None
 
 
 class ConnectorOut(BaseSchema):
@@ -30,4 +55,6 @@ class ConnectorOut(BaseSchema):
     config: dict
     is_active: bool
     last_run_status: str
+    interval_seconds: int | None = None
+    circuits: list[CircuitOut] = []
     org_id: str
@@ -12,6 +12,16 @@ class FindingOut(BaseSchema):
     severity: str
     dedupe_hash: str
     metadata: dict | None = None
+    source_record_id: str | None = None
+
+
+class SourceRecordOut(BaseModel):
+    id: str
+    source: str
+    payload: dict | list
+
+    class Config:
+        orm_mode = True
 
 
 class FindingFilter(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, conint
 from app.schemas.common import BaseSchema
 
 
@@ -9,8 +9,10 @@ class OrganizationCreate(BaseModel):
 class OrganizationUpdate(BaseModel):
     name: str | None = None
     is_active: bool | None = None
+    retention_days: conint(ge=0) | None = None
 
 
 class OrganizationOut(BaseSchema):
     name: str
     is_active: bool
+    retention_days: int | None = None
@@ -0,0 +1,160 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.finding import Finding
+from app.models.organization import Organization
+from app.services.metrics import record_findings
+from app.services.partitions import drop_empty_partitions
+
+TIMESTAMP = pa.timestamp("us", tz="UTC")
+ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("created_at", TIMESTAMP),
+        ("updated_at", TIMESTAMP),
+        ("source", pa.string()),
+        ("confidence", pa.int32()),
+        ("matched_entity", pa.string()),
+        ("exposure_types", pa.list_(pa.string())),
+        ("raw_snippet", pa.string()),
+        ("severity", pa.string()),
+        ("dedupe_hash", pa.string()),
+        ("metadata", pa.string()),
+        ("source_record_id", pa.string()),
+    ]
+)
+PARTITION_SCHEMA = pa.schema([("month", pa.string())])
+PARTITIONING = ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+DATASET_SCHEMA = pa.unify_schemas([ARCHIVE_SCHEMA, PARTITION_SCHEMA])
+ROW_GROUP_SIZE = 64 * 1024
+ARCHIVE_ORDER = [("created_at", "descending"), ("id", "ascending")]
+
+
+def _utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def _archive_row(finding: Finding) -> dict[str, Any]:
+    return {
+        "id": finding.id,
+        "created_at": _utc(finding.created_at),
+        "updated_at": _utc(finding.updated_at),
+        "source": finding.source,
+        "confidence": finding.confidence,
+        "matched_entity": finding.matched_entity,
+        "exposure_types": list(finding.exposure_types or []),
+        "raw_snippet": finding.raw_snippet,
+        "severity": finding.severity,
+        "dedupe_hash": finding.dedupe_hash,
+        "metadata": json.dumps(finding.metadata or {}, sort_keys=True),
+        "source_record_id": finding.source_record_id,
+    }
+
+
+def write_archive_file(root: str, org_id: str, month: str, rows: list[dict[str, Any]]) -> Path:
+    directory = Path(root) / f"org_id={org_id}" / f"month={month}"
+    directory.mkdir(parents=True, exist_ok=True)
+    # Sorting by severity then time keeps row-group min/max statistics tight for the filters queries push down.
+    rows = sorted(rows, key=lambda row: (row["severity"] or "", row["created_at"], row["id"]))
+    first = min(rows, key=lambda row: (row["created_at"], row["id"]))
+    # Named after the oldest row so a batch re-exported after a failed delete overwrites its earlier file.
+    path = directory / f"part-{first['created_at']:%Y%m%dT%H%M%S%f}-{first['id']}.parquet"
+    # Dot-prefixed files are skipped by dataset discovery, so a crashed write is never read back.
+    partial = directory / f".{path.name}.tmp"
+    pq.write_table(
+        pa.Table.from_pylist(rows, schema=ARCHIVE_SCHEMA),
+        partial,
+        compression="zstd",
+        row_group_size=ROW_GROUP_SIZE,
+    )
+    os.replace(partial, path)
+    return path
+
+
+def archive_findings(db: Session, root: str, org_id: str, before: datetime, batch_size: int) -> int:
+    archived = 0
+    while True:
+        findings = (
+            db.query(Finding)
+            .filter(Finding.org_id == org_id, Finding.created_at < before)
+            .order_by(Finding.created_at, Finding.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not findings:
+            return archived
+        by_month: dict[str, list[dict[str, Any]]] = {}
+        for finding in findings:
+            row = _archive_row(finding)
+            by_month.setdefault(f"{row['created_at']:%Y-%m}", []).append(row)
+        for month, rows in by_month.items():
+            write_archive_file(root, org_id, month, rows)
+        # finding_keys rows stay behind so archived findings are not ingested again as new.
+        db.query(Finding).filter(Finding.id.in_([finding.id for finding in findings]), Finding.created_at < before).delete(
+            synchronize_session=False
+        )
+        record_findings(db, [(finding.org_id, finding.severity, finding.source, finding.created_at) for finding in findings], delta=-1)
+        db.commit()
+        db.expunge_all()
+        archived += len(findings)
+
+
+def archive_aged_findings(db: Session, org_ids: list[str] | None = None, now: datetime | None = None) -> dict:
+    if not settings.archive_after_days:
+        return {"archived": {}, "dropped_partitions": []}
+    before = (now or datetime.now(timezone.utc)) - timedelta(days=settings.archive_after_days)
+    org_ids = org_ids or [row.id for row in db.query(Organization.id).all()]
+    archived = {}
+    for org_id in org_ids:
+        count = archive_findings(db, settings.archive_path, org_id, before, settings.archive_batch_size)
+        if count:
+            archived[org_id] = count
+    return {"archived": archived, "dropped_partitions": drop_empty_partitions(db, before)}
+
+
+def query_archive(
+    root: str,
+    org_id: str,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    severities: list[str] | None = None,
+    source: str | None = None,
+    limit: int = 100,
+) -> list[dict[str, Any]]:
+    org_root = Path(root) / f"org_id={org_id}"
+    if not org_root.is_dir():
+        return []
+    # Discovery starts at the org's own directory, so other tenants' files are never listed or opened.
+    dataset = ds.dataset(org_root, format="parquet", partitioning=PARTITIONING, schema=DATASET_SCHEMA)
+    # month prunes whole directories; created_at, severity and source are checked against row-group statistics.
+    expression = ds.scalar(True)
+    if since:
+        since = _utc(since)
+        expression &= (ds.field("month") >= f"{since:%Y-%m}") & (ds.field("created_at") >= pa.scalar(since, TIMESTAMP))
+    if until:
+        until = _utc(until)
+        expression &= (ds.field("month") <= f"{until:%Y-%m}") & (ds.field("created_at") < pa.scalar(until, TIMESTAMP))
+    if severities:
+        expression &= ds.field("severity").isin(severities)
+    if source:
+        expression &= ds.field("source") == source
+    scanner = dataset.scanner(filter=expression, columns=ARCHIVE_SCHEMA.names)
+    # Only the newest `limit` rows survive each batch, so memory stays bounded however many rows match.
+    top = scanner.projected_schema.empty_table()
+    for batch in scanner.to_batches():
+        if batch.num_rows:
+            top = pa.concat_tables([top, pa.Table.from_batches([batch])]).sort_by(ARCHIVE_ORDER).slice(0, limit)
+    rows = top.to_pylist()
+    for row in rows:
+        row["metadata"] = json.loads(row["metadata"]) if row["metadata"] else {}
+        row["org_id"] = org_id
+    return rows
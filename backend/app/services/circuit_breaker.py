@@ -0,0 +1,124 @@
+import logging
+import time
+from typing import Any
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_at: float):
+        super().__init__(f"Circuit for {name} is open until {retry_at:.0f}")
+        self.name = name
+        self.retry_at = retry_at
+
+
+def _decode(raw: dict) -> dict[str, str]:
+    return {
+        (key.decode() if isinstance(key, bytes) else key): (value.decode() if isinstance(value, bytes) else value)
+        for key, value in raw.items()
+    }
+
+
+class CircuitBreaker:
+    def __init__(self, host: str, scope: str):
+        self.name = f"{host}:{scope}"
+        self.key = f"circuit:{self.name}"
+
+    def _window_key(self, now: float) -> str:
+        return f"{self.key}:window:{int(now // settings.circuit_window_seconds)}"
+
+    def before_request(self) -> None:
+        if not settings.circuit_breaker_enabled:
+            return
+        now = time.time()
+        try:
+            redis = get_redis()
+            circuit = _decode(redis.hgetall(self.key))
+            if circuit.get("state") not in (OPEN, HALF_OPEN):
+                return
+            retry_at = float(circuit.get("open_until", 0))
+            # Once the cooldown passes, exactly one caller across all workers gets to probe.
+            if now < retry_at or not redis.set(f"{self.key}:probe", 1, nx=True, ex=settings.circuit_probe_timeout_seconds):
+                raise CircuitOpenError(self.name, retry_at)
+            redis.hset(self.key, "state", HALF_OPEN)
+        except RedisError:
+            logger.warning("Circuit breaker unavailable for %s, allowing request", self.name)
+
+    def record(self, success: bool) -> None:
+        if not settings.circuit_breaker_enabled:
+            return
+        now = time.time()
+        try:
+            redis = get_redis()
+            circuit = _decode(redis.hgetall(self.key))
+            if circuit.get("state") == HALF_OPEN:
+                if success:
+                    self._close(redis)
+                else:
+                    self._open(redis, now, float(circuit.get("cooldown", settings.circuit_cooldown_seconds)) * 2)
+                return
+            pipeline = redis.pipeline(transaction=False)
+            current, previous = self._window_key(now), self._window_key(now - settings.circuit_window_seconds)
+            pipeline.hincrby(current, "total", 1)
+            if not success:
+                pipeline.hincrby(current, "failures", 1)
+            pipeline.expire(current, settings.circuit_window_seconds * 2)
+            pipeline.hgetall(current)
+            pipeline.hgetall(previous)
+            counts = pipeline.execute()
+            windows = [_decode(counts[-2]), _decode(counts[-1])]
+            total = sum(int(window.get("total", 0)) for window in windows)
+            failures = sum(int(window.get("failures", 0)) for window in windows)
+            if (
+                not success
+                and circuit.get("state") != OPEN
+                and total >= settings.circuit_min_requests
+                and failures / total >= settings.circuit_failure_ratio
+            ):
+                self._open(redis, now, float(circuit.get("cooldown") or settings.circuit_cooldown_seconds))
+        except RedisError:
+            logger.warning("Circuit breaker unavailable for %s, result not recorded", self.name)
+
+    def _open(self, redis: Any, now: float, cooldown: float) -> None:
+        cooldown = min(cooldown, settings.circuit_max_cooldown_seconds)
+        redis.hset(self.key, mapping={"state": OPEN, "open_until": now + cooldown, "cooldown": cooldown, "opened_at": now})
+        redis.delete(f"{self.key}:probe")
+        logger.warning("Circuit for %s opened for %.0fs", self.name, cooldown)
+
+    def _close(self, redis: Any) -> None:
+        pipeline = redis.pipeline(transaction=False)
+        pipeline.delete(self.key, f"{self.key}:probe")
+        pipeline.execute()
+        logger.info("Circuit for %s closed", self.name)
+
+
+def track(connector_id: str, breaker: CircuitBreaker) -> None:
+    try:
+        get_redis().sadd(f"connector-circuits:{connector_id}", breaker.key)
+    except RedisError:
+        logger.warning("Circuit breaker unavailable, %s not tracked for connector %s", breaker.name, connector_id)
+
+
+def connector_circuits(connector_id: str) -> list[dict[str, Any]]:
+    keys = sorted(key.decode() if isinstance(key, bytes) else key for key in get_redis().smembers(f"connector-circuits:{connector_id}"))
+    return [circuit_status(key) for key in keys]
+
+
+def circuit_status(key: str) -> dict[str, Any]:
+    circuit = _decode(get_redis().hgetall(key))
+    state = circuit.get("state", CLOSED)
+    if state == OPEN and float(circuit.get("open_until", 0)) <= time.time():
+        state = HALF_OPEN
+    return {
+        "name": key.removeprefix("circuit:"),
+        "state": state,
+        "open_until": float(circuit["open_until"]) if "open_until" in circuit else None,
+        "cooldown": float(circuit["cooldown"]) if "cooldown" in circuit else None,
+    }
@@ -1,32 +1,95 @@
+import calendar
 import hashlib
-import requests
+import inspect
+import os
 import feedparser
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+from app.core.config import settings
+from app.db.session import SessionLocal
 from app.models.target import Target
+from app.models.target_hash import TargetHash
 from app.models.finding import Finding
 from app.utils.crypto import decrypt_value
+from app.services import upstream_cache
+from app.services.dedupe_filter import BloomFilter, load_filter, stored_hashes
+from app.services.dump_scanner import DumpHit, resolve_dump_path, scan_file
 from app.services.severity import compute_severity
+from app.services.source_catalog import load_breach_catalog, source_record_id
+from app.services.http_client import (
+    HttpClient,
+    credential_scope,
+    iter_file_text,
+    iter_text,
+    spool_response,
+    url_validators,
+)
+from app.services.json_stream import JsonArrayStream, compile_path
+from app.services.records import CHECKPOINT, Checkpoint, FindingRecord
+from app.services.password_index import is_credential_target, open_index
+from app.services.target_hashes import HashTokenScanner, extract_hash_tokens, org_digests, resolve_hashes
+from app.services.matcher import Match, compile_targets, group_targets, scan_chunks
 from app.utils.redaction import sanitize_snippet
 
 
+T = TypeVar("T")
+
+UNSEEN_BATCH_SIZE = 500
+
+
 class BaseConnector:
     name = "base"
+    checkpoint_state = False
+    accepts_credentials = False
+
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord | Finding | Checkpoint]:
+        try:
+            inspect.signature(self.fetch).bind(targets, config, secrets, state)
+        except TypeError:
+            # Connectors written before incremental state override fetch(targets, config, secrets).
+            yield from self.fetch(targets, config, secrets)
+            return
+        yield from self.fetch(targets, config, secrets, state)
 
-    def fetch(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> list[Finding]:
-        raise NotImplementedError
+    def fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> list[FindingRecord | Finding]:
+        if type(self).iter_fetch is BaseConnector.iter_fetch:
+            raise NotImplementedError
+        return [item for item in self.iter_fetch(targets, config, secrets, state) if item is not CHECKPOINT]
+
+    def test(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> None:
+        # The first finding, or a clean finish, is enough to show the connector works without a full scan.
+        next((item for item in self.iter_fetch(targets, config, secrets, {}) if item is not CHECKPOINT), None)
 
 
 class DemoConnector(BaseConnector):
     name = "demo"
 
-    def fetch(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> list[Finding]:
-        findings = []
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord]:
+        records = []
         for target in targets:
             snippet = f"Demo leak mention for {target.value} with placeholder data"
             exposure = ["email"] if target.target_type == "email" else ["mention"]
-            dedupe_hash = hashlib.sha256(f"demo-{target.value}".encode()).hexdigest()
-            findings.append(
-                Finding(
+            records.append(
+                FindingRecord(
                     org_id=target.org_id,
                     source="demo",
                     confidence=55,
@@ -34,172 +97,697 @@ class DemoConnector(BaseConnector):
                     exposure_types=exposure,
                     raw_snippet=sanitize_snippet(snippet),
                     severity=compute_severity(exposure),
-                    dedupe_hash=dedupe_hash,
+                    dedupe_hash=hashlib.sha256(f"demo-{target.value}".encode()).hexdigest(),
                     metadata={"note": "demo"},
                 )
             )
-        return findings
+        yield from _unseen(config.get("org_id"), load_filter(config.get("org_id")), records)
+
+
+def _load_catalog(source: str) -> dict[str, tuple[str, Any]]:
+    db = SessionLocal()
+    try:
+        return load_breach_catalog(db, source)
+    finally:
+        db.close()
+
+
+def _load_digests(org_id: str | None) -> set[str]:
+    if not org_id:
+        return set()
+    db = SessionLocal()
+    try:
+        return org_digests(db, org_id)
+    finally:
+        db.close()
+
+
+def _resolve_hash_tokens(
+    org_id: str | None, tokens: dict[str, str], targets: list[Target]
+) -> dict[str, list[tuple[Target, TargetHash]]]:
+    if not org_id or not tokens:
+        return {}
+    targets_by_id = {target.id: target for target in targets}
+    db = SessionLocal()
+    try:
+        resolved = resolve_hashes(db, org_id, tokens)
+    finally:
+        db.close()
+    return {
+        token: [(targets_by_id[row.target_id], row) for row in rows if row.target_id in targets_by_id]
+        for token, rows in resolved.items()
+    }
+
+
+def _unseen(
+    org_id: str | None,
+    known: BloomFilter,
+    items: Iterable[T],
+    dedupe_hash: Callable[[T], str] = attrgetter("dedupe_hash"),
+) -> Iterator[T]:
+    # Filter misses are certainly new and go out at once. Hits are only probable repeats, so finding_keys
+    # confirms them in batches and false positives still get stored.
+    def confirmed(batch: list[T]) -> Iterator[T]:
+        repeats: set[str] = set()
+        if org_id and batch:
+            db = SessionLocal()
+            try:
+                repeats = stored_hashes(db, org_id, [dedupe_hash(item) for item in batch])
+            finally:
+                db.close()
+        return (item for item in batch if dedupe_hash(item) not in repeats)
+
+    pending: list[T] = []
+    for item in items:
+        if dedupe_hash(item) not in known:
+            yield item
+            continue
+        pending.append(item)
+        if len(pending) >= UNSEEN_BATCH_SIZE:
+            yield from confirmed(pending)
+            pending = []
+    yield from confirmed(pending)
+
+
+def _target_validators(state: dict[str, Any] | None, url: str, targets_by_value: dict[str, list[Target]]) -> dict[str, Any]:
+    target_set = hashlib.sha256("\n".join(sorted(targets_by_value)).encode()).hexdigest()
+    validators = url_validators(state, url)
+    # Content that was unchanged for the old targets still has to be scanned for new ones.
+    if validators.get("targets") != target_set:
+        validators.clear()
+        validators["targets"] = target_set
+    return validators
+
+
+def _cached_lookups(
+    connector_type: str,
+    scope: str,
+    targets: list[Target],
+    client: HttpClient,
+    lookup: Callable[[str], Any],
+) -> Iterator[tuple[Target, Any]]:
+    scope = upstream_cache.cache_scope(scope)
+    cached = upstream_cache.get_many(connector_type, scope, (target.value for target in targets))
+    misses: dict[str, list[Target]] = {}
+    for target in targets:
+        if target.value in cached:
+            yield target, cached[target.value]
+        else:
+            misses.setdefault(target.value, []).append(target)
+    fetched: dict[str, Any] = {}
+    try:
+        for value, payload in zip(misses, client.map(lookup, misses)):
+            if payload is None:
+                payload = []
+            else:
+                fetched[value] = payload
+            for target in misses[value]:
+                yield target, payload
+    finally:
+        upstream_cache.set_many(connector_type, scope, fetched)
 
 
 class HIBPConnector(BaseConnector):
     name = "hibp"
 
-    def fetch(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> list[Finding]:
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord]:
         api_key = decrypt_value(secrets.get("api_key", ""))
-        base_url = config.get("base_url", "https://haveibeenpwned.com/api/v3/breachedaccount")
-        findings = []
+        api_root = config.get("api_root", "https://haveibeenpwned.com/api/v3")
+        base_url = config.get("base_url", f"{api_root}/breachedaccount")
         headers = {"hibp-api-key": api_key, "user-agent": "darkweb-guard"}
-        for target in targets:
-            if target.target_type != "email":
-                continue
-            resp = requests.get(f"{base_url}/{target.value}", headers=headers, timeout=10)
+        client = HttpClient(
+            requests_per_minute=config.get("requests_per_minute", 10),
+            concurrency=config.get("concurrency", 4),
+            scope=credential_scope(api_key),
+        )
+        catalog = _load_catalog(self.name)
+
+        def lookup(value: str) -> list[dict]:
+            resp = client.get(f"{base_url}/{value}", params={"truncateResponse": "true"}, headers=headers)
             if resp.status_code == 404:
-                continue
+                return []
             resp.raise_for_status()
-            for breach in resp.json():
-                exposure_types = breach.get("DataClasses", [])
-                snippet = f"HIBP breach {breach.get('Name')} affecting {target.value}"
-                dedupe_hash = hashlib.sha256(f"hibp-{target.value}-{breach.get('Name')}".encode()).hexdigest()
-                findings.append(
-                    Finding(
-                        org_id=target.org_id,
-                        source="hibp",
-                        confidence=90,
-                        matched_entity=target.value,
-                        exposure_types=exposure_types,
-                        raw_snippet=sanitize_snippet(snippet),
-                        severity=compute_severity(exposure_types),
-                        dedupe_hash=dedupe_hash,
-                        metadata={"breach": breach},
-                    )
-                )
-        return findings
+            return resp.json()
+
+        def domain_lookup(value: str) -> dict[str, list[str]]:
+            resp = client.get(f"{api_root}/breacheddomain/{value}", headers=headers)
+            if resp.status_code == 404:
+                return {}
+            resp.raise_for_status()
+            return resp.json()
+
+        def breach_record(name: str) -> tuple[str, dict]:
+            if name not in catalog:
+                resp = client.get(f"{api_root}/breach/{name}", headers=headers)
+                breach = resp.json() if resp.status_code == 200 else {"Name": name}
+                catalog[name] = (source_record_id(self.name, breach), breach)
+            return catalog[name]
+
+        known = load_filter(config.get("org_id"))
+        verified = {domain.lower() for domain in config.get("verified_domains", [])}
+        email_targets = {target.value.lower(): target for target in targets if target.target_type == "email"}
+        domain_targets = [
+            target for target in targets if target.target_type == "domain" and target.value.lower() in verified
+        ]
+
+        def lookups() -> Iterator[tuple[Target, str, list[str]]]:
+            for target, aliases in _cached_lookups(f"{self.name}-domain", client.scope, domain_targets, client, domain_lookup):
+                domain = target.value.lower()
+                for alias, names in (aliases or {}).items():
+                    email_target = email_targets.get(f"{alias}@{domain}".lower())
+                    email = email_target.value if email_target else f"{alias}@{domain}"
+                    yield email_target or target, email, names
+            searched = {target.value.lower() for target in domain_targets}
+            remaining = [
+                target for email, target in email_targets.items() if email.rpartition("@")[2] not in searched
+            ]
+            for target, breaches in _cached_lookups(self.name, client.scope, remaining, client, lookup):
+                yield target, target.value, [breach.get("Name") for breach in breaches]
+
+        def candidates() -> Iterator[tuple[Target, str, str, str]]:
+            for target, email, names in lookups():
+                for name in names:
+                    yield target, email, name, hashlib.sha256(f"hibp-{email}-{name}".encode()).hexdigest()
+
+        # New findings go out as each lookup returns, while probable repeats are confirmed across lookups.
+        for target, email, name, dedupe_hash in _unseen(config.get("org_id"), known, candidates(), itemgetter(3)):
+            record_id, breach = breach_record(name)
+            exposure_types = breach.get("DataClasses", [])
+            snippet = f"HIBP breach {name} affecting {email}"
+            yield FindingRecord(
+                org_id=target.org_id,
+                source="hibp",
+                confidence=90,
+                matched_entity=email,
+                exposure_types=exposure_types,
+                raw_snippet=sanitize_snippet(snippet),
+                severity=compute_severity(exposure_types),
+                dedupe_hash=dedupe_hash,
+                metadata={"breach": name},
+                source_record_id=record_id,
+                source_payload=breach,
+            )
+
+
+class ConnectorAuthError(Exception):
+    pass
+
+
+DEHASHED_FIELDS = {"email": "email", "domain": "domain", "username": "username", "phone": "phone", "ip": "ip_address"}
+
+
+def _dehashed_term(target: Target) -> str:
+    value = target.value.replace("\\", "\\\\").replace('"', '\\"')
+    field = DEHASHED_FIELDS.get(target.target_type)
+    return f'{field}:"{value}"' if field else f'"{value}"'
+
+
+def _pack_queries(targets: list[Target], max_length: int) -> list[list[Target]]:
+    groups: list[list[Target]] = []
+    length = 0
+    for target in targets:
+        term_length = len(_dehashed_term(target))
+        if groups and length + len(" OR ") + term_length <= max_length:
+            groups[-1].append(target)
+            length += len(" OR ") + term_length
+        else:
+            groups.append([target])
+            length = term_length
+    return groups
+
+
+def _entry_tokens(entry: dict) -> set[str]:
+    tokens: set[str] = set()
+    for field in DEHASHED_FIELDS.values():
+        values = entry.get(field)
+        for value in values if isinstance(values, list) else [values]:
+            if not isinstance(value, str) or not value:
+                continue
+            value = value.strip().lower()
+            tokens.add(value)
+            if "@" in value:
+                tokens.add(value.rpartition("@")[2])
+    return tokens
 
 
 class DehashedConnector(BaseConnector):
     name = "dehashed"
 
-    def fetch(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> list[Finding]:
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord]:
         api_key = decrypt_value(secrets.get("api_key", ""))
         username = decrypt_value(secrets.get("username", ""))
         base_url = config.get("base_url", "https://api.dehashed.com/search")
-        findings = []
-        for target in targets:
-            resp = requests.get(base_url, params={"query": target.value}, auth=(username, api_key), timeout=10)
-            if resp.status_code == 401:
-                continue
-            resp.raise_for_status()
-            data = resp.json().get("entries", [])
-            for entry in data:
-                exposure_types = [key for key in entry.keys() if entry.get(key)]
-                snippet = f"DeHashed entry for {target.value}"
-                dedupe_hash = hashlib.sha256(f"dehashed-{target.value}-{entry.get('id', '')}".encode()).hexdigest()
-                findings.append(
-                    Finding(
-                        org_id=target.org_id,
-                        source="dehashed",
-                        confidence=70,
-                        matched_entity=target.value,
-                        exposure_types=exposure_types,
-                        raw_snippet=sanitize_snippet(snippet),
-                        severity=compute_severity(exposure_types),
-                        metadata={"entry": entry},
-                        dedupe_hash=dedupe_hash,
-                    )
+        page_size = config.get("page_size", 1000)
+        max_pages = config.get("max_pages", 10)
+        client = HttpClient(
+            requests_per_minute=config.get("requests_per_minute", 600),
+            concurrency=config.get("concurrency", 4),
+            scope=credential_scope(username, api_key),
+        )
+
+        def search(group: list[Target]) -> dict[str, list[dict]]:
+            query = " OR ".join(_dehashed_term(target) for target in group)
+            entries: list[dict] = []
+            for page in range(1, max_pages + 1):
+                resp = client.get(
+                    base_url,
+                    params={"query": query, "page": page, "size": page_size},
+                    auth=(username, api_key),
+                    headers={"Accept": "application/json"},
                 )
-        return findings
+                if resp.status_code == 401:
+                    raise ConnectorAuthError("DeHashed rejected the configured credentials")
+                resp.raise_for_status()
+                data = resp.json()
+                batch = data.get("entries") or []
+                entries.extend(batch)
+                if len(batch) < page_size or len(entries) >= (data.get("total") or 0):
+                    break
+            hits: dict[str, list[dict]] = {target.value: [] for target in group}
+            for entry in entries:
+                tokens = _entry_tokens(entry)
+                text = " ".join(str(value) for value in entry.values()).lower()
+                for target in group:
+                    value = target.value.strip().lower()
+                    if value in (tokens if target.target_type in DEHASHED_FIELDS else text):
+                        hits[target.value].append(entry)
+            return hits
+
+        targets_by_value: dict[str, list[Target]] = {}
+        for target in targets:
+            targets_by_value.setdefault(target.value, []).append(target)
+        known = load_filter(config.get("org_id"))
+
+        def records(hits: dict[str, list[dict]]) -> Iterator[FindingRecord]:
+            for value, entries in hits.items():
+                for target in targets_by_value[value]:
+                    for entry in entries:
+                        exposure_types = [key for key in entry.keys() if entry.get(key)]
+                        snippet = f"DeHashed entry for {target.value}"
+                        dedupe_hash = hashlib.sha256(f"dehashed-{target.value}-{entry.get('id', '')}".encode()).hexdigest()
+                        yield FindingRecord(
+                            org_id=target.org_id,
+                            source="dehashed",
+                            confidence=70,
+                            matched_entity=target.value,
+                            exposure_types=exposure_types,
+                            raw_snippet=sanitize_snippet(snippet),
+                            severity=compute_severity(exposure_types),
+                            metadata={"entry_id": entry.get("id")},
+                            dedupe_hash=dedupe_hash,
+                            source_record_id=source_record_id(self.name, entry),
+                            source_payload=entry,
+                        )
+
+        def results() -> Iterator[FindingRecord]:
+            scope = upstream_cache.cache_scope(client.scope)
+            cached = upstream_cache.get_many(self.name, scope, targets_by_value)
+            yield from records(cached)
+            misses = [group[0] for value, group in targets_by_value.items() if value not in cached]
+            fetched: dict[str, list[dict]] = {}
+            try:
+                # Each packed query's findings are yielded as soon as it returns.
+                for hits in client.map(search, _pack_queries(misses, config.get("max_query_length", 1024))):
+                    fetched.update(hits)
+                    yield from records(hits)
+            finally:
+                upstream_cache.set_many(self.name, scope, fetched)
+
+        yield from _unseen(config.get("org_id"), known, results())
+
+
+GENERIC_REST_FIELDS = ("matched_entity", "confidence", "exposure_types", "raw_snippet")
+
+
+@lru_cache(maxsize=256)
+def _compile_field_map(field_map: tuple[tuple[str, str], ...]) -> dict[str, Callable[[Any], Any]]:
+    paths = dict(field_map)
+    return {field: compile_path(paths.get(field, field)) for field in GENERIC_REST_FIELDS}
 
 
 class GenericRestConnector(BaseConnector):
     name = "generic_rest"
 
-    def fetch(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> list[Finding]:
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord]:
         url = config.get("url")
         if not url:
-            return []
+            return
         headers = config.get("headers", {})
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        payload = response.json()
-        findings = []
-        for item in payload.get("findings", []):
-            dedupe_hash = hashlib.sha256(str(item).encode()).hexdigest()
-            findings.append(
-                Finding(
+        items_key = config.get("items_key", "findings")
+        chunk_size = int(config.get("chunk_size", 64 * 1024))
+        fields = _compile_field_map(tuple(sorted((config.get("field_map") or {}).items())))
+        client = HttpClient()
+        if config.get("pagination"):
+            items = self._paginate(client, url, headers, config, items_key, chunk_size)
+        else:
+            validators = url_validators(state, url)
+            response = client.conditional_get(url, validators, headers=headers, params=config.get("params"), stream=True)
+            if response is None:
+                return
+            body, content_hash = spool_response(response, chunk_size)
+            if content_hash == validators.get("content_hash"):
+                body.close()
+                return
+            validators["content_hash"] = content_hash
+            items = iter(JsonArrayStream(iter_file_text(body, chunk_size, response.encoding), items_key))
+
+        def records() -> Iterator[FindingRecord]:
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                exposure_types = fields["exposure_types"](item) or []
+                confidence = fields["confidence"](item)
+                yield FindingRecord(
                     org_id=config.get("org_id"),
                     source="generic_rest",
-                    confidence=item.get("confidence", 50),
-                    matched_entity=item.get("matched_entity", "unknown"),
-                    exposure_types=item.get("exposure_types", []),
-                    raw_snippet=sanitize_snippet(item.get("raw_snippet", "")),
-                    severity=compute_severity(item.get("exposure_types", [])),
-                    dedupe_hash=dedupe_hash,
+                    confidence=50 if confidence is None else confidence,
+                    matched_entity=fields["matched_entity"](item) or "unknown",
+                    exposure_types=exposure_types,
+                    raw_snippet=sanitize_snippet(fields["raw_snippet"](item) or ""),
+                    severity=compute_severity(exposure_types),
+                    dedupe_hash=hashlib.sha256(str(item).encode()).hexdigest(),
                     metadata=item,
                 )
-            )
-        return findings
+
+        yield from _unseen(config.get("org_id"), load_filter(config.get("org_id")), records())
+
+    def _paginate(
+        self,
+        client: HttpClient,
+        url: str,
+        headers: dict[str, Any],
+        config: dict[str, Any],
+        items_key: str | None,
+        chunk_size: int,
+    ) -> Iterator[Any]:
+        pagination = config["pagination"]
+        strategy = pagination.get("type", "cursor")
+        if strategy not in ("cursor", "page", "offset", "link"):
+            raise ValueError(f"Unknown pagination type: {strategy}")
+        page_size = int(pagination.get("page_size", 100))
+        cursor_field = compile_path(pagination.get("cursor_field", "next_cursor"))
+        params = dict(config.get("params") or {})
+        page = int(pagination.get("start", 1))
+        offset = 0
+        next_url: str | None = url
+        for _ in range(int(pagination.get("max_pages", 1000))):
+            if strategy == "page":
+                params[pagination.get("page_param", "page")] = page
+                params[pagination.get("size_param", "page_size")] = page_size
+            elif strategy == "offset":
+                params[pagination.get("offset_param", "offset")] = offset
+                params[pagination.get("limit_param", "limit")] = page_size
+            response = client.get(next_url, headers=headers, params=params, stream=True)
+            response.raise_for_status()
+            stream = JsonArrayStream(iter_text(response, chunk_size), items_key)
+            count = 0
+            for item in stream:
+                count += 1
+                yield item
+            if strategy == "cursor":
+                cursor = cursor_field(stream.fields)
+                if not cursor:
+                    return
+                params[pagination.get("cursor_param", "cursor")] = cursor
+            elif strategy == "link":
+                next_url = response.links.get("next", {}).get("url")
+                if not next_url:
+                    return
+                params = {}
+            else:
+                if count < page_size:
+                    return
+                page += 1
+                offset += count
 
 
 class RssConnector(BaseConnector):
     name = "rss"
 
-    def fetch(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> list[Finding]:
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord]:
         url = config.get("url")
         if not url:
-            return []
-        feed = feedparser.parse(url)
-        findings = []
+            return
+        matcher, targets_by_value = compile_targets(targets)
+        validators = _target_validators(state, url, targets_by_value)
+        target_set = validators["targets"]
+        response = HttpClient().conditional_get(url, validators)
+        if response is None:
+            return
+        feed = feedparser.parse(response.content, response_headers=dict(response.headers))
+        cursor = state.setdefault("rss_cursor", {}) if state is not None else {}
+        if cursor.get("targets") != target_set:
+            cursor.clear()
+        seen = set(cursor.get("seen", []))
+        watermark = cursor.get("published")
+        newest = watermark
+        new_ids = []
+        pending: list[tuple[Any, str, str, dict[str, str]]] = []
+        hash_tokens: dict[str, str] = {}
         for entry in feed.entries:
+            entry_id = entry.get("id", entry.get("link"))
+            published = entry.get("published_parsed") or entry.get("updated_parsed")
+            published_at = calendar.timegm(published) if published else None
+            if entry_id in seen or (published_at is not None and watermark is not None and published_at < watermark):
+                continue
+            new_ids.append(entry_id)
+            if published_at is not None and (newest is None or published_at > newest):
+                newest = published_at
             content = entry.get("title", "") + " " + entry.get("summary", "")
-            for target in targets:
-                if target.value.lower() in content.lower():
-                    exposure_types = ["mention"]
-                    dedupe_hash = hashlib.sha256(f"rss-{entry.get('id', entry.get('link'))}".encode()).hexdigest()
-                    findings.append(
-                        Finding(
-                            org_id=target.org_id,
-                            source="rss",
-                            confidence=40,
-                            matched_entity=target.value,
-                            exposure_types=exposure_types,
-                            raw_snippet=sanitize_snippet(content[:280]),
-                            severity=compute_severity(exposure_types),
-                            dedupe_hash=dedupe_hash,
-                            metadata={"link": entry.get("link")},
-                        )
+            tokens = extract_hash_tokens(content)
+            hash_tokens.update(tokens)
+            pending.append((entry, entry_id, content, tokens))
+        resolved = _resolve_hash_tokens(config.get("org_id"), hash_tokens, targets)
+        records = []
+        for entry, entry_id, content, tokens in pending:
+            matched = [target for value in matcher.first_matches(content) for target in targets_by_value[value]]
+            matched += [target for token in tokens for target, _ in resolved.get(token, [])]
+            for target in dict.fromkeys(matched):
+                exposure_types = ["mention"]
+                records.append(
+                    FindingRecord(
+                        org_id=target.org_id,
+                        source="rss",
+                        confidence=40,
+                        matched_entity=target.value,
+                        exposure_types=exposure_types,
+                        raw_snippet=sanitize_snippet(content[:280]),
+                        severity=compute_severity(exposure_types),
+                        dedupe_hash=hashlib.sha256(f"rss-{entry_id}-{target.value}".encode()).hexdigest(),
+                        metadata={"link": entry.get("link")},
                     )
-        return findings
+                )
+        yield from _unseen(config.get("org_id"), load_filter(config.get("org_id")), records)
+        if new_ids:
+            fresh = set(new_ids)
+            retained = [seen_id for seen_id in cursor.get("seen", []) if seen_id not in fresh]
+            cursor["seen"] = (new_ids + retained)[: int(config.get("cursor_size", 1000))]
+            cursor["published"] = newest
+        cursor["targets"] = target_set
 
 
 class PublicPasteConnector(BaseConnector):
     name = "public_paste"
 
-    def fetch(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> list[Finding]:
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord]:
         url = config.get("url")
         if not url:
-            return []
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        content = response.text
-        findings = []
+            return
+        matcher, targets_by_value = compile_targets(targets)
+        validators = _target_validators(state, url, targets_by_value)
+        response = HttpClient().conditional_get(url, validators, stream=True)
+        if response is None:
+            return
+        chunk_size = int(config.get("chunk_size", 1024 * 1024))
+        body, content_hash = spool_response(response, chunk_size)
+        if content_hash == validators.get("content_hash"):
+            body.close()
+            return
+        validators["content_hash"] = content_hash
+        context = int(config.get("snippet_context", 140))
+        hash_scanner = HashTokenScanner(lambda: _load_digests(config.get("org_id")), context)
+        chunks = hash_scanner.watch(iter_file_text(body, chunk_size, response.encoding))
+        first_matches: dict[str, tuple[Match, str]] = {}
+        for match, snippet in scan_chunks(matcher, chunks, context=context):
+            first_matches.setdefault(match.value, (match, snippet))
+
+        hits: dict[str, tuple[Target, str, dict[str, Any]]] = {}
+        for value, (match, snippet) in first_matches.items():
+            for target in targets_by_value[value]:
+                hits.setdefault(target.value, (target, snippet, {"url": url, "offset": match.start}))
+        resolved = _resolve_hash_tokens(config.get("org_id"), hash_scanner.tokens, targets)
+        for token, matches in resolved.items():
+            for target, target_hash in matches:
+                metadata = {"url": url, "hash_algorithm": target_hash.algorithm, "normalization": target_hash.normalization}
+                hits.setdefault(target.value, (target, hash_scanner.tokens[token], metadata))
+
+        records = []
+        for target, snippet, metadata in hits.values():
+            exposure_types = ["mention"]
+            records.append(
+                FindingRecord(
+                    org_id=target.org_id,
+                    source="public_paste",
+                    confidence=35,
+                    matched_entity=target.value,
+                    exposure_types=exposure_types,
+                    raw_snippet=sanitize_snippet(snippet),
+                    severity=compute_severity(exposure_types),
+                    dedupe_hash=hashlib.sha256(f"paste-{target.value}-{url}".encode()).hexdigest(),
+                    metadata=metadata,
+                )
+            )
+        yield from _unseen(config.get("org_id"), load_filter(config.get("org_id")), records)
+
+
+class PwnedPasswordsConnector(BaseConnector):
+    name = "pwned_passwords"
+    accepts_credentials = True
+
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord]:
+        index = open_index(config.get("index_path") or settings.pwned_passwords_index_path)
+        target_types = set(config.get("target_types", ["password_hash", f"password_{index.hash_type}"]))
+        records = []
         for target in targets:
-            if target.value.lower() in content.lower():
-                exposure_types = ["mention"]
-                dedupe_hash = hashlib.sha256(f"paste-{target.value}-{url}".encode()).hexdigest()
-                findings.append(
-                    Finding(
-                        org_id=target.org_id,
-                        source="public_paste",
-                        confidence=35,
-                        matched_entity=target.value,
-                        exposure_types=exposure_types,
-                        raw_snippet=sanitize_snippet(content[:280]),
-                        severity=compute_severity(exposure_types),
-                        dedupe_hash=dedupe_hash,
-                        metadata={"url": url},
-                    )
+            if target.target_type not in target_types:
+                continue
+            prevalence = index.lookup_hex(target.value)
+            if prevalence is None:
+                continue
+            digest = target.value.strip().upper()
+            label = (target.metadata or {}).get("label") or f"{digest[:8]}..."
+            snippet = f"Credential hash {label} appears in the Pwned Passwords corpus {prevalence} times"
+            records.append(
+                FindingRecord(
+                    org_id=target.org_id,
+                    source=self.name,
+                    confidence=95,
+                    matched_entity=label,
+                    exposure_types=["password"],
+                    raw_snippet=sanitize_snippet(snippet),
+                    severity=compute_severity(["password"]),
+                    dedupe_hash=hashlib.sha256(f"pwned-passwords-{digest}".encode()).hexdigest(),
+                    metadata={"hash_type": index.hash_type, "prevalence": prevalence},
                 )
-        return findings
+            )
+        yield from _unseen(config.get("org_id"), load_filter(config.get("org_id")), records)
+
+
+class FileDumpConnector(BaseConnector):
+    name = "file_dump"
+    checkpoint_state = True
+
+    def test(self, targets: list[Target], config: dict[str, Any], secrets: dict[str, Any]) -> None:
+        path = resolve_dump_path(config.get("path") or "")
+        if not os.path.isfile(path) or not os.access(path, os.R_OK):
+            raise ValueError(f"Dump file {config.get('path')} is not readable")
+
+    def iter_fetch(
+        self,
+        targets: list[Target],
+        config: dict[str, Any],
+        secrets: dict[str, Any],
+        state: dict[str, Any] | None = None,
+    ) -> Iterator[FindingRecord | Checkpoint]:
+        if not config.get("path"):
+            return
+        path = resolve_dump_path(config["path"])
+        if not os.path.exists(path):
+            return
+        targets_by_value = group_targets(targets)
+        patterns = tuple(sorted(targets_by_value))
+        if not patterns:
+            return
+        stat = os.stat(path)
+        identity = {
+            "path": path,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "targets": hashlib.sha256("\n".join(patterns).encode()).hexdigest(),
+        }
+        progress = state.setdefault("file_dump", {}) if state is not None else {}
+        if progress.get("identity") != identity:
+            progress.clear()
+            progress["identity"] = identity
+        exposure_types = config.get("exposure_types", ["credentials"])
+        known = load_filter(config.get("org_id"))
+        scans = scan_file(
+            path,
+            patterns,
+            start=progress.get("offset", 0),
+            chunk_bytes=int(config.get("chunk_bytes", 64 * 1024 * 1024)),
+            processes=config.get("processes"),
+            max_line=int(config.get("max_line", 280)),
+            hash_tokens=bool(config.get("hash_tokens", True)),
+        )
+
+        def record(target: Target, hit: DumpHit, **metadata: Any) -> FindingRecord:
+            return FindingRecord(
+                org_id=target.org_id,
+                source=self.name,
+                confidence=80,
+                matched_entity=target.value,
+                exposure_types=exposure_types,
+                raw_snippet=sanitize_snippet(hit.line),
+                severity=compute_severity(exposure_types),
+                dedupe_hash=hashlib.sha256(f"dump-{path}-{target.value}-{hit.line}".encode()).hexdigest(),
+                metadata={"file": os.path.basename(path), "offset": hit.offset, **metadata},
+            )
+
+        for offset, hits in scans:
+            records = [record(target, hit) for hit in hits if not hit.hash_token for target in targets_by_value[hit.value]]
+            token_hits: dict[str, list[DumpHit]] = {}
+            for hit in hits:
+                if hit.hash_token:
+                    token_hits.setdefault(hit.value, []).append(hit)
+            resolved = _resolve_hash_tokens(
+                config.get("org_id"), {token: lines[0].line for token, lines in token_hits.items()}, targets
+            )
+            for token, matches in resolved.items():
+                for target, target_hash in matches:
+                    records += [
+                        record(target, hit, hash_algorithm=target_hash.algorithm, normalization=target_hash.normalization)
+                        for hit in token_hits[token]
+                    ]
+            yield from _unseen(config.get("org_id"), known, records)
+            progress["offset"] = offset
+            yield CHECKPOINT
 
 
 CONNECTOR_REGISTRY = {
@@ -209,9 +797,18 @@ CONNECTOR_REGISTRY = {
     GenericRestConnector.name: GenericRestConnector(),
     RssConnector.name: RssConnector(),
     PublicPasteConnector.name: PublicPasteConnector(),
+    PwnedPasswordsConnector.name: PwnedPasswordsConnector(),
+    FileDumpConnector.name: FileDumpConnector(),
 }
 
 
+def connector_targets(handler: BaseConnector, targets: list[Target]) -> list[Target]:
+    if handler.accepts_credentials:
+        return targets
+    # Credential hashes must never reach third-party APIs, feed matchers or snippets.
+    return [target for target in targets if not is_credential_target(target.target_type)]
+
+
 def get_connector(connector_type: str) -> BaseConnector:
     if connector_type not in CONNECTOR_REGISTRY:
         raise ValueError("Unknown connector")
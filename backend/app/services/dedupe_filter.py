@@ -0,0 +1,123 @@
+import hashlib
+import logging
+import math
+from typing import Iterable
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.redis import get_redis
+from app.models.finding_key import FindingKey
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float, bits: bytes | None = None):
+        self.capacity = capacity
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = max(8, size + (-size % 8))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(self.size // 8)
+        if bits:
+            self.bits[: len(bits)] = bits[: len(self.bits)]
+
+    def positions(self, value: str) -> list[int]:
+        digest = hashlib.sha256(value.encode()).digest()
+        first = int.from_bytes(digest[:8], "big")
+        step = int.from_bytes(digest[8:16], "big") | 1
+        return [(first + i * step) % self.size for i in range(self.hash_count)]
+
+    def add(self, value: str) -> list[int]:
+        positions = self.positions(value)
+        for position in positions:
+            self.bits[position >> 3] |= 0x80 >> (position & 7)
+        return positions
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (0x80 >> (position & 7)) for position in self.positions(value))
+
+
+def _new_filter(bits: bytes | None = None) -> BloomFilter:
+    return BloomFilter(settings.dedupe_filter_capacity, settings.dedupe_filter_error_rate, bits)
+
+
+def _key(org_id: str, bloom: BloomFilter) -> str:
+    return f"dedupe-filter:{org_id}:{bloom.size}:{bloom.hash_count}"
+
+
+def _count_key(key: str) -> str:
+    return f"{key}:count"
+
+
+def load_filter(org_id: str | None) -> BloomFilter:
+    bloom = _new_filter()
+    if not org_id or not settings.dedupe_filter_enabled:
+        return bloom
+    try:
+        bits = get_redis().get(_key(org_id, bloom))
+    except RedisError:
+        logger.warning("Dedupe filter unavailable for org %s", org_id)
+        return bloom
+    return _new_filter(bits) if bits else bloom
+
+
+def remember(org_id: str, dedupe_hashes: Iterable[str]) -> None:
+    if not settings.dedupe_filter_enabled:
+        return
+    bloom = _new_filter()
+    key = _key(org_id, bloom)
+    try:
+        redis = get_redis()
+        pipeline = redis.pipeline(transaction=False)
+        for dedupe_hash in dedupe_hashes:
+            for position in bloom.add(dedupe_hash):
+                pipeline.setbit(key, position, 1)
+        previous = pipeline.execute()
+        # A hash is new to the filter when any of its bits was still clear.
+        inserted = sum(
+            not all(previous[start:start + bloom.hash_count]) for start in range(0, len(previous), bloom.hash_count)
+        )
+        if inserted and redis.incrby(_count_key(key), inserted) > bloom.capacity:
+            # Past capacity the false-positive rate climbs; start an empty filter and let finding_keys catch repeats.
+            redis.delete(key, _count_key(key))
+    except RedisError:
+        logger.warning("Dedupe filter unavailable for org %s, hashes not recorded", org_id)
+
+
+def reset_filter(org_id: str) -> None:
+    if not settings.dedupe_filter_enabled:
+        return
+    key = _key(org_id, _new_filter())
+    try:
+        get_redis().delete(key, _count_key(key))
+    except RedisError:
+        logger.warning("Dedupe filter unavailable for org %s, not reset", org_id)
+
+
+def replace_filter(org_id: str, dedupe_hashes: Iterable[str]) -> int:
+    bloom = _new_filter()
+    count = 0
+    for dedupe_hash in dedupe_hashes:
+        bloom.add(dedupe_hash)
+        count += 1
+    key = _key(org_id, bloom)
+    pipeline = get_redis().pipeline()
+    if count > bloom.capacity:
+        logger.warning("Org %s has %s dedupe hashes, more than the filter capacity of %s", org_id, count, bloom.capacity)
+        pipeline.delete(key, _count_key(key))
+    else:
+        pipeline.set(key, bytes(bloom.bits))
+        pipeline.set(_count_key(key), count)
+    pipeline.execute()
+    return count
+
+
+def stored_hashes(db: Session, org_id: str, dedupe_hashes: Iterable[str], batch_size: int = 1000) -> set[str]:
+    dedupe_hashes = list(dict.fromkeys(dedupe_hashes))
+    stored: set[str] = set()
+    for start in range(0, len(dedupe_hashes), batch_size):
+        rows = db.query(FindingKey.dedupe_hash).filter(
+            FindingKey.org_id == org_id, FindingKey.dedupe_hash.in_(dedupe_hashes[start:start + batch_size])
+        )
+        stored.update(row.dedupe_hash for row in rows)
+    return stored
@@ -0,0 +1,104 @@
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, NamedTuple
+from app.core.config import settings
+from app.services.matcher import TargetMatcher
+from app.services.target_hashes import HASH_TOKEN
+
+
+class DumpHit(NamedTuple):
+    value: str
+    offset: int
+    line: str
+    hash_token: bool = False
+
+
+def resolve_dump_path(path: str) -> str:
+    root = os.path.realpath(settings.file_dump_root)
+    # realpath follows symlinks and "..", so the containment check sees where the file really lives.
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"Dump path must be inside {settings.file_dump_root}")
+    return resolved
+
+
+def line_aligned_ranges(path: str, chunk_bytes: int, start: int = 0) -> Iterator[tuple[int, int]]:
+    size = os.path.getsize(path)
+    if start >= size:
+        return
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        while start < size:
+            newline = mm.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            yield start, end
+            start = end
+
+
+@lru_cache(maxsize=8)
+def _matcher(patterns: tuple[str, ...]) -> tuple[TargetMatcher, dict[str, str]]:
+    # Patterns and content are both viewed as latin-1 so match offsets are byte offsets.
+    encoded = {pattern.encode().decode("latin-1").lower(): pattern for pattern in patterns}
+    return TargetMatcher(encoded), encoded
+
+
+def scan_range(
+    path: str, start: int, end: int, patterns: tuple[str, ...], max_line: int = 280, hash_tokens: bool = False
+) -> list[DumpHit]:
+    matcher, originals = _matcher(patterns)
+    hits: list[DumpHit] = []
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    text = data.decode("latin-1")
+    reported: set[tuple[str, int]] = set()
+
+    def report(value: str, match_start: int, match_end: int, hash_token: bool) -> None:
+        line_start = text.rfind("\n", 0, match_start) + 1
+        if (value, line_start) in reported:
+            return
+        reported.add((value, line_start))
+        line_end = text.find("\n", match_end)
+        line = data[line_start:len(data) if line_end == -1 else line_end]
+        hits.append(
+            DumpHit(value, start + line_start, line[:max_line].decode("utf-8", errors="replace").rstrip("\r"), hash_token)
+        )
+
+    for match in matcher.iter_matches(text):
+        report(originals[match.value], match.start, match.end, False)
+    if hash_tokens:
+        # Ranges end on line boundaries, so a token is never split between two ranges.
+        for match in HASH_TOKEN.finditer(text):
+            report(match.group().lower(), match.start(), match.end(), True)
+    return hits
+
+
+def scan_file(
+    path: str,
+    patterns: tuple[str, ...],
+    start: int = 0,
+    chunk_bytes: int = 64 * 1024 * 1024,
+    processes: int | None = None,
+    max_line: int = 280,
+    hash_tokens: bool = False,
+) -> Iterator[tuple[int, list[DumpHit]]]:
+    ranges = line_aligned_ranges(path, chunk_bytes, start)
+    if processes == 1 or multiprocessing.current_process().daemon:
+        for range_start, range_end in ranges:
+            yield range_end, scan_range(path, range_start, range_end, patterns, max_line, hash_tokens)
+        return
+    workers = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        window = 2 * workers
+        pending: deque[tuple[int, Future]] = deque()
+        for range_start, range_end in ranges:
+            future = executor.submit(scan_range, path, range_start, range_end, patterns, max_line, hash_tokens)
+            pending.append((range_end, future))
+            if len(pending) >= window:
+                range_end, future = pending.popleft()
+                yield range_end, future.result()
+        while pending:
+            range_end, future = pending.popleft()
+            yield range_end, future.result()
@@ -0,0 +1,303 @@
+import codecs
+import hashlib
+import logging
+import math
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import IO, Any, Callable, Iterable, Iterator, TypeVar
+from urllib.parse import urlsplit
+import requests
+from redis.exceptions import RedisError
+from requests.adapters import HTTPAdapter
+from app.core.config import settings
+from app.db.redis import get_redis
+from app.services.circuit_breaker import CircuitBreaker, track
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+REDIS_RETRY_SECONDS = 5.0
+
+_session: requests.Session | None = None
+_buckets: dict[str, "TokenBucket"] = {}
+_registry_lock = threading.Lock()
+_redis_down = False
+_redis_retry_at = 0.0
+current_connector: ContextVar[str | None] = ContextVar("current_connector", default=None)
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: float | None = None):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity or max(rate_per_second, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate_per_second)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+# Refills, then either takes a token, records a Retry-After pause, or returns how long to wait.
+RATE_LIMIT_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local pause = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at', 'blocked_until')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+local blocked_until = tonumber(state[3]) or 0
+tokens = math.min(capacity, tokens + math.max(now - updated_at, 0) * rate)
+local wait = 0
+if pause > 0 then
+    blocked_until = math.max(blocked_until, now + pause)
+    tokens = 0
+elseif now >= blocked_until and tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.max(blocked_until - now, (1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now, 'blocked_until', blocked_until)
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return tostring(wait)
+"""
+
+
+class SharedTokenBucket:
+    def __init__(self, key: str, rate_per_second: float):
+        self.key = f"rate-limit:{key}"
+        self.rate_per_second = rate_per_second
+        self.capacity = max(rate_per_second, 1.0)
+        self.local = get_bucket(key, rate_per_second)
+        self._script: Any = None
+
+    def _run(self, pause: float = 0.0) -> float | None:
+        global _redis_down, _redis_retry_at
+        # During an outage Redis is only probed again once REDIS_RETRY_SECONDS have passed.
+        if time.monotonic() < _redis_retry_at:
+            return None
+        ttl = math.ceil(self.capacity / self.rate_per_second + pause) + 60
+        try:
+            if self._script is None:
+                self._script = get_redis().register_script(RATE_LIMIT_SCRIPT)
+            wait = float(self._script(keys=[self.key], args=[self.rate_per_second, self.capacity, time.time(), pause, ttl]))
+        except RedisError:
+            with _registry_lock:
+                if not _redis_down:
+                    logger.warning("Shared rate limit unavailable, limiting each process only until Redis returns")
+                _redis_down = True
+                _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+            return None
+        if _redis_down:
+            with _registry_lock:
+                _redis_down = False
+            logger.info("Shared rate limit restored")
+        return wait
+
+    def acquire(self) -> None:
+        while True:
+            wait = self._run()
+            if wait is None:
+                self.local.acquire()
+                return
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        if self._run(seconds) is None:
+            self.local.pause(seconds)
+
+
+def get_session() -> requests.Session:
+    global _session
+    with _registry_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=settings.http_pool_size, pool_maxsize=settings.http_pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def get_bucket(key: str, rate_per_second: float) -> TokenBucket:
+    with _registry_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket(rate_per_second)
+        elif bucket.rate_per_second != rate_per_second:
+            bucket.rate_per_second = rate_per_second
+            bucket.capacity = max(rate_per_second, 1.0)
+        return bucket
+
+
+def parse_retry_after(value: str | None, default: float = 1.0) -> float:
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def decode_chunks(chunks: Iterable[bytes], encoding: str | None) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    for raw in chunks:
+        yield decoder.decode(raw)
+    yield decoder.decode(b"", final=True)
+
+
+def iter_text(response: requests.Response, chunk_size: int) -> Iterator[str]:
+    def raw_chunks() -> Iterator[bytes]:
+        with response:
+            yield from response.iter_content(chunk_size)
+
+    return decode_chunks(raw_chunks(), response.encoding)
+
+
+def spool_response(response: requests.Response, chunk_size: int) -> tuple[IO[bytes], str]:
+    digest = hashlib.sha256()
+    body = tempfile.SpooledTemporaryFile(max_size=settings.http_spool_max_bytes)
+    with response:
+        for raw in response.iter_content(chunk_size):
+            digest.update(raw)
+            body.write(raw)
+    body.seek(0)
+    return body, digest.hexdigest()
+
+
+def iter_file_text(body: IO[bytes], chunk_size: int, encoding: str | None) -> Iterator[str]:
+    with body:
+        yield from decode_chunks(iter(lambda: body.read(chunk_size), b""), encoding)
+
+
+def url_validators(state: dict[str, Any] | None, url: str) -> dict[str, Any]:
+    if state is None:
+        return {}
+    return state.setdefault("http_cache", {}).setdefault(url, {})
+
+
+def credential_scope(*credentials: str) -> str:
+    return hashlib.sha256("|".join(credentials).encode()).hexdigest()[:16]
+
+
+class HttpClient:
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        concurrency: int = 4,
+        scope: str = "anonymous",
+        max_retries: int = 3,
+        timeout: float = 10,
+        session: requests.Session | None = None,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.concurrency = max(1, min(concurrency, settings.http_pool_size))
+        self.scope = scope
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = session or get_session()
+        self.connector_id = current_connector.get()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._buckets: dict[str, SharedTokenBucket] = {}
+
+    def _bucket(self, url: str) -> SharedTokenBucket | None:
+        if not self.requests_per_minute:
+            return None
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = SharedTokenBucket(f"{host}:{self.scope}", self.requests_per_minute / 60)
+        return bucket
+
+    def _breaker(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(host, self.scope)
+            if self.connector_id:
+                track(self.connector_id, breaker)
+        return breaker
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        bucket = self._bucket(url)
+        breaker = self._breaker(url)
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            breaker.before_request()
+            if bucket:
+                bucket.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException:
+                breaker.record(False)
+                raise
+            breaker.record(response.status_code < 500 and response.status_code != 429)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+            attempt += 1
+            delay = parse_retry_after(response.headers.get("Retry-After"), default=2.0 ** attempt)
+            response.close()
+            if bucket:
+                bucket.pause(delay)
+            else:
+                time.sleep(delay)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def conditional_get(self, url: str, validators: dict[str, Any], **kwargs: Any) -> requests.Response | None:
+        headers = dict(kwargs.pop("headers", None) or {})
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        response = self.get(url, headers=headers, **kwargs)
+        if response.status_code == 304:
+            response.close()
+            return None
+        response.raise_for_status()
+        validators.update(etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"))
+        if kwargs.get("stream"):
+            return response
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        unchanged = content_hash == validators.get("content_hash")
+        validators["content_hash"] = content_hash
+        return None if unchanged else response
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        if self.concurrency == 1:
+            yield from map(fn, items)
+            return
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            yield from executor.map(fn, items)
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Callable, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_TRIM_THRESHOLD = 64 * 1024
+
+
+class JsonArrayStream:
+    def __init__(self, chunks: Iterable[str], key: str | None = "findings"):
+        self.key = key
+        self.fields: dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                if self._pos > _TRIM_THRESHOLD:
+                    self._buffer = self._buffer[self._pos:]
+                    self._pos = 0
+                self._buffer += chunk
+                return True
+        self._exhausted = True
+        return False
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos}, found {found!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal that ends exactly at the buffer edge may continue in the next chunk.
+            if end == len(self._buffer) and not self._exhausted and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _items(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {self._pos - 1}, found {separator!r}")
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.key is None:
+            yield from self._items()
+            return
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == self.key:
+                yield from self._items()
+            else:
+                self.fields[key] = self._value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' at offset {self._pos - 1}, found {separator!r}")
+
+
+def compile_path(path: str) -> Callable[[Any], Any]:
+    keys = path.split(".")
+
+    def get(item: Any) -> Any:
+        for key in keys:
+            if not isinstance(item, dict):
+                return None
+            item = item.get(key)
+        return item
+
+    return get
@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict, deque
+from typing import Iterable, Iterator, NamedTuple
+from app.core.config import settings
+from app.models.target import Target
+
+_compiled: "OrderedDict[str | None, tuple[frozenset[str], TargetMatcher, int]]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+class Match(NamedTuple):
+    start: int
+    end: int
+    value: str
+
+
+class TargetMatcher:
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        self.max_length = 0
+        for pattern in patterns:
+            pattern = pattern.lower()
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[node][char] = child
+                node = child
+            if pattern not in self._out[node]:
+                self._out[node] += (pattern,)
+            self.max_length = max(self.max_length, len(pattern))
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def iter_matches(self, content: str) -> Iterator[Match]:
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for index, char in enumerate(content.lower()):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                for value in out[node]:
+                    yield Match(index - len(value) + 1, index + 1, value)
+
+    def first_matches(self, content: str) -> dict[str, Match]:
+        matches: dict[str, Match] = {}
+        for match in self.iter_matches(content):
+            matches.setdefault(match.value, match)
+        return matches
+
+
+def scan_chunks(matcher: TargetMatcher, chunks: Iterable[str], context: int = 140) -> Iterator[tuple[Match, str]]:
+    overlap = 2 * context + max(matcher.max_length - 1, 0)
+    buffer = ""
+    offset = 0
+    reported_until = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        limit = offset + len(buffer) - context
+        yield from _report(matcher, buffer, offset, reported_until, limit, context)
+        reported_until = max(reported_until, limit)
+        keep = min(len(buffer), overlap)
+        offset += len(buffer) - keep
+        buffer = buffer[len(buffer) - keep:]
+    yield from _report(matcher, buffer, offset, reported_until, offset + len(buffer), context)
+
+
+def _report(
+    matcher: TargetMatcher, buffer: str, offset: int, reported_until: int, limit: int, context: int
+) -> Iterator[tuple[Match, str]]:
+    for match in matcher.iter_matches(buffer):
+        end = offset + match.end
+        if reported_until < end <= limit:
+            snippet = buffer[max(match.start - context, 0):match.end + context]
+            yield Match(offset + match.start, end, match.value), snippet
+
+
+def _compile(org_id: str | None, values: frozenset[str]) -> TargetMatcher:
+    with _compiled_lock:
+        entry = _compiled.get(org_id)
+        if entry and entry[0] == values:
+            _compiled.move_to_end(org_id)
+            return entry[1]
+    matcher = TargetMatcher(values)
+    # Trie size tracks total pattern length, so the budget is in characters rather than entries.
+    weight = sum(len(value) for value in values)
+    with _compiled_lock:
+        _compiled[org_id] = (values, matcher, weight)
+        _compiled.move_to_end(org_id)
+        total = sum(cached[2] for cached in _compiled.values())
+        while total > settings.matcher_cache_max_chars and len(_compiled) > 1:
+            _, (_, _, evicted) = _compiled.popitem(last=False)
+            total -= evicted
+    return matcher
+
+
+def group_targets(targets: list[Target]) -> dict[str, list[Target]]:
+    targets_by_value: dict[str, list[Target]] = {}
+    for target in targets:
+        if target.value:
+            targets_by_value.setdefault(target.value.lower(), []).append(target)
+    return targets_by_value
+
+
+def compile_targets(targets: list[Target]) -> tuple[TargetMatcher, dict[str, list[Target]]]:
+    targets_by_value = group_targets(targets)
+    org_id = targets[0].org_id if targets else None
+    return _compile(org_id, frozenset(targets_by_value)), targets_by_value
@@ -0,0 +1,124 @@
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.alert_rule import AlertRule
+from app.models.connector import Connector
+from app.models.finding import Finding
+from app.models.metric_rollup import MetricRollup
+
+FINDINGS = "findings"
+CONNECTORS = "connectors"
+ALERT_RULES = "alert_rules"
+ROLLUP_KEY = ("org_id", "metric", "day", "severity", "source")
+
+
+def day_of(value: datetime | None) -> date:
+    if value is None:
+        return datetime.now(timezone.utc).date()
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def apply_increments(db: Session, increments: Counter) -> None:
+    # Concurrent upserts lock rollup rows in key order, so two transactions can never wait on each other.
+    rows = [dict(zip(ROLLUP_KEY, key), count=count) for key, count in sorted(increments.items()) if count]
+    if not rows:
+        return
+    table = MetricRollup.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(table)
+        db.execute(
+            insert.on_conflict_do_update(index_elements=list(ROLLUP_KEY), set_={"count": table.c.count + insert.excluded.count}),
+            rows,
+        )
+        return
+    for row in rows:
+        key = [table.c[column] == row[column] for column in ROLLUP_KEY]
+        if not db.execute(table.update().where(*key).values(count=table.c.count + row["count"])).rowcount:
+            db.execute(table.insert(), row)
+
+
+def record_findings(db: Session, changed: Iterable[tuple[str, str, str, datetime | None]], delta: int = 1) -> None:
+    increments: Counter = Counter()
+    for org_id, severity, source, created_at in changed:
+        increments[(org_id, FINDINGS, day_of(created_at), severity or "", source or "")] += delta
+    apply_increments(db, increments)
+
+
+def subtract_findings(db: Session, grouped: Iterable[tuple[str, Any, str, str, int]]) -> None:
+    increments: Counter = Counter()
+    for org_id, day, severity, source, count in grouped:
+        increments[(org_id, FINDINGS, _as_date(day), severity or "", source or "")] -= count
+    apply_increments(db, increments)
+
+
+def record_change(db: Session, org_id: str, metric: str, delta: int) -> None:
+    apply_increments(db, Counter({(org_id, metric, day_of(None), "", ""): delta}))
+
+
+def _day_column(db: Session, column: Any) -> Any:
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date(func.timezone("UTC", column))
+    return func.date(column)
+
+
+def rebuild_rollups(db: Session, org_id: str) -> int:
+    db.query(MetricRollup).filter(MetricRollup.org_id == org_id).delete(synchronize_session=False)
+    increments: Counter = Counter()
+    day = _day_column(db, Finding.created_at)
+    findings = (
+        db.query(day, Finding.severity, Finding.source, func.count())
+        .filter(Finding.org_id == org_id)
+        .group_by(day, Finding.severity, Finding.source)
+    )
+    for finding_day, severity, source, count in findings:
+        increments[(org_id, FINDINGS, _as_date(finding_day), severity or "", source or "")] += count
+    for metric, model in ((CONNECTORS, Connector), (ALERT_RULES, AlertRule)):
+        day = _day_column(db, model.created_at)
+        for created_day, count in db.query(day, func.count()).filter(model.org_id == org_id).group_by(day):
+            increments[(org_id, metric, _as_date(created_day), "", "")] += count
+    apply_increments(db, increments)
+    db.commit()
+    return len(increments)
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value) if value else day_of(None)
+
+
+def summarize(db: Session, org_id: str, days: int) -> dict[str, Any]:
+    totals: Counter = Counter()
+    by_severity: Counter = Counter()
+    by_source: Counter = Counter()
+    rows = (
+        db.query(MetricRollup.metric, MetricRollup.severity, MetricRollup.source, func.sum(MetricRollup.count))
+        .filter(MetricRollup.org_id == org_id)
+        .group_by(MetricRollup.metric, MetricRollup.severity, MetricRollup.source)
+    )
+    for metric, severity, source, count in rows:
+        totals[metric] += count
+        if metric == FINDINGS:
+            by_severity[severity] += count
+            by_source[source] += count
+    since = day_of(None) - timedelta(days=days - 1)
+    series = (
+        db.query(MetricRollup.day, func.sum(MetricRollup.count))
+        .filter(MetricRollup.org_id == org_id, MetricRollup.metric == FINDINGS, MetricRollup.day >= since)
+        .group_by(MetricRollup.day)
+        .order_by(MetricRollup.day)
+    )
+    return {
+        "findings": totals[FINDINGS],
+        "connectors": totals[CONNECTORS],
+        "alert_rules": totals[ALERT_RULES],
+        "by_severity": {severity: count for severity, count in by_severity.items() if count},
+        "by_source": {source: count for source, count in by_source.items() if count},
+        "series": [{"day": day.isoformat(), "findings": count} for day, count in series],
+    }
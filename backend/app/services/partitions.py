@@ -0,0 +1,116 @@
+import re
+from datetime import date, datetime, timezone
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.services.metrics import day_of, subtract_findings
+
+PARTITION_PATTERN = re.compile(r"^findings_p(\d{4})_(\d{2})$")
+DEFAULT_PARTITION = "findings_default"
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"findings_p{month:%Y_%m}"
+
+
+def month_bound(month: date) -> datetime:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+
+
+def _quoted(db: Session, name: str) -> str:
+    if not PARTITION_PATTERN.match(name):
+        raise ValueError(f"Not a findings partition: {name}")
+    return db.get_bind().dialect.identifier_preparer.quote(name)
+
+
+def is_partitioned(db: Session) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return db.execute(text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'findings'::regclass")).first() is not None
+
+
+def findings_partitions(db: Session) -> dict[str, date]:
+    rows = db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'findings'::regclass"
+        )
+    )
+    partitions = {}
+    for (name,) in rows:
+        match = PARTITION_PATTERN.match(name)
+        if match:
+            partitions[name] = date(int(match.group(1)), int(match.group(2)), 1)
+    return dict(sorted(partitions.items(), key=lambda item: item[1]))
+
+
+def ensure_partitions(db: Session, months_ahead: int, today: date | None = None) -> list[str]:
+    if not is_partitioned(db):
+        return []
+    existing = findings_partitions(db)
+    current = (today or day_of(None)).replace(day=1)
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        table = _quoted(db, name)
+        bounds = {"start": month_bound(month), "end": month_bound(add_months(month, 1))}
+        # Postgres refuses a new range while the default partition holds rows for it, so those move over first.
+        # Table names cannot be bound parameters; _quoted only passes findings_pYYYY_MM names, dialect-quoted.
+        db.execute(text(f"CREATE TABLE {table} (LIKE findings INCLUDING DEFAULTS)"))
+        db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end RETURNING *) "  # nosec B608
+                f"INSERT INTO {table} SELECT * FROM moved"
+            ),
+            bounds,
+        )
+        # Bounds are generated here, never user input, so inlining them into the DDL is safe.
+        db.execute(
+            text(
+                f"ALTER TABLE findings ATTACH PARTITION {table} "
+                f"FOR VALUES FROM ('{bounds['start'].isoformat()}') TO ('{bounds['end'].isoformat()}')"
+            )
+        )
+        created.append(name)
+    db.commit()
+    return created
+
+
+def drop_partition(db: Session, name: str) -> int:
+    # Table names cannot be bound parameters; _quoted only passes findings_pYYYY_MM names, dialect-quoted.
+    table = _quoted(db, name)
+    db.execute(text(f"ALTER TABLE findings DETACH PARTITION {table}"))
+    grouped = db.execute(
+        text(
+            "SELECT org_id, date(timezone('UTC', created_at)), severity, source, count(*) "
+            f"FROM {table} GROUP BY 1, 2, 3, 4"  # nosec B608
+        )
+    ).all()
+    subtract_findings(db, grouped)
+    db.execute(text(f"DROP TABLE {table}"))
+    db.commit()
+    return sum(row[-1] for row in grouped)
+
+
+def drop_empty_partitions(db: Session, before: datetime) -> list[str]:
+    if not is_partitioned(db):
+        return []
+    dropped = []
+    for name, month in findings_partitions(db).items():
+        if month_bound(add_months(month, 1)) > before:
+            continue
+        # Table names cannot be bound parameters; _quoted only passes findings_pYYYY_MM names, dialect-quoted.
+        table = _quoted(db, name)
+        if db.execute(text(f"SELECT 1 FROM {table} LIMIT 1")).first() is None:  # nosec B608
+            db.execute(text(f"ALTER TABLE findings DETACH PARTITION {table}"))
+            db.execute(text(f"DROP TABLE {table}"))
+            dropped.append(name)
+    db.commit()
+    return dropped
@@ -0,0 +1,141 @@
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator
+
+MAGIC = b"DWGPWIDX"
+HEADER = struct.Struct("<8sHHQ")
+PREFIX_BITS = 16
+PREFIX_ENTRY = struct.Struct("<Q")
+COUNT = struct.Struct("<I")
+DIGEST_SIZES = {"sha1": 20, "ntlm": 16}
+CREDENTIAL_TARGET_PREFIX = "password_"
+RUN_RECORDS = 4_000_000
+
+
+def is_credential_target(target_type: str) -> bool:
+    return target_type.startswith(CREDENTIAL_TARGET_PREFIX)
+
+
+def _parse_line(line: str, digest_size: int) -> bytes | None:
+    digest, _, count = line.strip().partition(":")
+    if len(digest) != digest_size * 2:
+        return None
+    try:
+        return bytes.fromhex(digest) + COUNT.pack(min(int(count or 0), 0xFFFFFFFF))
+    except ValueError:
+        return None
+
+
+def _write_run(records: list[bytes]) -> BinaryIO:
+    records.sort()
+    run = tempfile.TemporaryFile()
+    run.write(b"".join(records))
+    run.seek(0)
+    return run
+
+
+def _read_run(run: BinaryIO, record_size: int) -> Iterator[bytes]:
+    while record := run.read(record_size):
+        yield record
+
+
+def build_index(lines: Iterable[str], path: str, hash_type: str = "sha1", run_records: int = RUN_RECORDS) -> int:
+    digest_size = DIGEST_SIZES[hash_type]
+    record_size = digest_size + COUNT.size
+    runs: list[BinaryIO] = []
+    records: list[bytes] = []
+    for line in lines:
+        record = _parse_line(line, digest_size)
+        if record is None:
+            continue
+        records.append(record)
+        if len(records) >= run_records:
+            runs.append(_write_run(records))
+            records = []
+    if records or not runs:
+        runs.append(_write_run(records))
+
+    table_size = (1 << PREFIX_BITS) + 1
+    starts = [0] * table_size
+    count = 0
+    previous = b""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as out:
+            out.seek(HEADER.size + table_size * PREFIX_ENTRY.size)
+            for record in heapq.merge(*(_read_run(run, record_size) for run in runs)):
+                digest = record[:digest_size]
+                if digest == previous:
+                    continue
+                previous = digest
+                starts[int.from_bytes(digest[:2], "big") + 1] += 1
+                out.write(record)
+                count += 1
+            for prefix in range(1, table_size):
+                starts[prefix] += starts[prefix - 1]
+            out.seek(0)
+            out.write(HEADER.pack(MAGIC, 1, digest_size, count))
+            out.write(b"".join(PREFIX_ENTRY.pack(start) for start in starts))
+        os.replace(tmp_path, path)
+    finally:
+        for run in runs:
+            run.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return count
+
+
+class PasswordIndex:
+    def __init__(self, path: str):
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, _, self.digest_size, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a password index")
+        self.hash_type = next(name for name, size in DIGEST_SIZES.items() if size == self.digest_size)
+        self._record_size = self.digest_size + COUNT.size
+        self._table_offset = HEADER.size
+        self._data_offset = HEADER.size + ((1 << PREFIX_BITS) + 1) * PREFIX_ENTRY.size
+
+    def _start(self, prefix: int) -> int:
+        return PREFIX_ENTRY.unpack_from(self._map, self._table_offset + prefix * PREFIX_ENTRY.size)[0]
+
+    def lookup(self, digest: bytes) -> int | None:
+        if len(digest) != self.digest_size:
+            return None
+        prefix = int.from_bytes(digest[:2], "big")
+        low, high = self._start(prefix), self._start(prefix + 1)
+        data, size, mm = self._data_offset, self._record_size, self._map
+        while low < high:
+            middle = (low + high) // 2
+            offset = data + middle * size
+            current = mm[offset:offset + self.digest_size]
+            if current < digest:
+                low = middle + 1
+            elif current > digest:
+                high = middle
+            else:
+                return COUNT.unpack_from(mm, offset + self.digest_size)[0]
+        return None
+
+    def lookup_hex(self, value: str) -> int | None:
+        try:
+            return self.lookup(bytes.fromhex(value.strip()))
+        except ValueError:
+            return None
+
+    def close(self) -> None:
+        self._map.close()
+
+
+@lru_cache(maxsize=8)
+def _open(path: str, mtime_ns: int) -> PasswordIndex:
+    return PasswordIndex(path)
+
+
+def open_index(path: str) -> PasswordIndex:
+    return _open(path, os.stat(path).st_mtime_ns)
@@ -0,0 +1,61 @@
+from typing import Any
+
+ROW_FIELDS = (
+    "org_id",
+    "source",
+    "confidence",
+    "matched_entity",
+    "exposure_types",
+    "raw_snippet",
+    "severity",
+    "dedupe_hash",
+    "metadata",
+    "source_record_id",
+)
+
+
+class FindingRecord:
+    __slots__ = ROW_FIELDS + ("source_payload",)
+
+    def __init__(
+        self,
+        org_id: str,
+        source: str,
+        matched_entity: str,
+        dedupe_hash: str,
+        confidence: int = 50,
+        exposure_types: list[str] | None = None,
+        raw_snippet: str = "",
+        severity: str = "low",
+        metadata: dict[str, Any] | None = None,
+        source_record_id: str | None = None,
+        source_payload: Any = None,
+    ):
+        self.org_id = org_id
+        self.source = source
+        self.matched_entity = matched_entity
+        self.dedupe_hash = dedupe_hash
+        self.confidence = confidence
+        self.exposure_types = exposure_types if exposure_types is not None else []
+        self.raw_snippet = raw_snippet
+        self.severity = severity
+        self.metadata = metadata if metadata is not None else {}
+        self.source_record_id = source_record_id
+        self.source_payload = source_payload
+
+    def as_row(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in ROW_FIELDS}
+
+    def __repr__(self) -> str:
+        return f"FindingRecord(org_id={self.org_id!r}, source={self.source!r}, dedupe_hash={self.dedupe_hash!r})"
+
+
+class Checkpoint:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "CHECKPOINT"
+
+
+# Long scans yield this between findings so the runner can save connector state and renew its lock.
+CHECKPOINT = Checkpoint()
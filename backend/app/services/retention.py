@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.finding import Finding
+from app.models.finding_key import FindingKey
+from app.models.organization import Organization
+from app.services.metrics import record_findings
+from app.services.partitions import add_months, drop_partition, findings_partitions, is_partitioned, month_bound
+
+
+def org_retention(db: Session) -> dict[str, int]:
+    return {
+        org.id: settings.findings_retention_days if org.retention_days is None else org.retention_days
+        for org in db.query(Organization.id, Organization.retention_days).all()
+    }
+
+
+def purge_findings(db: Session, org_id: str, before: datetime, batch_size: int) -> int:
+    purged = 0
+    while True:
+        rows = (
+            db.query(Finding.id, Finding.org_id, Finding.severity, Finding.source, Finding.created_at)
+            .filter(Finding.org_id == org_id, Finding.created_at < before)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return purged
+        # The created_at bound lets Postgres prune the delete to the partitions that hold expired rows.
+        # finding_keys rows stay behind, as with archiving, so exposures a source still reports are not stored again.
+        db.query(Finding).filter(Finding.id.in_([row.id for row in rows]), Finding.created_at < before).delete(
+            synchronize_session=False
+        )
+        record_findings(db, [(row.org_id, row.severity, row.source, row.created_at) for row in rows], delta=-1)
+        db.commit()
+        purged += len(rows)
+
+
+def prune_finding_keys(db: Session, org_id: str, before: datetime, batch_size: int) -> int:
+    pruned = 0
+    while True:
+        ids = [
+            row.id
+            for row in db.query(FindingKey.id).filter(FindingKey.org_id == org_id, FindingKey.created_at < before).limit(batch_size)
+        ]
+        if not ids:
+            return pruned
+        db.query(FindingKey).filter(FindingKey.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+        pruned += len(ids)
+
+
+def enforce_retention(db: Session, now: datetime | None = None) -> dict:
+    now = now or datetime.now(timezone.utc)
+    retention = org_retention(db)
+    dropped = []
+    # A partition can only go once every org's window has moved past it; 0 means keep forever.
+    if retention and all(retention.values()) and is_partitioned(db):
+        horizon = now - timedelta(days=max(retention.values()))
+        for name, month in findings_partitions(db).items():
+            if month_bound(add_months(month, 1)) <= horizon:
+                drop_partition(db, name)
+                dropped.append(name)
+    purged = {}
+    for org_id, days in retention.items():
+        if days:
+            count = purge_findings(db, org_id, now - timedelta(days=days), settings.retention_batch_size)
+            if count:
+                purged[org_id] = count
+    pruned_keys = {}
+    # Keys outlive their findings so repeats stay quiet; past FINDING_KEY_RETENTION_DAYS an exposure may alert again.
+    # Orgs that keep findings forever keep their keys too, or every live finding would be stored a second time.
+    if settings.finding_key_retention_days:
+        for org_id, days in retention.items():
+            if days:
+                horizon = now - timedelta(days=max(days, settings.finding_key_retention_days))
+                count = prune_finding_keys(db, org_id, horizon, settings.retention_batch_size)
+                if count:
+                    pruned_keys[org_id] = count
+    return {"dropped_partitions": dropped, "purged": purged, "pruned_keys": pruned_keys}
@@ -0,0 +1,53 @@
+import secrets
+import time
+from typing import Iterable
+from redis import Redis
+from app.core.config import settings
+from app.models.connector import Connector
+
+SCHEDULE_KEY = "connector-schedule"
+_random = secrets.SystemRandom()
+
+
+def connector_interval(connector: Connector) -> int:
+    return connector.interval_seconds or settings.connector_default_interval_seconds
+
+
+def next_due(interval: int, now: float) -> float:
+    jitter = interval * settings.scheduler_jitter_ratio
+    return now + interval + _random.uniform(-jitter, jitter)
+
+
+def sync_schedule(redis: Redis, connectors: Iterable[Connector], now: float | None = None) -> None:
+    now = time.time() if now is None else now
+    intervals = {connector.id: connector_interval(connector) for connector in connectors}
+    scheduled = {member.decode() if isinstance(member, bytes) else member for member in redis.zrange(SCHEDULE_KEY, 0, -1)}
+    pipeline = redis.pipeline()
+    stale = scheduled - set(intervals)
+    if stale:
+        pipeline.zrem(SCHEDULE_KEY, *stale)
+    # New connectors get a random first slot within one interval so they do not all fire together.
+    fresh = {connector_id: now + _random.uniform(0, interval) for connector_id, interval in intervals.items() if connector_id not in scheduled}
+    if fresh:
+        pipeline.zadd(SCHEDULE_KEY, fresh, nx=True)
+    pipeline.execute()
+
+
+def claim_due(redis: Redis, intervals: dict[str, int], now: float | None = None, limit: int = 100) -> list[str]:
+    now = time.time() if now is None else now
+    due = [
+        member.decode() if isinstance(member, bytes) else member
+        for member in redis.zrangebyscore(SCHEDULE_KEY, "-inf", now, start=0, num=limit)
+    ]
+    due = [connector_id for connector_id in due if connector_id in intervals]
+    if due:
+        redis.zadd(SCHEDULE_KEY, {connector_id: next_due(intervals[connector_id], now) for connector_id in due}, xx=True)
+    return due
+
+
+def defer(redis: Redis, connector_id: str, until: float) -> None:
+    redis.zadd(SCHEDULE_KEY, {connector_id: until}, xx=True, gt=True)
+
+
+def unschedule(redis: Redis, connector_id: str) -> None:
+    redis.zrem(SCHEDULE_KEY, connector_id)
@@ -0,0 +1,55 @@
+import hashlib
+import json
+from typing import Any, Iterable
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.breach_catalog import BreachCatalogEntry
+from app.models.source_record import SourceRecord
+
+
+def source_record_id(source: str, payload: Any) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{source}:{canonical}".encode()).hexdigest()
+
+
+def upsert_source_records(db: Session, records: dict[str, tuple[str, Any]]) -> None:
+    if not records:
+        return
+    rows = [{"id": record_id, "source": source, "payload": payload} for record_id, (source, payload) in records.items()]
+    table = SourceRecord.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        db.execute(insert(table).on_conflict_do_nothing(index_elements=["id"]), rows)
+        return
+    existing = {row.id for row in db.query(SourceRecord.id).filter(SourceRecord.id.in_(list(records))).all()}
+    rows = [row for row in rows if row["id"] not in existing]
+    if rows:
+        db.execute(table.insert(), rows)
+
+
+def sync_breach_catalog(db: Session, source: str, breaches: Iterable[dict], name_key: str = "Name") -> int:
+    payloads = {breach[name_key]: breach for breach in breaches if breach.get(name_key)}
+    record_ids = {name: source_record_id(source, payload) for name, payload in payloads.items()}
+    upsert_source_records(db, {record_ids[name]: (source, payload) for name, payload in payloads.items()})
+    entries = {entry.name: entry for entry in db.query(BreachCatalogEntry).filter(BreachCatalogEntry.source == source)}
+    changed = 0
+    for name, record_id in record_ids.items():
+        entry = entries.get(name)
+        if entry is None:
+            db.add(BreachCatalogEntry(source=source, name=name, source_record_id=record_id))
+            changed += 1
+        elif entry.source_record_id != record_id:
+            entry.source_record_id = record_id
+            changed += 1
+    db.commit()
+    return changed
+
+
+def load_breach_catalog(db: Session, source: str) -> dict[str, tuple[str, Any]]:
+    rows = (
+        db.query(BreachCatalogEntry.name, SourceRecord.id, SourceRecord.payload)
+        .join(SourceRecord, SourceRecord.id == BreachCatalogEntry.source_record_id)
+        .filter(BreachCatalogEntry.source == source)
+    )
+    return {row.name: (row.id, row.payload) for row in rows}
@@ -0,0 +1,128 @@
+import hashlib
+import re
+from typing import Callable, Iterable, Iterator
+from sqlalchemy.orm import Session
+from app.models.target import Target
+from app.models.target_hash import TargetHash
+from app.services.password_index import is_credential_target
+
+ALGORITHMS = ("md5", "sha1", "sha256")
+HASH_TOKEN = re.compile(r"\b(?:[0-9a-fA-F]{64}|[0-9a-fA-F]{40}|[0-9a-fA-F]{32})\b")
+MAX_TOKEN_LENGTH = 64
+GMAIL_DOMAINS = {"gmail.com", "googlemail.com"}
+LOOKUP_CHUNK_SIZE = 500
+
+
+def _strip_plus_tag(value: str) -> str | None:
+    local, at, domain = value.strip().lower().partition("@")
+    if not at or "+" not in local:
+        return None
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+
+def _gmail_canonical(value: str) -> str | None:
+    local, at, domain = value.strip().lower().partition("@")
+    if not at or domain not in GMAIL_DOMAINS:
+        return None
+    return f"{local.split('+', 1)[0].replace('.', '')}@gmail.com"
+
+
+NORMALIZATIONS: dict[str, Callable[[str], str | None]] = {
+    "raw": lambda value: value,
+    "lower": lambda value: value.strip().lower(),
+    "no_plus_tag": _strip_plus_tag,
+    "gmail_canonical": _gmail_canonical,
+}
+
+
+def target_digests(target: Target) -> dict[str, tuple[str, str]]:
+    digests: dict[str, tuple[str, str]] = {}
+    if is_credential_target(target.target_type):
+        return digests
+    for normalization, normalize in NORMALIZATIONS.items():
+        value = normalize(target.value)
+        if not value:
+            continue
+        for algorithm in ALGORITHMS:
+            digest = hashlib.new(algorithm, value.encode()).hexdigest()
+            digests.setdefault(digest, (algorithm, normalization))
+    return digests
+
+
+def sync_target_hashes(db: Session, target: Target) -> None:
+    db.query(TargetHash).filter(TargetHash.target_id == target.id).delete(synchronize_session=False)
+    db.add_all(
+        TargetHash(org_id=target.org_id, target_id=target.id, digest=digest, algorithm=algorithm, normalization=normalization)
+        for digest, (algorithm, normalization) in target_digests(target).items()
+    )
+
+
+def remove_target_hashes(db: Session, target_id: str) -> None:
+    db.query(TargetHash).filter(TargetHash.target_id == target_id).delete(synchronize_session=False)
+
+
+def rebuild_target_hashes(db: Session, org_id: str) -> int:
+    db.query(TargetHash).filter(TargetHash.org_id == org_id).delete(synchronize_session=False)
+    count = 0
+    for target in db.query(Target).filter(Target.org_id == org_id).yield_per(1000):
+        rows = [
+            {"org_id": org_id, "target_id": target.id, "digest": digest, "algorithm": algorithm, "normalization": normalization}
+            for digest, (algorithm, normalization) in target_digests(target).items()
+        ]
+        db.bulk_insert_mappings(TargetHash, rows)
+        count += len(rows)
+    db.commit()
+    return count
+
+
+def org_digests(db: Session, org_id: str) -> set[str]:
+    return {digest for (digest,) in db.query(TargetHash.digest).filter(TargetHash.org_id == org_id)}
+
+
+def resolve_hashes(db: Session, org_id: str, digests: Iterable[str]) -> dict[str, list[TargetHash]]:
+    digests = list({digest.lower() for digest in digests})
+    resolved: dict[str, list[TargetHash]] = {}
+    for start in range(0, len(digests), LOOKUP_CHUNK_SIZE):
+        rows = db.query(TargetHash).filter(
+            TargetHash.org_id == org_id,
+            TargetHash.digest.in_(digests[start:start + LOOKUP_CHUNK_SIZE]),
+        )
+        for row in rows:
+            resolved.setdefault(row.digest, []).append(row)
+    return resolved
+
+
+def extract_hash_tokens(text: str, context: int = 140) -> dict[str, str]:
+    tokens: dict[str, str] = {}
+    for match in HASH_TOKEN.finditer(text):
+        tokens.setdefault(match.group().lower(), text[max(match.start() - context, 0):match.end() + context])
+    return tokens
+
+
+class HashTokenScanner:
+    def __init__(self, load_digests: Callable[[], set[str]], context: int = 140):
+        self.load_digests = load_digests
+        self.context = context
+        self.digests: set[str] | None = None
+        self.tokens: dict[str, str] = {}
+        self._tail = ""
+
+    def _scan(self, text: str, final: bool) -> None:
+        for match in HASH_TOKEN.finditer(text):
+            # A token touching the end of the buffer may continue in the next chunk.
+            if not final and match.end() == len(text):
+                break
+            if self.digests is None:
+                self.digests = self.load_digests()
+            # Only tokens that are some target's digest are kept, so memory follows matches, not input size.
+            token = match.group().lower()
+            if token in self.digests and token not in self.tokens:
+                self.tokens[token] = text[max(match.start() - self.context, 0):match.end() + self.context]
+
+    def watch(self, chunks: Iterable[str]) -> Iterator[str]:
+        for chunk in chunks:
+            text = self._tail + chunk
+            self._scan(text, final=False)
+            self._tail = text[-(MAX_TOKEN_LENGTH + self.context):]
+            yield chunk
+        self._scan(self._tail, final=True)
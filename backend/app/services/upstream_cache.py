@@ -0,0 +1,42 @@
+import hashlib
+import json
+import logging
+from typing import Any, Iterable
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def cache_scope(credential_scope: str) -> str:
+    return "global" if settings.upstream_cache_scope == "global" else credential_scope
+
+
+def _key(connector_type: str, scope: str, value: str) -> str:
+    digest = hashlib.sha256(value.strip().lower().encode()).hexdigest()
+    return f"upstream-cache:{connector_type}:{scope}:{digest}"
+
+
+def get_many(connector_type: str, scope: str, values: Iterable[str]) -> dict[str, Any]:
+    values = list(dict.fromkeys(values))
+    if not values or settings.upstream_cache_ttl_seconds <= 0:
+        return {}
+    try:
+        raw = get_redis().mget([_key(connector_type, scope, value) for value in values])
+    except RedisError:
+        logger.warning("Upstream cache unavailable, querying %s directly", connector_type)
+        return {}
+    return {value: json.loads(item) for value, item in zip(values, raw) if item is not None}
+
+
+def set_many(connector_type: str, scope: str, payloads: dict[str, Any]) -> None:
+    if not payloads or settings.upstream_cache_ttl_seconds <= 0:
+        return
+    try:
+        pipeline = get_redis().pipeline(transaction=False)
+        for value, payload in payloads.items():
+            pipeline.set(_key(connector_type, scope, value), json.dumps(payload), ex=settings.upstream_cache_ttl_seconds)
+        pipeline.execute()
+    except RedisError:
+        logger.warning("Upstream cache unavailable, results for %s not cached", connector_type)
@@ -5,12 +5,21 @@ celery_app = Celery(
     "darkweb_guard",
     broker=settings.redis_url,
     backend=settings.redis_url,
+    include=["app.workers.tasks"],
 )
 
 celery_app.conf.beat_schedule = {
-    "run-connectors": {
-        "task": "app.workers.tasks.run_connectors",
-        "schedule": 60 * 60 * 6,
+    "dispatch-due-connectors": {
+        "task": "app.workers.tasks.dispatch_due_connectors",
+        "schedule": settings.scheduler_tick_seconds,
+    },
+    "sync-hibp-catalog": {
+        "task": "app.workers.tasks.sync_hibp_catalog",
+        "schedule": 60 * 60 * 24,
+    },
+    "maintain-findings-partitions": {
+        "task": "app.workers.tasks.maintain_findings_partitions",
+        "schedule": 60 * 60 * 24,
     },
     "run-alerts": {
         "task": "app.workers.tasks.run_alerts",
@@ -1,51 +1,267 @@
+import copy
 import logging
-from celery import shared_task
+from typing import Any, Iterable, Iterator, TypeVar
+from celery import chord, shared_task
+from redis.exceptions import LockError, RedisError
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.redis import get_redis
 from app.db.session import SessionLocal
 from app.models.connector import Connector
 from app.models.target import Target
 from app.models.finding import Finding
+from app.models.finding_key import FindingKey
 from app.models.alert_rule import AlertRule
-from app.services.connectors import get_connector
+from app.services.archive import archive_aged_findings
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.connectors import ConnectorAuthError, connector_targets, get_connector
+from app.services.dedupe_filter import remember
+from app.services.metrics import record_findings
+from app.services.partitions import ensure_partitions
+from app.services.records import CHECKPOINT, FindingRecord
+from app.services.retention import enforce_retention
+from app.services.scheduler import claim_due, connector_interval, defer, sync_schedule
+from app.services.http_client import HttpClient, current_connector
+from app.services.source_catalog import sync_breach_catalog, upsert_source_records
 from app.services.alerts import send_alert, send_test_alert
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def _store_findings(db: Session, findings: list[Finding]) -> int:
-    stored = 0
+INSERT_CHUNK_SIZE = 1000
+FINDING_COLUMN_DEFAULTS = {
+    "org_id": None,
+    "source": None,
+    "confidence": 50,
+    "matched_entity": None,
+    "exposure_types": [],
+    "raw_snippet": "",
+    "severity": "low",
+    "dedupe_hash": None,
+    "metadata": {},
+    "source_record_id": None,
+}
+
+
+def _finding_row(finding: FindingRecord | Finding) -> dict:
+    if isinstance(finding, FindingRecord):
+        return finding.as_row()
+    row = {}
+    for column, default in FINDING_COLUMN_DEFAULTS.items():
+        value = getattr(finding, column)
+        row[column] = default if value is None else value
+    return row
+
+
+def _insert_chunk(db: Session, rows: list[dict]) -> list[tuple]:
+    table = Finding.__table__
+    keys = FindingKey.__table__
+    dialect = db.get_bind().dialect.name
+    # Partitioned findings cannot carry a unique (org_id, dedupe_hash) index, so finding_keys owns dedupe.
+    pairs = [{"org_id": row["org_id"], "dedupe_hash": row["dedupe_hash"]} for row in rows]
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = (
+            insert(keys)
+            .on_conflict_do_nothing(index_elements=["org_id", "dedupe_hash"])
+            .returning(keys.c.org_id, keys.c.dedupe_hash)
+        )
+        fresh = {tuple(row) for row in db.execute(stmt, pairs).all()}
+    else:
+        existing = set(
+            db.query(FindingKey.org_id, FindingKey.dedupe_hash)
+            .filter(tuple_(FindingKey.org_id, FindingKey.dedupe_hash).in_([(pair["org_id"], pair["dedupe_hash"]) for pair in pairs]))
+            .all()
+        )
+        pairs = [pair for pair in pairs if (pair["org_id"], pair["dedupe_hash"]) not in existing]
+        if pairs:
+            db.execute(keys.insert(), pairs)
+        fresh = {(pair["org_id"], pair["dedupe_hash"]) for pair in pairs}
+    rows = [row for row in rows if (row["org_id"], row["dedupe_hash"]) in fresh]
+    if not rows:
+        return []
+    if dialect in ("postgresql", "sqlite"):
+        stmt = table.insert().returning(table.c.org_id, table.c.severity, table.c.source, table.c.created_at)
+        return [tuple(row) for row in db.execute(stmt, rows).all()]
+    db.execute(table.insert(), rows)
+    return [(row["org_id"], row["severity"], row["source"], None) for row in rows]
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    batch: list[T] = []
+    for item in items:
+        # A checkpoint closes the batch even when it is empty, so scans without hits still save progress.
+        if item is CHECKPOINT:
+            yield batch
+            batch = []
+            continue
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _store_findings(db: Session, findings: list[FindingRecord | Finding]) -> int:
+    rows: dict[tuple[str, str], dict] = {}
+    source_records: dict[str, tuple[str, Any]] = {}
     for finding in findings:
-        exists = db.query(Finding).filter(Finding.dedupe_hash == finding.dedupe_hash).first()
-        if exists:
+        row = _finding_row(finding)
+        # A dedupe filter hit is only probable, so every row goes through the finding_keys conflict check.
+        if (row["org_id"], row["dedupe_hash"]) in rows:
             continue
-        db.add(finding)
-        stored += 1
+        rows[(row["org_id"], row["dedupe_hash"])] = row
+        if isinstance(finding, FindingRecord) and finding.source_record_id and finding.source_payload is not None:
+            source_records[finding.source_record_id] = (finding.source, finding.source_payload)
+    upsert_source_records(db, source_records)
+    batch = list(rows.values())
+    inserted = []
+    for start in range(0, len(batch), INSERT_CHUNK_SIZE):
+        inserted += _insert_chunk(db, batch[start:start + INSERT_CHUNK_SIZE])
+    record_findings(db, inserted)
     db.commit()
-    return stored
+    hashes_by_org: dict[str, list[str]] = {}
+    for org_id, dedupe_hash in rows:
+        hashes_by_org.setdefault(org_id, []).append(dedupe_hash)
+    for org_id, dedupe_hashes in hashes_by_org.items():
+        remember(org_id, dedupe_hashes)
+    return len(inserted)
 
 
 @shared_task(name="app.workers.tasks.run_connectors")
 def run_connectors() -> dict:
     db = SessionLocal()
-    results = {}
     try:
-        connectors = db.query(Connector).filter(Connector.is_active.is_(True)).all()
-        for connector in connectors:
+        connector_ids = [row.id for row in db.query(Connector.id).filter(Connector.is_active.is_(True)).all()]
+    finally:
+        db.close()
+    _dispatch(connector_ids)
+    return {"dispatched": len(connector_ids)}
+
+
+@shared_task(name="app.workers.tasks.dispatch_due_connectors")
+def dispatch_due_connectors() -> dict:
+    redis = get_redis()
+    lock = redis.lock("connector-scheduler", timeout=settings.scheduler_tick_seconds)
+    if not lock.acquire(blocking=False):
+        return {"dispatched": 0}
+    try:
+        db = SessionLocal()
+        try:
+            connectors = db.query(Connector.id, Connector.interval_seconds).filter(Connector.is_active.is_(True)).all()
+        finally:
+            db.close()
+        sync_schedule(redis, connectors)
+        due = claim_due(redis, {connector.id: connector_interval(connector) for connector in connectors})
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("Scheduler lock expired before release")
+    _dispatch(due)
+    return {"dispatched": len(due)}
+
+
+def _dispatch(connector_ids: list[str]) -> None:
+    if connector_ids:
+        chord(run_connector.s(connector_id) for connector_id in connector_ids)(collect_connector_results.s())
+
+
+@shared_task(name="app.workers.tasks.run_connector")
+def run_connector(connector_id: str) -> tuple[str, int | str]:
+    lock = get_redis().lock(f"connector-lock:{connector_id}", timeout=settings.connector_lock_timeout_seconds)
+    if not lock.acquire(blocking=False):
+        logger.info("Connector %s is still running, skipping", connector_id)
+        return connector_id, "skipped"
+    db = SessionLocal()
+    context = current_connector.set(connector_id)
+    try:
+        connector = db.query(Connector).filter(Connector.id == connector_id).first()
+        if not connector or not connector.is_active:
+            return connector_id, "skipped"
+        try:
+            handler = get_connector(connector.connector_type)
+            targets = connector_targets(handler, db.query(Target).filter(Target.org_id == connector.org_id).all())
+            state = copy.deepcopy(connector.state or {})
+            findings = handler.iter_fetch(targets, {**connector.config, "org_id": connector.org_id}, connector.secrets, state)
+            stored = 0
+            for batch in _batched(findings, settings.ingest_batch_size):
+                if handler.checkpoint_state:
+                    connector.state = copy.deepcopy(state)
+                stored += _store_findings(db, batch)
+                lock.reacquire()
+            connector.state = state
+            connector.last_run_status = f"stored:{stored}"
+            result: int | str = stored
+        except CircuitOpenError as exc:
+            logger.warning("Connector %s deferred: %s", connector.id, exc)
+            db.rollback()
+            connector.last_run_status = "circuit_open"
+            result = "circuit_open"
             try:
-                targets = db.query(Target).filter(Target.org_id == connector.org_id).all()
-                handler = get_connector(connector.connector_type)
-                findings = handler.fetch(targets, {**connector.config, "org_id": connector.org_id}, connector.secrets)
-                stored = _store_findings(db, findings)
-                results[connector.id] = stored
-                connector.last_run_status = f"stored:{stored}"
-            except Exception:
-                logger.exception("Connector %s failed", connector.id)
-                connector.last_run_status = "error"
-                results[connector.id] = "error"
+                defer(get_redis(), connector.id, exc.retry_at)
+            except RedisError:
+                logger.warning("Scheduler unavailable, connector %s not deferred", connector.id)
+        except ConnectorAuthError:
+            logger.warning("Connector %s credentials were rejected, stopping run", connector.id)
+            db.rollback()
+            connector.last_run_status = "auth_error"
+            result = "auth_error"
+        except Exception:
+            logger.exception("Connector %s failed", connector.id)
+            db.rollback()
+            connector.last_run_status = "error"
+            result = "error"
         db.commit()
+        return connector_id, result
     finally:
+        current_connector.reset(context)
         db.close()
-    return results
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("Lock for connector %s expired before release", connector_id)
+
+
+@shared_task(name="app.workers.tasks.collect_connector_results")
+def collect_connector_results(results: list) -> dict:
+    return {connector_id: result for connector_id, result in results}
+
+
+@shared_task(name="app.workers.tasks.sync_hibp_catalog")
+def sync_hibp_catalog() -> dict:
+    client = HttpClient(scope="hibp-catalog")
+    resp = client.get(settings.hibp_catalog_url, headers={"user-agent": "darkweb-guard"})
+    resp.raise_for_status()
+    breaches = resp.json()
+    db = SessionLocal()
+    try:
+        changed = sync_breach_catalog(db, "hibp", breaches)
+    finally:
+        db.close()
+    return {"breaches": len(breaches), "changed": changed}
+
+
+@shared_task(name="app.workers.tasks.maintain_findings_partitions")
+def maintain_findings_partitions() -> dict:
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(db, settings.findings_partition_months_ahead)
+        archived = archive_aged_findings(db)
+        result = enforce_retention(db)
+    finally:
+        db.close()
+    return {
+        "created_partitions": created,
+        "archived": archived["archived"],
+        "purged": result["purged"],
+        "pruned_keys": result["pruned_keys"],
+        "dropped_partitions": archived["dropped_partitions"] + result["dropped_partitions"],
+    }
 
 
 @shared_task(name="app.workers.tasks.run_alerts")
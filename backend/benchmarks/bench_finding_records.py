@@ -0,0 +1,50 @@
+import argparse
+import hashlib
+import time
+import tracemalloc
+from typing import Callable
+from app.models.finding import Finding
+from app.services.records import FindingRecord
+from app.workers.tasks import _finding_row
+
+
+def _fields(i: int) -> dict:
+    return {
+        "org_id": "org-1",
+        "source": "hibp",
+        "confidence": 90,
+        "matched_entity": f"user{i}@acme.io",
+        "exposure_types": ["email", "password"],
+        "raw_snippet": f"HIBP breach Example affecting user{i}@acme.io",
+        "severity": "high",
+        "dedupe_hash": hashlib.sha256(f"hibp-user{i}@acme.io-Example".encode()).hexdigest(),
+        "metadata": {"breach": "Example"},
+    }
+
+
+def _measure(label: str, build: Callable[[dict], object], count: int) -> None:
+    payloads = [_fields(i) for i in range(count)]
+    tracemalloc.start()
+    started = time.perf_counter()
+    items = [build(payload) for payload in payloads]
+    built = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    rows = [_finding_row(item) for item in items]
+    converted = time.perf_counter() - started
+    tracemalloc.stop()
+    assert len(rows) == count
+    rate = count / (built + converted)
+    print(f"{label:<14} build {built:.3f}s  to-rows {converted:.3f}s  {rate:,.0f} items/s  peak {peak / 1024 / 1024:.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare ORM Finding objects with slotted FindingRecord")
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+    _measure("orm Finding", lambda payload: Finding(**payload), args.count)
+    _measure("FindingRecord", lambda payload: FindingRecord(**payload), args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import random
+import string
+import time
+from app.services.matcher import TargetMatcher
+
+
+def _random_email(rng: random.Random) -> str:
+    user = "".join(rng.choices(string.ascii_lowercase + string.digits, k=10))
+    domain = "".join(rng.choices(string.ascii_lowercase, k=8))
+    return f"{user}@{domain}.com"
+
+
+def substring_loop(values: list[str], content: str) -> set[str]:
+    return {value for value in values if value.lower() in content.lower()}
+
+
+def automaton(matcher: TargetMatcher, content: str) -> set[str]:
+    return set(matcher.first_matches(content))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the Aho-Corasick matcher with the substring loop")
+    parser.add_argument("--targets", type=int, default=2000)
+    parser.add_argument("--content-kb", type=int, default=512)
+    parser.add_argument("--hits", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = [_random_email(rng) for _ in range(args.targets)]
+    words = ["".join(rng.choices(string.ascii_letters, k=rng.randint(2, 9))) for _ in range(5000)]
+    tokens: list[str] = []
+    size = 0
+    while size < args.content_kb * 1024:
+        word = rng.choice(words)
+        tokens.append(word)
+        size += len(word) + 1
+    for value in rng.sample(values, min(args.hits, len(values))):
+        tokens.insert(rng.randrange(len(tokens)), value.upper())
+    content = " ".join(tokens)
+
+    started = time.perf_counter()
+    matcher = TargetMatcher(values)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    expected = substring_loop(values, content)
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    found = automaton(matcher, content)
+    scan_seconds = time.perf_counter() - started
+
+    assert found == expected, "matcher and substring loop disagree"
+    print(f"targets={args.targets} content={len(content)} chars hits={len(found)}")
+    print(f"substring loop: {loop_seconds:.3f}s")
+    print(f"aho-corasick:   {scan_seconds:.3f}s (+{build_seconds:.3f}s build)")
+    print(f"speedup:        {loop_seconds / max(scan_seconds, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""connector state
+
+Revision ID: 0002_connector_state
+Revises: 0001_initial
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_connector_state"
+revision_id = revision
+revises = "0001_initial"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("connectors", sa.Column("state", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("connectors", "state")
@@ -0,0 +1,31 @@
+"""findings org dedupe
+
+Revision ID: 0003_findings_org_dedupe
+Revises: 0002_connector_state
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+
+revision = "0003_findings_org_dedupe"
+revision_id = revision
+revises = "0002_connector_state"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM findings f
+        USING findings keep
+        WHERE f.org_id = keep.org_id
+          AND f.dedupe_hash = keep.dedupe_hash
+          AND (f.created_at, f.id) > (keep.created_at, keep.id)
+        """
+    )
+    op.create_index("uq_findings_org_id_dedupe_hash", "findings", ["org_id", "dedupe_hash"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_findings_org_id_dedupe_hash", table_name="findings")
@@ -0,0 +1,102 @@
+"""source records catalog
+
+Revision ID: 0004_source_records
+Revises: 0003_findings_org_dedupe
+Create Date: 2026-10-18 00:00:00.000000
+"""
+import hashlib
+import json
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0004_source_records"
+revision_id = revision
+revises = "0003_findings_org_dedupe"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+PAYLOAD_KEYS = {"hibp": ("breach", "Name"), "dehashed": ("entry", "id")}
+
+findings = sa.table(
+    "findings",
+    sa.column("id", sa.String()),
+    sa.column("source", sa.String()),
+    sa.column("metadata", sa.JSON()),
+    sa.column("source_record_id", sa.String()),
+)
+source_records = sa.table(
+    "source_records",
+    sa.column("id", sa.String()),
+    sa.column("source", sa.String()),
+    sa.column("payload", sa.JSON()),
+)
+
+
+def _record_id(source: str, payload) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{source}:{canonical}".encode()).hexdigest()
+
+
+def upgrade() -> None:
+    op.create_table(
+        "source_records",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), default=dict),
+    )
+    op.add_column("findings", sa.Column("source_record_id", sa.String(), sa.ForeignKey("source_records.id"), nullable=True))
+    op.create_index("ix_findings_source_record_id", "findings", ["source_record_id"])
+
+    conn = op.get_bind()
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            sa.select(findings.c.id, findings.c.source, findings.c.metadata)
+            .where(findings.c.source.in_(list(PAYLOAD_KEYS)), findings.c.id > last_id)
+            .order_by(findings.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        records = {}
+        updates = []
+        for row in rows:
+            key, slim_key = PAYLOAD_KEYS[row.source]
+            payload = (row.metadata or {}).get(key)
+            if not isinstance(payload, dict):
+                continue
+            record_id = _record_id(row.source, payload)
+            records[record_id] = {"id": record_id, "source": row.source, "payload": payload}
+            slim_name = "breach" if row.source == "hibp" else "entry_id"
+            updates.append({"b_id": row.id, "b_record": record_id, "b_metadata": {slim_name: payload.get(slim_key)}})
+        if records:
+            conn.execute(postgresql.insert(source_records).on_conflict_do_nothing(index_elements=["id"]), list(records.values()))
+        if updates:
+            conn.execute(
+                findings.update()
+                .where(findings.c.id == sa.bindparam("b_id"))
+                .values(source_record_id=sa.bindparam("b_record"), metadata=sa.bindparam("b_metadata", type_=sa.JSON())),
+                updates,
+            )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE findings f
+        SET metadata = json_build_object(
+            CASE WHEN f.source = 'hibp' THEN 'breach' ELSE 'entry' END, s.payload
+        )
+        FROM source_records s
+        WHERE f.source_record_id = s.id
+        """
+    )
+    op.drop_index("ix_findings_source_record_id", table_name="findings")
+    op.drop_column("findings", "source_record_id")
+    op.drop_table("source_records")
@@ -0,0 +1,33 @@
+"""breach catalog
+
+Revision ID: 0005_breach_catalog
+Revises: 0004_source_records
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_breach_catalog"
+revision_id = revision
+revises = "0004_source_records"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "breach_catalog",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("source_record_id", sa.String(), sa.ForeignKey("source_records.id"), nullable=False),
+    )
+    op.create_index("uq_breach_catalog_source_name", "breach_catalog", ["source", "name"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_breach_catalog_source_name", table_name="breach_catalog")
+    op.drop_table("breach_catalog")
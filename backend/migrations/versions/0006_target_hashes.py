@@ -0,0 +1,37 @@
+"""target hashes
+
+Revision ID: 0006_target_hashes
+Revises: 0005_breach_catalog
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_target_hashes"
+revision_id = revision
+revises = "0005_breach_catalog"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "target_hashes",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("org_id", sa.String(), sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("target_id", sa.String(), sa.ForeignKey("targets.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("digest", sa.String(), nullable=False),
+        sa.Column("algorithm", sa.String(), nullable=False),
+        sa.Column("normalization", sa.String(), nullable=False),
+    )
+    op.create_index("ix_target_hashes_org_id_digest", "target_hashes", ["org_id", "digest"])
+    op.create_index("ix_target_hashes_target_id", "target_hashes", ["target_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_target_hashes_target_id", table_name="target_hashes")
+    op.drop_index("ix_target_hashes_org_id_digest", table_name="target_hashes")
+    op.drop_table("target_hashes")
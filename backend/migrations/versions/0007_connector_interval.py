@@ -0,0 +1,23 @@
+"""connector interval
+
+Revision ID: 0007_connector_interval
+Revises: 0006_target_hashes
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_connector_interval"
+revision_id = revision
+revises = "0006_target_hashes"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("connectors", sa.Column("interval_seconds", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("connectors", "interval_seconds")
@@ -0,0 +1,23 @@
+"""findings keyset index
+
+Revision ID: 0008_findings_keyset_index
+Revises: 0007_connector_interval
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008_findings_keyset_index"
+revision_id = revision
+revises = "0007_connector_interval"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_findings_org_id_created_at_id", "findings", ["org_id", sa.text("created_at DESC"), "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_findings_org_id_created_at_id", table_name="findings")
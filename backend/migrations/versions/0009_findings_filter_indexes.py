@@ -0,0 +1,45 @@
+"""findings filter indexes
+
+Revision ID: 0009_findings_filter_indexes
+Revises: 0008_findings_keyset_index
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0009_findings_filter_indexes"
+revision_id = revision
+revises = "0008_findings_keyset_index"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rewrites every row as JSONB; rows with a NULL or non-array value are normalized to [].
+    op.alter_column(
+        "findings",
+        "exposure_types",
+        type_=postgresql.JSONB(),
+        postgresql_using=(
+            "CASE WHEN json_typeof(exposure_types) = 'array' THEN exposure_types::jsonb ELSE '[]'::jsonb END"
+        ),
+    )
+    op.execute("UPDATE findings SET exposure_types = '[]'::jsonb WHERE exposure_types IS NULL")
+    op.create_index(
+        "ix_findings_exposure_types",
+        "findings",
+        ["exposure_types"],
+        postgresql_using="gin",
+        postgresql_ops={"exposure_types": "jsonb_path_ops"},
+    )
+    op.create_index("ix_findings_org_id_severity_created_at", "findings", ["org_id", "severity", sa.text("created_at DESC")])
+    op.create_index("ix_findings_org_id_source_created_at", "findings", ["org_id", "source", sa.text("created_at DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_findings_org_id_source_created_at", table_name="findings")
+    op.drop_index("ix_findings_org_id_severity_created_at", table_name="findings")
+    op.drop_index("ix_findings_exposure_types", table_name="findings")
+    op.alter_column("findings", "exposure_types", type_=sa.JSON(), postgresql_using="exposure_types::json")
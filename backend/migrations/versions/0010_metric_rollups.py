@@ -0,0 +1,62 @@
+"""metric rollups
+
+Revision ID: 0010_metric_rollups
+Revises: 0009_findings_filter_indexes
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_metric_rollups"
+revision_id = revision
+revises = "0009_findings_filter_indexes"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metric_rollups",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("org_id", sa.String(), sa.ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("metric", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("severity", sa.String(), nullable=False, server_default=""),
+        sa.Column("source", sa.String(), nullable=False, server_default=""),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "uq_metric_rollups_key", "metric_rollups", ["org_id", "metric", "day", "severity", "source"], unique=True
+    )
+    op.execute(
+        """
+        INSERT INTO metric_rollups (id, org_id, metric, day, severity, source, count)
+        SELECT md5(org_id || ':findings:' || day || ':' || severity || ':' || source), org_id, 'findings', day, severity, source, count
+        FROM (
+            SELECT org_id, date(timezone('UTC', created_at)) AS day, coalesce(severity, '') AS severity,
+                   coalesce(source, '') AS source, count(*) AS count
+            FROM findings
+            GROUP BY 1, 2, 3, 4
+        ) AS grouped
+        """
+    )
+    for metric, table in (("connectors", "connectors"), ("alert_rules", "alert_rules")):
+        op.execute(
+            f"""
+            INSERT INTO metric_rollups (id, org_id, metric, day, severity, source, count)
+            SELECT md5(org_id || ':{metric}:' || day), org_id, '{metric}', day, '', '', count
+            FROM (
+                SELECT org_id, date(timezone('UTC', created_at)) AS day, count(*) AS count
+                FROM {table}
+                GROUP BY 1, 2
+            ) AS grouped
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_metric_rollups_key", table_name="metric_rollups")
+    op.drop_table("metric_rollups")
@@ -0,0 +1,137 @@
+"""findings monthly partitions
+
+Revision ID: 0011_findings_partitions
+Revises: 0010_metric_rollups
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from datetime import date, datetime, timezone
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011_findings_partitions"
+revision_id = revision
+revises = "0010_metric_rollups"
+down_revision = revises
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+COLUMNS = (
+    "id, created_at, updated_at, org_id, source, confidence, matched_entity, exposure_types, "
+    "raw_snippet, severity, dedupe_hash, metadata, source_record_id"
+)
+OLD_INDEXES = (
+    "uq_findings_org_id_dedupe_hash",
+    "ix_findings_org_id",
+    "ix_findings_dedupe_hash",
+    "ix_findings_source_record_id",
+    "ix_findings_org_id_created_at_id",
+    "ix_findings_org_id_severity_created_at",
+    "ix_findings_org_id_source_created_at",
+    "ix_findings_exposure_types",
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc).isoformat()
+
+
+def _create_table(partitioned: bool) -> None:
+    primary_key = "PRIMARY KEY (id, created_at)" if partitioned else "PRIMARY KEY (id)"
+    op.execute(
+        f"""
+        CREATE TABLE findings (
+            id VARCHAR NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            org_id VARCHAR NOT NULL REFERENCES organizations (id),
+            source VARCHAR NOT NULL,
+            confidence INTEGER,
+            matched_entity VARCHAR NOT NULL,
+            exposure_types JSONB,
+            raw_snippet VARCHAR NOT NULL,
+            severity VARCHAR,
+            dedupe_hash VARCHAR NOT NULL,
+            metadata JSON,
+            source_record_id VARCHAR REFERENCES source_records (id),
+            {primary_key}
+        ){" PARTITION BY RANGE (created_at)" if partitioned else ""}
+        """
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_findings_org_id", "findings", ["org_id"])
+    op.create_index("ix_findings_dedupe_hash", "findings", ["dedupe_hash"])
+    op.create_index("ix_findings_source_record_id", "findings", ["source_record_id"])
+    op.create_index("ix_findings_org_id_created_at_id", "findings", ["org_id", sa.text("created_at DESC"), "id"])
+    op.create_index("ix_findings_org_id_severity_created_at", "findings", ["org_id", "severity", sa.text("created_at DESC")])
+    op.create_index("ix_findings_org_id_source_created_at", "findings", ["org_id", "source", sa.text("created_at DESC")])
+    op.create_index(
+        "ix_findings_exposure_types",
+        "findings",
+        ["exposure_types"],
+        postgresql_using="gin",
+        postgresql_ops={"exposure_types": "jsonb_path_ops"},
+    )
+
+
+def _retire_old_table() -> None:
+    op.execute("ALTER TABLE findings RENAME TO findings_old")
+    op.execute("ALTER TABLE findings_old RENAME CONSTRAINT findings_pkey TO findings_old_pkey")
+    for name in OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    op.add_column("organizations", sa.Column("retention_days", sa.Integer(), nullable=True))
+    op.create_table(
+        "finding_keys",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("org_id", sa.String(), sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("dedupe_hash", sa.String(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO finding_keys (id, created_at, org_id, dedupe_hash) SELECT id, created_at, org_id, dedupe_hash FROM findings"
+    )
+    op.create_index("uq_finding_keys_org_id_dedupe_hash", "finding_keys", ["org_id", "dedupe_hash"], unique=True)
+
+    _retire_old_table()
+    _create_table(partitioned=True)
+    bind = op.get_bind()
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM findings_old")).scalar()
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = min(oldest.astimezone(timezone.utc).date().replace(day=1), current) if oldest else current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        op.execute(
+            f"CREATE TABLE findings_p{month:%Y_%m} PARTITION OF findings "
+            f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(_add_months(month, 1))}')"
+        )
+        month = _add_months(month, 1)
+    # Catches rows outside the monthly ranges so inserts never fail on a missing partition.
+    op.execute("CREATE TABLE findings_default PARTITION OF findings DEFAULT")
+    op.execute(
+        f"INSERT INTO findings ({COLUMNS}) "
+        f"SELECT {COLUMNS.replace('created_at', 'coalesce(created_at, now())', 1)} FROM findings_old"
+    )
+    op.execute("DROP TABLE findings_old")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    _retire_old_table()
+    _create_table(partitioned=False)
+    op.execute(f"INSERT INTO findings ({COLUMNS}) SELECT {COLUMNS} FROM findings_old")
+    op.execute("DROP TABLE findings_old")
+    _create_indexes()
+    op.create_index("uq_findings_org_id_dedupe_hash", "findings", ["org_id", "dedupe_hash"], unique=True)
+    op.drop_index("uq_finding_keys_org_id_dedupe_hash", table_name="finding_keys")
+    op.drop_table("finding_keys")
+    op.drop_column("organizations", "retention_days")
@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from app.models.finding import Finding
+from app.models.finding_key import FindingKey
+from app.services import archive
+from app.services.archive import archive_findings, query_archive
+from app.services.metrics import rebuild_rollups, summarize
+from app.services.records import FindingRecord
+from app.workers.tasks import _store_findings
+
+
+def test_archive_exports_aged_findings_and_queries_them(db_session, tmp_path, monkeypatch):
+    org_id = str(uuid.uuid4())
+    severities = ["high", "low", "high", "medium"]
+    _store_findings(
+        db_session,
+        [
+            FindingRecord(
+                org_id=org_id,
+                source="hibp",
+                matched_entity=f"user{index}@acme.io",
+                dedupe_hash=f"archive-{index}",
+                severity=severity,
+                metadata={"index": index},
+            )
+            for index, severity in enumerate(severities)
+        ],
+    )
+    for index, created_at in enumerate(
+        [datetime(2026, 1, 5), datetime(2026, 1, 20), datetime(2026, 2, 3), datetime.now(timezone.utc)]
+    ):
+        db_session.query(Finding).filter(Finding.dedupe_hash == f"archive-{index}").update(
+            {Finding.created_at: created_at}, synchronize_session=False
+        )
+    db_session.commit()
+    rebuild_rollups(db_session, org_id)
+
+    before = datetime.now(timezone.utc) - timedelta(days=30)
+    assert archive_findings(db_session, str(tmp_path), org_id, before, batch_size=2) == 3
+    assert [finding.dedupe_hash for finding in db_session.query(Finding).filter(Finding.org_id == org_id)] == ["archive-3"]
+    assert db_session.query(FindingKey).filter(FindingKey.org_id == org_id).count() == 4
+    assert summarize(db_session, org_id, days=7)["findings"] == 1
+    assert sorted(path.name for path in tmp_path.glob(f"org_id={org_id}/*")) == ["month=2026-01", "month=2026-02"]
+
+    rows = query_archive(str(tmp_path), org_id)
+    assert [row["dedupe_hash"] for row in rows] == ["archive-2", "archive-1", "archive-0"]
+    assert rows[0]["metadata"] == {"index": 2}
+    assert rows[0]["org_id"] == org_id
+    high = query_archive(str(tmp_path), org_id, severities=["high"], since=datetime(2026, 1, 10))
+    assert [row["dedupe_hash"] for row in high] == ["archive-2"]
+    january = query_archive(str(tmp_path), org_id, until=datetime(2026, 2, 1), limit=1)
+    assert [row["dedupe_hash"] for row in january] == ["archive-1"]
+    assert query_archive(str(tmp_path), str(uuid.uuid4())) == []
+
+    other = tmp_path / f"org_id={uuid.uuid4()}" / "month=2026-01"
+    other.mkdir(parents=True)
+    (other / "part-x.parquet").write_bytes(b"not parquet")
+    roots = []
+    dataset = archive.ds.dataset
+    monkeypatch.setattr(archive.ds, "dataset", lambda source, **kwargs: roots.append(source) or dataset(source, **kwargs))
+    assert len(query_archive(str(tmp_path), org_id)) == 3
+    assert roots == [tmp_path / f"org_id={org_id}"]
@@ -0,0 +1,79 @@
+import pytest
+from app.core.config import settings
+from app.services import circuit_breaker
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes: dict[str, dict] = {}
+        self.strings: dict[str, object] = {}
+        self.results: list = []
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        results, self.results = self.results, []
+        return results
+
+    def hgetall(self, key):
+        value = dict(self.hashes.get(key, {}))
+        self.results.append(value)
+        return value
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        self.hashes.setdefault(key, {}).update(mapping or {field: value})
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = int(bucket.get(field, 0)) + amount
+        self.results.append(bucket[field])
+
+    def expire(self, key, seconds):
+        self.results.append(True)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.strings.pop(key, None)
+
+
+@pytest.fixture()
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(circuit_breaker, "get_redis", lambda: fake)
+    monkeypatch.setattr(settings, "circuit_min_requests", 4)
+    monkeypatch.setattr(settings, "circuit_cooldown_seconds", 60)
+    return fake
+
+
+def test_breaker_opens_on_failure_ratio_and_probes_half_open(redis, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "time", lambda: clock[0])
+    breaker = CircuitBreaker("api.example.com", "scope")
+    for success in (True, False, False, False):
+        breaker.before_request()
+        breaker.record(success)
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_request()
+    assert raised.value.retry_at == 1060.0
+
+    clock[0] = 1061.0
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record(False)
+    assert float(redis.hashes[breaker.key]["cooldown"]) == 120.0
+
+    clock[0] = 1182.0
+    breaker.before_request()
+    breaker.record(True)
+    assert breaker.key not in redis.hashes
+    breaker.before_request()
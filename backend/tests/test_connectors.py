@@ -0,0 +1,49 @@
+from app.models.target import Target
+from app.services.connectors import (
+    BaseConnector,
+    _dehashed_term,
+    _entry_tokens,
+    _pack_queries,
+    connector_targets,
+    get_connector,
+)
+from app.services.records import FindingRecord
+
+
+def _target(target_type: str, value: str) -> Target:
+    return Target(org_id="org", target_type=target_type, value=value)
+
+
+def test_pack_queries_respects_max_length():
+    targets = [_target("email", f"user{i}@acme.io") for i in range(50)]
+    groups = _pack_queries(targets, 200)
+    assert [target for group in groups for target in group] == targets
+    for group in groups:
+        assert len(" OR ".join(_dehashed_term(target) for target in group)) <= 200
+
+
+def test_entry_tokens_cover_list_fields_and_email_domains():
+    tokens = _entry_tokens({"email": ["Alice@Acme.io"], "username": "alice", "password": "hunter2"})
+    assert tokens == {"alice@acme.io", "acme.io", "alice"}
+
+
+class LegacyConnector(BaseConnector):
+    name = "legacy"
+
+    def fetch(self, targets, config, secrets):
+        return [
+            FindingRecord(org_id="org", source=self.name, matched_entity=target.value, dedupe_hash=target.value)
+            for target in targets
+        ]
+
+
+def test_iter_fetch_supports_legacy_three_argument_fetch():
+    records = list(LegacyConnector().iter_fetch([_target("email", "a@acme.io")], {}, {}, {"cursor": 1}))
+    assert [record.matched_entity for record in records] == ["a@acme.io"]
+
+
+def test_credential_targets_only_reach_password_connectors():
+    targets = [_target("email", "a@acme.io"), _target("password_hash", "5BAA61E4"), _target("password_ntlm", "8846F7EA")]
+    for connector_type in ("dehashed", "rss", "public_paste", "file_dump", "hibp"):
+        assert connector_targets(get_connector(connector_type), targets) == targets[:1]
+    assert connector_targets(get_connector("pwned_passwords"), targets) == targets
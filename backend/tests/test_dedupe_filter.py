@@ -0,0 +1,89 @@
+import uuid
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models.finding_key import FindingKey
+from app.services import connectors, dedupe_filter
+from app.services.dedupe_filter import BloomFilter, remember
+from app.services.records import FindingRecord
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    values = [f"hash-{i}" for i in range(1000)]
+    for value in values:
+        bloom.add(value)
+    assert all(value in bloom for value in values)
+
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"known-{i}")
+    false_positives = sum(f"unknown-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_round_trips_through_bytes():
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+    bloom.add("abc")
+    restored = BloomFilter(capacity=100, error_rate=0.01, bits=bytes(bloom.bits))
+    assert "abc" in restored
+    assert "def" not in restored
+
+
+class FakeRedis:
+    def __init__(self):
+        self.bits: dict[str, set[int]] = {}
+        self.counts: dict[str, int] = {}
+        self.results: list = []
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def setbit(self, key, position, value):
+        bits = self.bits.setdefault(key, set())
+        self.results.append(int(position in bits))
+        bits.add(position)
+
+    def execute(self):
+        results, self.results = self.results, []
+        return results
+
+    def incrby(self, key, amount):
+        self.counts[key] = self.counts.get(key, 0) + amount
+        return self.counts[key]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.bits.pop(key, None)
+            self.counts.pop(key, None)
+
+
+def test_remember_counts_new_hashes_and_rotates_past_capacity(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(dedupe_filter, "get_redis", lambda: redis)
+    monkeypatch.setattr(settings, "dedupe_filter_capacity", 10)
+    key = dedupe_filter._key("org", dedupe_filter._new_filter())
+
+    remember("org", [f"hash-{i}" for i in range(6)])
+    remember("org", [f"hash-{i}" for i in range(6)])
+    assert redis.counts[f"{key}:count"] == 6
+
+    remember("org", [f"hash-{i}" for i in range(6, 11)])
+    assert key not in redis.bits
+    assert f"{key}:count" not in redis.counts
+
+
+def test_unseen_confirms_filter_hits_against_finding_keys(db_session, monkeypatch):
+    org_id = str(uuid.uuid4())
+    db_session.add(FindingKey(org_id=org_id, dedupe_hash="stored"))
+    db_session.commit()
+    monkeypatch.setattr(connectors, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+    bloom.add("stored")
+    bloom.add("false-positive")
+    records = [
+        FindingRecord(org_id=org_id, source="demo", matched_entity="a@acme.io", dedupe_hash=dedupe_hash)
+        for dedupe_hash in ("stored", "false-positive", "new")
+    ]
+    assert [record.dedupe_hash for record in connectors._unseen(org_id, bloom, records)] == ["new", "false-positive"]
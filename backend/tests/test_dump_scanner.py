@@ -0,0 +1,80 @@
+import hashlib
+import uuid
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models.organization import Organization
+from app.models.target import Target
+from app.services import connectors
+from app.schemas.connector import ConnectorCreate, ConnectorUpdate
+from app.services.dump_scanner import line_aligned_ranges, resolve_dump_path, scan_file
+from app.services.target_hashes import sync_target_hashes
+
+
+def test_ranges_are_line_aligned_and_cover_file(tmp_path):
+    path = tmp_path / "dump.txt"
+    path.write_bytes(b"".join(f"user{i}@example.com:secret{i}\n".encode() for i in range(1000)))
+    ranges = list(line_aligned_ranges(str(path), 1000))
+    data = path.read_bytes()
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start and data[end - 1:end] == b"\n"
+    assert list(line_aligned_ranges(str(path), 1000, start=len(data))) == []
+
+
+def test_scan_file_reports_byte_offsets_and_resumes(tmp_path):
+    path = tmp_path / "dump.txt"
+    path.write_bytes("café@acme.io:x\nAlice@Acme.io:hunter2\nbob@acme.io\n".encode())
+    patterns = ("alice@acme.io", "café@acme.io")
+    results = list(scan_file(str(path), patterns, chunk_bytes=16, processes=1))
+    hits = [hit for _, batch in results for hit in batch]
+    assert [(hit.value, hit.offset, hit.line) for hit in hits] == [
+        ("café@acme.io", 0, "café@acme.io:x"),
+        ("alice@acme.io", 16, "Alice@Acme.io:hunter2"),
+    ]
+    resumed = list(scan_file(str(path), patterns, start=results[0][0], chunk_bytes=16, processes=1))
+    assert [hit.value for _, batch in resumed for hit in batch] == ["alice@acme.io"]
+
+
+def test_dump_paths_must_resolve_inside_the_dump_root(tmp_path, monkeypatch):
+    root = tmp_path / "dumps"
+    root.mkdir()
+    (root / "combo.txt").write_text("a@acme.io\n")
+    (tmp_path / "secret.txt").write_text("x")
+    (root / "escape.txt").symlink_to(tmp_path / "secret.txt")
+    monkeypatch.setattr(settings, "file_dump_root", str(root))
+
+    assert resolve_dump_path("combo.txt") == str((root / "combo.txt").resolve())
+    assert resolve_dump_path(str(root / "combo.txt")) == str((root / "combo.txt").resolve())
+    for path in ("../secret.txt", str(tmp_path / "secret.txt"), "escape.txt", "/etc/passwd"):
+        with pytest.raises(ValueError):
+            resolve_dump_path(path)
+
+    assert ConnectorCreate(name="dump", connector_type="file_dump", config={"path": "combo.txt"})
+    assert ConnectorCreate(name="feed", connector_type="rss", config={"path": "/etc/passwd"})
+    with pytest.raises(ValidationError):
+        ConnectorCreate(name="dump", connector_type="file_dump", config={"path": "/etc/passwd"})
+    with pytest.raises(ValidationError):
+        ConnectorUpdate(config={"path": "../secret.txt"})
+
+
+def test_file_dump_connector_resolves_hashed_identifiers(db_session, tmp_path, monkeypatch):
+    org = Organization(name=f"org-{uuid.uuid4()}")
+    db_session.add(org)
+    db_session.flush()
+    target = Target(org_id=org.id, target_type="email", value="a@acme.io", metadata={})
+    db_session.add(target)
+    db_session.flush()
+    sync_target_hashes(db_session, target)
+    db_session.commit()
+    monkeypatch.setattr(connectors, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+    monkeypatch.setattr(settings, "file_dump_root", str(tmp_path))
+    digest = hashlib.md5(b"a@acme.io").hexdigest()
+    (tmp_path / "dump.txt").write_text(f"{digest.upper()}:hunter2\nb@acme.io:x\n{hashlib.md5(b'zzz').hexdigest()}:y\n")
+
+    config = {"path": "dump.txt", "org_id": org.id, "processes": 1}
+    records = connectors.FileDumpConnector().fetch([target], config, {}, {})
+    assert [(record.matched_entity, record.metadata["hash_algorithm"], record.metadata["offset"]) for record in records] == [
+        ("a@acme.io", "md5", 0)
+    ]
@@ -0,0 +1,121 @@
+from app.models.target import Target
+from app.services import connectors
+from app.services.connectors import PublicPasteConnector, RssConnector
+from app.services.http_client import HttpClient
+
+ITEM = "<item><guid>{}</guid><title>{}</title><pubDate>{} Jan 2026 10:00:00 GMT</pubDate></item>"
+ENTRY_1 = ITEM.format("entry-1", "dump mentions a@acme.io and b@acme.io", "Mon, 05")
+
+
+def _feed(*items: str) -> bytes:
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>leaks</title>{"".join(items)}</channel></rss>'.encode()
+
+
+FEED = _feed(ENTRY_1)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict | None = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ConditionalSession:
+    etag = True
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.requests: list[dict] = []
+
+    def request(self, method, url, **kwargs):
+        headers = kwargs.get("headers") or {}
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, self.content, {"ETag": '"v1"'} if self.etag else {})
+
+
+class UnconditionalSession(ConditionalSession):
+    etag = False
+
+
+def _targets(*values: str) -> list[Target]:
+    return [Target(id=value, org_id="org-feeds", target_type="email", value=value) for value in values]
+
+
+def _records(connector, targets, state, session, monkeypatch):
+    monkeypatch.setattr(connectors, "HttpClient", lambda: HttpClient(session=session))
+    config = {"url": "https://feeds.example.com/leaks.xml", "org_id": "org-feeds"}
+    return list(connector.iter_fetch(targets, config, {}, state))
+
+
+def _run(connector, targets, state, session, monkeypatch):
+    return [record.matched_entity for record in _records(connector, targets, state, session, monkeypatch)]
+
+
+def test_rss_refetches_unchanged_feed_when_targets_change(monkeypatch):
+    session = ConditionalSession(FEED)
+    state: dict = {}
+    assert _run(RssConnector(), _targets("a@acme.io"), state, session, monkeypatch) == ["a@acme.io"]
+    assert _run(RssConnector(), _targets("a@acme.io"), state, session, monkeypatch) == []
+    assert session.requests[-1]["If-None-Match"] == '"v1"'
+
+    matched = _run(RssConnector(), _targets("a@acme.io", "b@acme.io"), state, session, monkeypatch)
+    assert "If-None-Match" not in session.requests[-1]
+    assert "b@acme.io" in matched
+
+
+def test_paste_skips_scanning_unchanged_body(monkeypatch):
+    session = UnconditionalSession(b"pasted: a@acme.io")
+    state: dict = {}
+    scanned = []
+    scan_chunks = connectors.scan_chunks
+    monkeypatch.setattr(connectors, "scan_chunks", lambda *args, **kwargs: scanned.append(1) or scan_chunks(*args, **kwargs))
+    assert _run(PublicPasteConnector(), _targets("a@acme.io"), state, session, monkeypatch) == ["a@acme.io"]
+    assert _run(PublicPasteConnector(), _targets("a@acme.io"), state, session, monkeypatch) == []
+    assert len(scanned) == 1
+
+    assert _run(PublicPasteConnector(), _targets("a@acme.io", "b@acme.io"), state, session, monkeypatch) == ["a@acme.io"]
+    assert len(scanned) == 2
+
+
+def test_rss_cursor_skips_seen_and_older_entries_until_targets_change(monkeypatch):
+    session = UnconditionalSession(FEED)
+    state: dict = {}
+    assert _run(RssConnector(), _targets("a@acme.io"), state, session, monkeypatch) == ["a@acme.io"]
+    assert state["rss_cursor"]["seen"] == ["entry-1"]
+
+    newer = ITEM.format("entry-2", "second dump with a@acme.io", "Tue, 06")
+    older = ITEM.format("entry-0", "backdated dump with a@acme.io", "Thu, 01")
+    session.content = _feed(newer, ENTRY_1, older)
+    assert _run(RssConnector(), _targets("a@acme.io"), state, session, monkeypatch) == ["a@acme.io"]
+    assert state["rss_cursor"]["seen"] == ["entry-2", "entry-1"]
+    assert _run(RssConnector(), _targets("a@acme.io"), state, session, monkeypatch) == []
+
+    matched = _run(RssConnector(), _targets("a@acme.io", "b@acme.io"), state, session, monkeypatch)
+    assert sorted(matched) == ["a@acme.io", "a@acme.io", "a@acme.io", "b@acme.io"]
+
+
+def test_rss_dedupe_key_is_per_target(monkeypatch):
+    session = UnconditionalSession(FEED)
+    records = _records(RssConnector(), _targets("a@acme.io", "b@acme.io"), {}, session, monkeypatch)
+    assert sorted(record.matched_entity for record in records) == ["a@acme.io", "b@acme.io"]
+    assert len({record.dedupe_hash for record in records}) == 2
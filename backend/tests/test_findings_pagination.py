@@ -0,0 +1,91 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from fastapi import Response
+from app.api.routes.findings import list_findings
+from app.models.finding import Finding
+
+
+def _page(db_session, org_id, **kwargs):
+    response = Response()
+    params = {"severity": None, "source": None, "exposure_type": None, "cursor": None, "limit": 2, "fields": None}
+    params.update(kwargs)
+    rows = list_findings(response, db=db_session, user=None, org_id=org_id, **params)
+    return rows, response.headers.get("X-Next-Cursor")
+
+
+def test_list_findings_keyset_pages_and_projection(db_session):
+    org_id = str(uuid.uuid4())
+    created = datetime(2026, 1, 1)
+    for index in range(5):
+        db_session.add(
+            Finding(
+                org_id=org_id,
+                source="demo",
+                matched_entity=f"user{index}@acme.io",
+                raw_snippet="snippet",
+                dedupe_hash=f"page-{index}",
+                created_at=created + timedelta(minutes=index // 2),
+            )
+        )
+    db_session.commit()
+
+    seen, cursor = [], None
+    while True:
+        rows, cursor = _page(db_session, org_id, cursor=cursor)
+        seen.extend(row.matched_entity for row in rows)
+        if not cursor:
+            break
+    assert sorted(seen) == [f"user{index}@acme.io" for index in range(5)]
+    assert seen[0] == "user4@acme.io"
+
+    projected, cursor = _page(db_session, org_id, fields="matched_entity,severity", limit=10)
+    body = json.loads(projected.body)
+    assert cursor is None
+    assert set(body[0]) == {"id", "matched_entity", "severity"}
+
+
+def test_list_findings_filters_by_exposure_type_severity_and_source(db_session):
+    org_id = str(uuid.uuid4())
+    for index, (source, severity, exposure_types) in enumerate(
+        [
+            ("hibp", "high", ["Passwords", "Email addresses"]),
+            ("hibp", "medium", ["Email addresses"]),
+            ("dehashed", "high", ["password"]),
+            ("rss", "low", ["mention"]),
+        ]
+    ):
+        db_session.add(
+            Finding(
+                org_id=org_id,
+                source=source,
+                severity=severity,
+                exposure_types=exposure_types,
+                matched_entity=f"filter{index}@acme.io",
+                raw_snippet="snippet",
+                dedupe_hash=f"filter-{index}",
+            )
+        )
+    db_session.add(
+        Finding(
+            org_id=str(uuid.uuid4()),
+            source="hibp",
+            severity="high",
+            exposure_types=["Passwords"],
+            matched_entity="other@acme.io",
+            raw_snippet="snippet",
+            dedupe_hash="filter-other-org",
+        )
+    )
+    db_session.commit()
+
+    def matched(**kwargs):
+        rows, _ = _page(db_session, org_id, limit=10, **kwargs)
+        return sorted(row.matched_entity for row in rows)
+
+    assert matched(exposure_type="Email addresses") == ["filter0@acme.io", "filter1@acme.io"]
+    assert matched(exposure_type="Passwords") == ["filter0@acme.io"]
+    assert matched(exposure_type="Pass") == []
+    assert matched(severity="high") == ["filter0@acme.io", "filter2@acme.io"]
+    assert matched(source="hibp") == ["filter0@acme.io", "filter1@acme.io"]
+    assert matched(source="hibp", severity="high", exposure_type="Email addresses") == ["filter0@acme.io"]
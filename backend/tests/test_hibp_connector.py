@@ -0,0 +1,147 @@
+import hashlib
+import pytest
+from app.core.config import settings
+from app.models.target import Target
+from app.services import connectors, upstream_cache
+from app.services.connectors import HIBPConnector
+from app.services.http_client import HttpClient
+
+
+class FakeRedis:
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+
+    def mget(self, keys):
+        return [self.strings.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def set(self, key, value, ex=None):
+        self.strings[key] = value
+
+    def execute(self):
+        return []
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload=None):
+        self.status_code = status_code
+        self.payload = payload
+        self.headers: dict = {}
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        pass
+
+
+class HibpSession:
+    def __init__(self, accounts: dict[str, list[str]], domains: dict[str, dict[str, list[str]]] | None = None):
+        self.accounts = accounts
+        self.domains = domains or {}
+        self.paths: list[str] = []
+
+    def request(self, method, url, **kwargs):
+        kind, _, value = url.rpartition("/api/v3/")[2].partition("/")
+        self.paths.append(f"{kind}/{value}")
+        if kind == "breachedaccount" and value in self.accounts:
+            return FakeResponse(200, [{"Name": name} for name in self.accounts[value]])
+        if kind == "breacheddomain" and value in self.domains:
+            return FakeResponse(200, self.domains[value])
+        if kind == "breach":
+            return FakeResponse(200, {"Name": value, "DataClasses": ["Email addresses", "Passwords"]})
+        return FakeResponse(404)
+
+
+@pytest.fixture()
+def hibp(monkeypatch):
+    def run(session, targets, config=None, secrets=None):
+        monkeypatch.setattr(connectors, "HttpClient", lambda **kwargs: HttpClient(session=session, **kwargs))
+        config = {"requests_per_minute": 0, "concurrency": 1, **(config or {})}
+        return list(HIBPConnector().iter_fetch(targets, config, secrets or {"api_key": "key"}))
+
+    monkeypatch.setattr(connectors, "_load_catalog", lambda source: {})
+    monkeypatch.setattr(connectors, "load_filter", lambda org_id: set())
+    monkeypatch.setattr(connectors, "decrypt_value", lambda value: value)
+    return run
+
+
+def _target(org_id: str, target_type: str, value: str) -> Target:
+    return Target(id=f"{org_id}-{value}", org_id=org_id, target_type=target_type, value=value)
+
+
+def test_upstream_cache_shares_lookups_across_orgs(hibp, monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(upstream_cache, "get_redis", lambda: redis)
+    monkeypatch.setattr(settings, "upstream_cache_ttl_seconds", 60)
+    session = HibpSession({"ceo@acme.io": ["Adobe"]})
+
+    first = hibp(session, [_target("org-a", "email", "ceo@acme.io")])
+    second = hibp(session, [_target("org-b", "email", "CEO@acme.io")])
+
+    assert session.paths.count("breachedaccount/ceo@acme.io") == 1
+    assert "breachedaccount/CEO@acme.io" not in session.paths
+    assert [(record.org_id, record.metadata["breach"]) for record in first + second] == [
+        ("org-a", "Adobe"),
+        ("org-b", "Adobe"),
+    ]
+
+
+def test_domain_search_fans_out_to_aliases_and_streams_per_lookup(hibp, monkeypatch):
+    session = HibpSession(
+        {"other@beta.io": ["Dropbox"]},
+        {"acme.io": {"ceo": ["Adobe"], "intern": ["LinkedIn", "Adobe"]}},
+    )
+    targets = [
+        _target("org-a", "domain", "acme.io"),
+        _target("org-a", "email", "ceo@acme.io"),
+        _target("org-a", "email", "other@beta.io"),
+    ]
+    monkeypatch.setattr(connectors, "HttpClient", lambda **kwargs: HttpClient(session=session, **kwargs))
+    config = {"requests_per_minute": 0, "concurrency": 1, "verified_domains": ["ACME.io"]}
+    records = HIBPConnector().iter_fetch(targets, config, {"api_key": "key"})
+
+    first = next(records)
+    assert (first.matched_entity, first.metadata["breach"]) == ("ceo@acme.io", "Adobe")
+    assert not any(path.startswith("breachedaccount/") for path in session.paths)
+
+    rest = list(records)
+    assert [(record.matched_entity, record.metadata["breach"]) for record in rest] == [
+        ("intern@acme.io", "LinkedIn"),
+        ("intern@acme.io", "Adobe"),
+        ("other@beta.io", "Dropbox"),
+    ]
+    assert rest[0].exposure_types == ["Email addresses", "Passwords"]
+    assert session.paths.count("breacheddomain/acme.io") == 1
+    assert [path for path in session.paths if path.startswith("breachedaccount/")] == ["breachedaccount/other@beta.io"]
+
+
+def test_probable_repeats_are_confirmed_in_one_batch_across_lookups(hibp, monkeypatch):
+    session = HibpSession({f"user{index}@acme.io": ["Adobe"] for index in range(5)} | {"new@acme.io": ["Canva"]})
+    targets = [_target("org-a", "email", "new@acme.io")] + [
+        _target("org-a", "email", f"user{index}@acme.io") for index in range(5)
+    ]
+    queries = []
+
+    def stored_hashes(db, org_id, hashes):
+        queries.append(list(hashes))
+        return set(hashes[1:])
+
+    class Closing:
+        def close(self):
+            pass
+
+    known = {hashlib.sha256(f"hibp-user{index}@acme.io-Adobe".encode()).hexdigest() for index in range(5)}
+    monkeypatch.setattr(connectors, "load_filter", lambda org_id: known)
+    monkeypatch.setattr(connectors, "stored_hashes", stored_hashes)
+    monkeypatch.setattr(connectors, "SessionLocal", Closing)
+    monkeypatch.setattr(connectors, "HttpClient", lambda **kwargs: HttpClient(session=session, **kwargs))
+    config = {"requests_per_minute": 0, "concurrency": 1, "org_id": "org-a"}
+    records = HIBPConnector().iter_fetch(targets, config, {"api_key": "key"})
+
+    assert next(records).matched_entity == "new@acme.io"
+    assert session.paths == ["breachedaccount/new@acme.io", "breach/Canva"]
+    assert [record.matched_entity for record in records] == ["user0@acme.io"]
+    assert len(queries) == 1 and len(queries[0]) == 5
@@ -0,0 +1,110 @@
+import time
+from redis.exceptions import ConnectionError as RedisConnectionError
+from app.services import http_client
+from app.services.http_client import HttpClient, SharedTokenBucket, TokenBucket, parse_retry_after
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None, content: bytes = b""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, responses: list[FakeResponse]):
+        self.responses = responses
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.last_headers = kwargs.get("headers")
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        return response
+
+
+def test_parse_retry_after_seconds_and_default():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None, default=1.5) == 1.5
+    assert parse_retry_after("not-a-date", default=2.0) == 2.0
+
+
+def test_token_bucket_pause_blocks_until_retry_after():
+    bucket = TokenBucket(rate_per_second=1000)
+    bucket.pause(0.05)
+    started = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.04
+
+
+def test_client_retries_429_with_retry_after():
+    throttled = FakeResponse(429, {"Retry-After": "0"})
+    session = FakeSession([throttled, FakeResponse(200)])
+    client = HttpClient(requests_per_minute=60000, scope="test-retry", session=session)
+    response = client.get("https://api.example.com/resource")
+    assert response.status_code == 200
+    assert session.calls == 2
+    assert throttled.closed and not response.closed
+
+
+def test_client_map_preserves_order():
+    client = HttpClient(concurrency=4, session=FakeSession([FakeResponse(200)]))
+    assert list(client.map(lambda x: x * 2, range(10))) == [x * 2 for x in range(10)]
+
+
+def test_conditional_get_sends_validators_and_skips_unchanged_content():
+    validators: dict = {}
+    session = FakeSession([FakeResponse(200, {"ETag": '"v1"'}, b"feed")])
+    client = HttpClient(session=session)
+    assert client.conditional_get("https://feeds.example.com/rss", validators) is not None
+    assert validators["etag"] == '"v1"'
+
+    assert client.conditional_get("https://feeds.example.com/rss", validators) is None
+    assert session.last_headers["If-None-Match"] == '"v1"'
+
+    session.responses = [FakeResponse(304)]
+    assert client.conditional_get("https://feeds.example.com/rss", validators) is None
+
+
+def test_shared_bucket_falls_back_to_process_bucket_without_redis(monkeypatch):
+    def unavailable():
+        raise RedisConnectionError("down")
+
+    monkeypatch.setattr(http_client, "get_redis", unavailable)
+    monkeypatch.setattr(http_client, "_redis_retry_at", 0.0)
+    bucket = SharedTokenBucket("api.example.com:fallback", rate_per_second=1000)
+    bucket.pause(0.05)
+    started = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.04
+    assert bucket.local is http_client.get_bucket("api.example.com:fallback", 1000)
+
+
+def test_shared_bucket_warns_once_and_backs_off_while_redis_is_down(monkeypatch, caplog):
+    calls = []
+
+    def unavailable():
+        calls.append(1)
+        raise RedisConnectionError("down")
+
+    monkeypatch.setattr(http_client, "get_redis", unavailable)
+    monkeypatch.setattr(http_client, "_redis_down", False)
+    monkeypatch.setattr(http_client, "_redis_retry_at", 0.0)
+    buckets = [SharedTokenBucket(f"api{index}.example.com:outage", rate_per_second=1000) for index in range(2)]
+    with caplog.at_level("WARNING", logger=http_client.__name__):
+        for bucket in buckets * 5:
+            bucket.acquire()
+        assert len(calls) == 1
+        assert len(caplog.records) == 1
+
+        monkeypatch.setattr(http_client, "_redis_retry_at", 0.0)
+        buckets[0].acquire()
+        assert len(calls) == 2
+        assert len(caplog.records) == 1
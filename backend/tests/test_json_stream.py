@@ -0,0 +1,30 @@
+import json
+from app.services.json_stream import JsonArrayStream, compile_path
+
+
+def _chunked(text: str, size: int) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_stream_yields_items_and_collects_other_fields():
+    payload = {
+        "total": 12345,
+        "findings": [{"matched_entity": "a@acme.io", "confidence": 90}, {"matched_entity": "b@acme.io"}],
+        "next_cursor": "abc",
+    }
+    text = json.dumps(payload, indent=2)
+    for size in (1, 3, 7, len(text)):
+        stream = JsonArrayStream(_chunked(text, size), "findings")
+        assert list(stream) == payload["findings"]
+        assert stream.fields == {"total": 12345, "next_cursor": "abc"}
+
+
+def test_stream_handles_bare_arrays_and_empty_lists():
+    assert list(JsonArrayStream(_chunked("[1, 22, 333]", 2), None)) == [1, 22, 333]
+    assert list(JsonArrayStream(['{"findings": []}'])) == []
+
+
+def test_compile_path_reads_nested_fields():
+    getter = compile_path("data.email")
+    assert getter({"data": {"email": "a@acme.io"}}) == "a@acme.io"
+    assert getter({"data": "flat"}) is None
@@ -0,0 +1,54 @@
+from app.core.config import settings
+from app.models.target import Target
+from app.services import matcher as matcher_module
+from app.services.matcher import TargetMatcher, compile_targets, scan_chunks
+
+
+def test_matcher_reports_offsets_case_insensitively():
+    matcher = TargetMatcher(["acme.io", "Security@Acme.io"])
+    content = "dump: SECURITY@ACME.IO leaked"
+    matches = sorted(matcher.iter_matches(content))
+    assert [(m.value, content[m.start:m.end]) for m in matches] == [
+        ("security@acme.io", "SECURITY@ACME.IO"),
+        ("acme.io", "ACME.IO"),
+    ]
+
+
+def test_matcher_finds_overlapping_patterns_via_failure_links():
+    matcher = TargetMatcher(["he", "she", "his", "hers"])
+    found = {(m.value, m.start) for m in matcher.iter_matches("ushers")}
+    assert found == {("she", 1), ("he", 2), ("hers", 2)}
+
+
+def test_first_matches_keeps_earliest_offset():
+    matcher = TargetMatcher(["acme"])
+    assert matcher.first_matches("acme and acme")["acme"].start == 0
+    assert matcher.first_matches("nothing here") == {}
+
+
+def test_scan_chunks_matches_across_chunk_boundaries_with_context():
+    matcher = TargetMatcher(["security@acme.io"])
+    text = "x" * 50 + "SECURITY@ACME.IO" + "y" * 50
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+    results = list(scan_chunks(matcher, chunks, context=10))
+    assert len(results) == 1
+    match, snippet = results[0]
+    assert (match.start, match.end) == (50, 66)
+    assert snippet == "x" * 10 + "SECURITY@ACME.IO" + "y" * 10
+
+
+def test_compiled_matchers_are_cached_per_org_within_a_character_budget(monkeypatch):
+    monkeypatch.setattr(matcher_module, "_compiled", matcher_module.OrderedDict())
+    monkeypatch.setattr(settings, "matcher_cache_max_chars", 40)
+
+    def targets(org_id, *values):
+        return [Target(org_id=org_id, target_type="email", value=value) for value in values]
+
+    first, _ = compile_targets(targets("org-a", "a@acme.io"))
+    assert compile_targets(targets("org-a", "A@acme.io"))[0] is first
+    changed, _ = compile_targets(targets("org-a", "a@acme.io", "b@acme.io"))
+    assert changed is not first
+    assert list(matcher_module._compiled) == ["org-a"]
+
+    compile_targets(targets("org-b", "someone@example.com", "other@example.com"))
+    assert list(matcher_module._compiled) == ["org-b"]
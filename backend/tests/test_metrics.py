@@ -0,0 +1,45 @@
+import uuid
+from collections import Counter
+from datetime import date
+from types import SimpleNamespace
+from app.services.metrics import CONNECTORS, FINDINGS, ROLLUP_KEY, apply_increments, rebuild_rollups, record_change, summarize
+from app.services.records import FindingRecord
+from app.workers.tasks import _store_findings
+
+
+def test_rollups_track_inserts_and_match_rebuild(db_session):
+    org_id = str(uuid.uuid4())
+    records = [
+        FindingRecord(org_id=org_id, source="hibp", matched_entity="a@acme.io", dedupe_hash="m1", severity="high"),
+        FindingRecord(org_id=org_id, source="hibp", matched_entity="b@acme.io", dedupe_hash="m2", severity="high"),
+        FindingRecord(org_id=org_id, source="rss", matched_entity="acme.io", dedupe_hash="m3"),
+    ]
+    _store_findings(db_session, records)
+    _store_findings(db_session, records[:1])
+    record_change(db_session, org_id, CONNECTORS, 1)
+    db_session.commit()
+
+    summary = summarize(db_session, org_id, days=7)
+    assert summary["findings"] == 3
+    assert summary["connectors"] == 1
+    assert summary["by_severity"] == {"high": 2, "low": 1}
+    assert summary["by_source"] == {"hibp": 2, "rss": 1}
+    assert sum(point["findings"] for point in summary["series"]) == 3
+
+    rebuild_rollups(db_session, org_id)
+    rebuilt = summarize(db_session, org_id, days=7)
+    assert {key: rebuilt[key] for key in ("findings", "by_severity", "by_source")} == {
+        key: summary[key] for key in ("findings", "by_severity", "by_source")
+    }
+
+
+def test_apply_increments_upserts_rows_in_key_order():
+    executed = []
+    db = SimpleNamespace(
+        get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="postgresql")),
+        execute=lambda statement, rows: executed.extend(rows),
+    )
+    day = date(2026, 1, 1)
+    keys = [("org-b", FINDINGS, day, "high", "rss"), ("org-a", FINDINGS, day, "low", "hibp"), ("org-a", FINDINGS, day, "high", "rss")]
+    apply_increments(db, Counter({key: 1 for key in keys}))
+    assert [tuple(row[column] for column in ROLLUP_KEY) for row in executed] == sorted(keys)
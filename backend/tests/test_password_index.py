@@ -0,0 +1,19 @@
+import hashlib
+from app.services.password_index import PasswordIndex, build_index
+
+
+def test_build_index_and_lookup(tmp_path):
+    digests = {hashlib.sha1(f"password{i}".encode()).hexdigest().upper(): i + 1 for i in range(500)}
+    lines = [f"{digest}:{count}\n" for digest, count in digests.items()] + ["not-a-hash\n"]
+    path = str(tmp_path / "pwned.idx")
+    assert build_index(lines, path, "sha1", run_records=64) == 500
+
+    index = PasswordIndex(path)
+    try:
+        assert index.hash_type == "sha1"
+        for digest, count in digests.items():
+            assert index.lookup_hex(digest) == count
+        assert index.lookup_hex(hashlib.sha1(b"missing").hexdigest()) is None
+        assert index.lookup_hex("zz") is None
+    finally:
+        index.close()
@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from app.core.config import settings
+from app.models.finding import Finding
+from app.models.finding_key import FindingKey
+from app.models.organization import Organization
+from app.services.metrics import rebuild_rollups, summarize
+from app.services.records import FindingRecord
+from app.services.retention import enforce_retention
+from app.workers.tasks import _store_findings
+
+
+def test_retention_purges_expired_findings_per_org(db_session):
+    short = Organization(name=f"short-{uuid.uuid4()}", retention_days=30)
+    forever = Organization(name=f"forever-{uuid.uuid4()}", retention_days=0)
+    db_session.add_all([short, forever])
+    db_session.commit()
+    for org in (short, forever):
+        _store_findings(
+            db_session,
+            [
+                FindingRecord(org_id=org.id, source="rss", matched_entity="acme.io", dedupe_hash=f"{org.id}-{index}")
+                for index in range(3)
+            ],
+        )
+    old = datetime.now(timezone.utc) - timedelta(days=90)
+    db_session.query(Finding).filter(Finding.dedupe_hash.in_([f"{org.id}-0" for org in (short, forever)])).update(
+        {Finding.created_at: old}, synchronize_session=False
+    )
+    db_session.commit()
+    for org in (short, forever):
+        rebuild_rollups(db_session, org.id)
+
+    result = enforce_retention(db_session)
+
+    assert result == {"dropped_partitions": [], "purged": {short.id: 1}, "pruned_keys": {}}
+    assert db_session.query(Finding).filter(Finding.org_id == short.id).count() == 2
+    assert db_session.query(Finding).filter(Finding.org_id == forever.id).count() == 3
+    assert db_session.query(FindingKey).filter(FindingKey.org_id == short.id).count() == 3
+    assert summarize(db_session, short.id, days=7)["findings"] == 2
+    # The source still reporting the purged exposure must not store it again.
+    assert _store_findings(
+        db_session,
+        [FindingRecord(org_id=short.id, source="rss", matched_entity="acme.io", dedupe_hash=f"{short.id}-{index}") for index in range(2)],
+    ) == 0
+
+
+def test_finding_keys_are_pruned_only_past_the_key_horizon(db_session, monkeypatch):
+    short = Organization(name=f"short-{uuid.uuid4()}", retention_days=30)
+    forever = Organization(name=f"forever-{uuid.uuid4()}", retention_days=0)
+    db_session.add_all([short, forever])
+    db_session.commit()
+    now = datetime.now(timezone.utc)
+    for org in (short, forever):
+        db_session.add_all(
+            FindingKey(org_id=org.id, dedupe_hash=f"{org.id}-{age}", created_at=now - timedelta(days=age)) for age in (60, 400)
+        )
+    db_session.commit()
+
+    assert enforce_retention(db_session, now)["pruned_keys"] == {}
+    monkeypatch.setattr(settings, "finding_key_retention_days", 365)
+    assert enforce_retention(db_session, now)["pruned_keys"] == {short.id: 1}
+    assert [key.dedupe_hash for key in db_session.query(FindingKey).filter(FindingKey.org_id == short.id)] == [f"{short.id}-60"]
+    assert db_session.query(FindingKey).filter(FindingKey.org_id == forever.id).count() == 2
@@ -0,0 +1,95 @@
+import uuid
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models.connector import Connector
+from app.models.target import Target
+from app.services import connectors
+from app.services.dump_scanner import line_aligned_ranges
+from app.workers import tasks
+
+
+class FakeLock:
+    def __init__(self, acquired: bool):
+        self.acquired = acquired
+        self.released = False
+        self.reacquired = 0
+
+    def acquire(self, blocking=True):
+        return self.acquired
+
+    def reacquire(self):
+        self.reacquired += 1
+
+    def release(self):
+        self.released = True
+
+
+class FakeRedis:
+    def __init__(self, acquired: bool):
+        self.locks: dict[str, FakeLock] = {}
+        self.acquired = acquired
+
+    def lock(self, name, timeout=None):
+        return self.locks.setdefault(name, FakeLock(self.acquired))
+
+
+def test_run_connector_skips_when_lock_is_held(monkeypatch):
+    redis = FakeRedis(acquired=False)
+    monkeypatch.setattr(tasks, "get_redis", lambda: redis)
+    monkeypatch.setattr(tasks, "SessionLocal", lambda: (_ for _ in ()).throw(AssertionError("no db access")))
+    assert tasks.run_connector("busy") == ("busy", "skipped")
+    assert not redis.locks["connector-lock:busy"].released
+
+
+def test_run_connector_runs_under_lock_and_releases_it(db_session, monkeypatch):
+    redis = FakeRedis(acquired=True)
+    monkeypatch.setattr(tasks, "get_redis", lambda: redis)
+    monkeypatch.setattr(tasks, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+    connector = Connector(org_id=str(uuid.uuid4()), name="demo", connector_type="demo", config={}, secrets={})
+    db_session.add(connector)
+    db_session.commit()
+    assert tasks.run_connector(connector.id) == (connector.id, 0)
+    assert redis.locks[f"connector-lock:{connector.id}"].released
+    db_session.refresh(connector)
+    assert connector.last_run_status == "stored:0"
+
+
+def test_file_dump_run_without_hits_saves_progress_and_resumes(db_session, tmp_path, monkeypatch):
+    redis = FakeRedis(acquired=True)
+    session_factory = sessionmaker(bind=db_session.get_bind())
+    monkeypatch.setattr(tasks, "get_redis", lambda: redis)
+    monkeypatch.setattr(tasks, "SessionLocal", session_factory)
+    monkeypatch.setattr(connectors, "SessionLocal", session_factory)
+    monkeypatch.setattr(settings, "file_dump_root", str(tmp_path))
+    path = tmp_path / "dump.txt"
+    path.write_bytes(b"".join(f"user{i}@example.com:secret\n".encode() for i in range(100)))
+    org_id = str(uuid.uuid4())
+    config = {"path": "dump.txt", "processes": 1, "chunk_bytes": 256, "hash_tokens": False}
+    connector = Connector(org_id=org_id, name="dump", connector_type="file_dump", config=config, secrets={})
+    db_session.add_all([connector, Target(org_id=org_id, target_type="email", value="nobody@acme.io", metadata={})])
+    db_session.commit()
+
+    starts = []
+    scan_file = connectors.scan_file
+
+    def interrupted(path, patterns, start=0, **kwargs):
+        starts.append(start)
+        for count, result in enumerate(scan_file(path, patterns, start=start, **kwargs)):
+            if len(starts) == 1 and count == 2:
+                raise OSError("worker lost")
+            yield result
+
+    monkeypatch.setattr(connectors, "scan_file", interrupted)
+    assert tasks.run_connector(connector.id) == (connector.id, "error")
+    assert redis.locks[f"connector-lock:{connector.id}"].reacquired == 2
+
+    assert tasks.run_connector(connector.id) == (connector.id, 0)
+    ranges = list(line_aligned_ranges(str(path), 256))
+    assert starts == [0, ranges[1][1]]
+    db_session.refresh(connector)
+    assert connector.state["file_dump"]["offset"] == path.stat().st_size
+
+
+def test_collect_connector_results_maps_chord_results():
+    results = [("a", 3), ("b", "skipped"), ("c", "error")]
+    assert tasks.collect_connector_results(results) == {"a": 3, "b": "skipped", "c": "error"}
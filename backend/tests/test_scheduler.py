@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+from app.services.scheduler import claim_due, sync_schedule
+
+
+class FakeSortedSet:
+    def __init__(self):
+        self.scores: dict[str, float] = {}
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+    def zrange(self, key, start, end):
+        return sorted(self.scores, key=self.scores.get)
+
+    def zrangebyscore(self, key, low, high, start=0, num=None):
+        return [member for member in self.zrange(key, 0, -1) if self.scores[member] <= high][start:start + num]
+
+    def zadd(self, key, mapping, nx=False, xx=False):
+        for member, score in mapping.items():
+            if (nx and member in self.scores) or (xx and member not in self.scores):
+                continue
+            self.scores[member] = score
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.scores.pop(member, None)
+
+
+def test_scheduler_dispatches_only_due_connectors_and_reschedules():
+    redis = FakeSortedSet()
+    connectors = [SimpleNamespace(id="rss", interval_seconds=300), SimpleNamespace(id="hibp", interval_seconds=86400)]
+    sync_schedule(redis, connectors, now=0)
+    assert 0 <= redis.scores["rss"] <= 300 and 0 <= redis.scores["hibp"] <= 86400
+
+    redis.scores["hibp"] = 50000
+    intervals = {"rss": 300, "hibp": 86400}
+    assert claim_due(redis, intervals, now=300) == ["rss"]
+    assert 300 + 270 <= redis.scores["rss"] <= 300 + 330
+    assert "rss" not in claim_due(redis, intervals, now=301)
+
+    sync_schedule(redis, connectors[1:], now=301)
+    assert "rss" not in redis.scores
@@ -0,0 +1,13 @@
+from app.services.source_catalog import load_breach_catalog, source_record_id, sync_breach_catalog
+
+
+def test_sync_breach_catalog_tracks_changed_payloads(db_session):
+    adobe = {"Name": "Adobe", "DataClasses": ["Email addresses", "Passwords"]}
+    assert sync_breach_catalog(db_session, "hibp-test", [adobe, {"Name": "Gawker"}]) == 2
+    assert sync_breach_catalog(db_session, "hibp-test", [adobe]) == 0
+
+    updated = {**adobe, "PwnCount": 152445165}
+    assert sync_breach_catalog(db_session, "hibp-test", [updated]) == 1
+    catalog = load_breach_catalog(db_session, "hibp-test")
+    assert catalog["Adobe"] == (source_record_id("hibp-test", updated), updated)
+    assert set(catalog) == {"Adobe", "Gawker"}
@@ -0,0 +1,63 @@
+import uuid
+from app.models.finding import Finding
+from app.models.source_record import SourceRecord
+from app.services.records import FindingRecord
+from app.services.source_catalog import source_record_id
+from app.workers.tasks import _store_findings
+
+
+def _finding(org_id: str, dedupe_hash: str) -> Finding:
+    return Finding(
+        org_id=org_id,
+        source="demo",
+        matched_entity="security@acme.io",
+        exposure_types=["email"],
+        raw_snippet="snippet",
+        severity="medium",
+        dedupe_hash=dedupe_hash,
+        metadata={"note": "demo"},
+    )
+
+
+def test_store_findings_returns_exact_inserted_counts(db_session):
+    org_a = str(uuid.uuid4())
+    batch = [_finding(org_a, "h1"), _finding(org_a, "h2"), _finding(org_a, "h1")]
+    assert _store_findings(db_session, batch) == 2
+    assert _store_findings(db_session, [_finding(org_a, "h1"), _finding(org_a, "h3")]) == 1
+    assert db_session.query(Finding).filter(Finding.org_id == org_a).count() == 3
+
+
+def test_store_findings_dedupes_per_org(db_session):
+    org_a, org_b = str(uuid.uuid4()), str(uuid.uuid4())
+    assert _store_findings(db_session, [_finding(org_a, "shared")]) == 1
+    assert _store_findings(db_session, [_finding(org_b, "shared")]) == 1
+
+
+def test_store_findings_accepts_slotted_records(db_session):
+    org_id = str(uuid.uuid4())
+    record = FindingRecord(org_id=org_id, source="demo", matched_entity="a@acme.io", dedupe_hash="r1")
+    assert _store_findings(db_session, [record, _finding(org_id, "r1")]) == 1
+    stored = db_session.query(Finding).filter(Finding.org_id == org_id).one()
+    assert stored.confidence == 50
+    assert stored.severity == "low"
+
+
+def test_store_findings_shares_source_records_across_findings(db_session):
+    org_a, org_b = str(uuid.uuid4()), str(uuid.uuid4())
+    payload = {"Name": "Adobe", "Description": "x" * 2048}
+    record_id = source_record_id("hibp", payload)
+    records = [
+        FindingRecord(
+            org_id=org_id,
+            source="hibp",
+            matched_entity="a@acme.io",
+            dedupe_hash=f"hibp-{org_id}",
+            metadata={"breach": "Adobe"},
+            source_record_id=record_id,
+            source_payload=payload,
+        )
+        for org_id in (org_a, org_b)
+    ]
+    assert _store_findings(db_session, records) == 2
+    assert _store_findings(db_session, [records[0]]) == 0
+    assert db_session.query(SourceRecord).filter(SourceRecord.id == record_id).one().payload == payload
@@ -0,0 +1,66 @@
+import hashlib
+import uuid
+from types import SimpleNamespace
+from app.api.routes.targets import update_target
+from app.models.organization import Organization
+from app.models.target import Target
+from app.schemas.target import TargetUpdate
+from app.services.target_hashes import HashTokenScanner, org_digests, resolve_hashes, sync_target_hashes, target_digests
+
+
+def test_target_digests_cover_algorithms_and_normalizations():
+    digests = target_digests(Target(org_id="org", target_type="email", value="John.Doe+news@GMail.com"))
+    assert digests[hashlib.md5(b"john.doe+news@gmail.com").hexdigest()] == ("md5", "lower")
+    assert digests[hashlib.sha256(b"johndoe@gmail.com").hexdigest()] == ("sha256", "gmail_canonical")
+    assert digests[hashlib.sha1(b"john.doe@gmail.com").hexdigest()] == ("sha1", "no_plus_tag")
+
+
+def test_credential_targets_are_not_indexed():
+    assert target_digests(Target(org_id="org", target_type="password_sha1", value="5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8")) == {}
+
+
+def test_hash_token_scanner_handles_tokens_split_across_chunks():
+    digest = hashlib.sha256(b"a@acme.io").hexdigest()
+    text = f"dump line {digest.upper()} end " + hashlib.md5(b"x").hexdigest()
+    loads = []
+    scanner = HashTokenScanner(lambda: loads.append(1) or {digest}, context=10)
+    assert "".join(scanner.watch([text[:30], text[30:50], text[50:]])) == text
+    assert list(scanner.tokens) == [digest]
+    assert len(loads) == 1
+
+
+def test_sync_and_resolve_target_hashes(db_session):
+    org = Organization(name=f"org-{uuid.uuid4()}")
+    db_session.add(org)
+    db_session.flush()
+    target = Target(org_id=org.id, target_type="email", value="a@acme.io", metadata={})
+    db_session.add(target)
+    db_session.flush()
+    sync_target_hashes(db_session, target)
+    db_session.commit()
+    digest = hashlib.sha1(b"a@acme.io").hexdigest()
+    assert [row.target_id for row in resolve_hashes(db_session, org.id, [digest.upper()])[digest]] == [target.id]
+    assert digest in org_digests(db_session, org.id)
+
+    target.value = "b@acme.io"
+    sync_target_hashes(db_session, target)
+    db_session.commit()
+    assert resolve_hashes(db_session, org.id, [digest]) == {}
+
+
+def test_changing_target_type_resyncs_hashes(db_session):
+    org = Organization(name=f"org-{uuid.uuid4()}")
+    db_session.add(org)
+    db_session.flush()
+    target = Target(org_id=org.id, target_type="email", value="a@acme.io", metadata={})
+    db_session.add(target)
+    db_session.flush()
+    sync_target_hashes(db_session, target)
+    db_session.commit()
+    user = SimpleNamespace(id=None)
+    assert org_digests(db_session, org.id)
+
+    update_target(target.id, TargetUpdate(target_type="password_sha1"), db=db_session, user=user, org_id=org.id)
+    assert org_digests(db_session, org.id) == set()
+    update_target(target.id, TargetUpdate(target_type="email"), db=db_session, user=user, org_id=org.id)
+    assert hashlib.md5(b"a@acme.io").hexdigest() in org_digests(db_session, org.id)
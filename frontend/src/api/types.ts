@@ -4,6 +4,9 @@ export interface MetricsSummary {
   findings: number;
   connectors: number;
   alert_rules: number;
+  by_severity?: Record<string, number>;
+  by_source?: Record<string, number>;
+  series?: { day: string; findings: number }[];
 }
 
 export interface Finding {
@@ -62,6 +65,7 @@ export interface Organization {
   id: string;
   name: string;
   is_active: boolean;
+  retention_days?: number | null;
 }
 
 export interface User {